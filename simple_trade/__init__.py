@@ -1,6 +1,14 @@
 # Import from data module
 from .compute_indicators import download_data, compute_indicator, list_indicators
 from .core import INDICATORS
+from .indicator_bank import compute_indicator_bank
+from .panel import compute_panel_indicator
+from .indicator_cache import (
+    enable_indicator_cache,
+    disable_indicator_cache,
+    clear_indicator_cache,
+    indicator_cache_info
+)
 
 # Import all indicators from core
 from .core import (
@@ -29,6 +37,12 @@ from .core import (
     pvo, vfi, voo, vpt, vro, vwa
 )
 
+# Import streaming indicator states
+from .moving_average import SMAState, EMAState, WMAState, HMAState, TEMState, AMAState
+from .momentum import (
+    RSIState, STOState, MACState, CCIState, ROCState, WILState, TSIState, PPOState, ULTState
+)
+
 # Import configuration
 from .config import BacktestConfig, get_default_config
 
@@ -36,6 +50,7 @@ from .config import BacktestConfig, get_default_config
 from .metrics import (
     compute_benchmark_return,
     calculate_performance_metrics,
+    calculate_performance_metrics_batch,
     print_results,
     count_trades
 )
@@ -44,6 +59,7 @@ from .metrics import (
 from .run_band_trade_strategies import run_band_trade
 from .run_cross_trade_strategies import run_cross_trade
 from .run_combined_trade_strategies import run_combined_trade, plot_combined_results
+from .run_batch_trade_strategies import run_band_trade_batch, run_cross_trade_batch
 from .optimize_custom_strategies import custom_optimizer, get_top_results, results_to_dataframe
 from .optimize_premade_strategies import premade_optimizer
 
@@ -64,6 +80,7 @@ __all__ = [
 
     # Metrics functions
     "calculate_performance_metrics",
+    "calculate_performance_metrics_batch",
     "compute_benchmark_return",
     "count_trades",
     "print_results",
@@ -74,8 +91,10 @@ __all__ = [
     "premade_optimizer",
     "results_to_dataframe",
     "run_band_trade",
+    "run_band_trade_batch",
     "run_combined_trade",
     "run_cross_trade",
+    "run_cross_trade_batch",
 
     # Plotting functions
     "plot_backtest_results",
@@ -96,11 +115,21 @@ __all__ = [
     "plot_trendlines",
 
     # Data functions
-    "compute_indicator", "download_data", "list_indicators",
+    "compute_indicator", "compute_indicator_bank", "compute_panel_indicator", "download_data",
+    "list_indicators",
 
     # Indicators dictionary
     "INDICATORS",
 
+    # Indicator cache
+    "clear_indicator_cache", "disable_indicator_cache",
+    "enable_indicator_cache", "indicator_cache_info",
+
+    # Streaming indicator states
+    "SMAState", "EMAState", "WMAState", "HMAState", "TEMState", "AMAState",
+    "RSIState", "STOState", "MACState", "CCIState", "ROCState", "WILState", "TSIState", "PPOState",
+    "ULTState",
+
     # Moving Average indicators
     "ads", "alm", "ama", "dem", "ema", "fma", "gma", "hma", "jma", "lsm", "sma",
     "soa", "swm", "tem", "tma", "vid", "vma", "wma", "zma", "tt3", "mam", "evw", "tsf",
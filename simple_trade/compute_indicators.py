@@ -4,6 +4,8 @@ Main indicator handling module that coordinates the calculation of various techn
 import yfinance as yf
 import pandas as pd
 from .core import INDICATORS
+from .indicator_cache import get_indicator_cache
+from .panel import compute_panel_indicator, is_panel
 from simple_trade.plot_ind import plot_indicator
 from typing import Literal, Optional, Tuple
 
@@ -30,6 +32,12 @@ def compute_indicator(
     Returns:
         pandas.DataFrame: Original DataFrame with the calculated indicator column(s) added.
 
+    Panel mode:
+        If `data` holds several symbols, either wide with (field, symbol) MultiIndex
+        columns or long with a (date, symbol) row MultiIndex, the indicator is
+        computed for all symbols at once by `compute_panel_indicator` and the panel
+        is returned with the indicator added. No figure is drawn in panel mode.
+
     Raises:
         ValueError: If the indicator is not supported or the required columns are missing.
     """
@@ -37,6 +45,10 @@ def compute_indicator(
     if indicator not in INDICATORS:
         raise ValueError(f"Indicator '{indicator}' not supported. Available: {list(INDICATORS.keys())}")
 
+    if is_panel(data):
+        df, columns = compute_panel_indicator(data, indicator, **indicator_kwargs)
+        return df, columns, None
+
     # Create a copy to avoid modifying the original DataFrame
     df = data.copy()
     indicator_func = INDICATORS[indicator]
@@ -44,7 +56,15 @@ def compute_indicator(
 
     try:
         # Delegate to specific handler based on indicator type
-        indicator_result, columns = _calculate_indicator(df, indicator_func, **indicator_kwargs)
+        cache = get_indicator_cache()
+        cache_key = cache.make_key(indicator, df, indicator_kwargs) if cache is not None else None
+        cached = cache.get(cache_key) if cache_key is not None else None
+        if cached is not None:
+            indicator_result, columns = cached
+        else:
+            indicator_result, columns = _calculate_indicator(df, indicator_func, **indicator_kwargs)
+            if cache_key is not None:
+                cache.put(cache_key, indicator_result, columns)
         
         # Add the result to the original DataFrame
         df = _add_indicator_to_dataframe(df, indicator_result, indicator_kwargs)
@@ -0,0 +1,184 @@
+"""
+Computes one indicator for many window lengths at once.
+
+Parameter sweeps call the same indicator for every window in a range, repeating
+the work that does not depend on the window. A bank computes that work once and
+derives all windows from it:
+
+- SMA: one cumulative sum of the prices serves every window as a difference of
+  two cumulative sums.
+- RSI: one price diff is split into gains and losses, whose cumulative sums serve
+  every window.
+- EMA and ATR: the recursions of all windows advance together, one vectorized
+  step per bar. ATR computes the true range once.
+
+The result is a DataFrame with one column per window, named like the columns of
+the single-window indicator (e.g. SMA_5, SMA_6, ...). EMA, ATR and STD match the
+single-window indicators exactly; STD runs the pandas rolling computation per
+window, since a variance taken from cumulative sums of squares loses precision
+once prices trend. The cumulative-sum banks (SMA, RSI) can differ from the pandas
+rolling results in the last few digits.
+"""
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+from .kernels import wilder_smoothing_columns
+
+
+def compute_indicator_bank(
+    data: pd.DataFrame,
+    indicator: str,
+    window: Iterable[int],
+    parameters: dict = None,
+    columns: dict = None
+) -> pd.DataFrame:
+    """
+    Computes an indicator for every window length in `window`.
+
+    Args:
+        data (pd.DataFrame): The input DataFrame.
+        indicator (str): One of 'sma', 'ema', 'rsi', 'atr' or 'std'.
+        window (Iterable[int]): The window lengths, e.g. range(5, 201). Each must be
+            at least 1.
+        parameters (dict, optional): Other parameters of the indicator, e.g. 'ddof'
+            for 'std'.
+        columns (dict, optional): Column name mappings as for the indicator itself
+            ('close_col', and 'high_col'/'low_col' for 'atr').
+
+    Returns:
+        pd.DataFrame: Indexed like `data`, with one column per window in the given
+        order, e.g. SMA_5, SMA_6, ... for 'sma'.
+
+    Raises:
+        ValueError: If the indicator has no bank or a window is below 1.
+
+    Example:
+        >>> bank = compute_indicator_bank(data, 'sma', window=range(5, 201))
+        >>> bank['SMA_50']
+    """
+    if indicator not in BANK_INDICATORS:
+        raise ValueError(f"Indicator '{indicator}' has no bank. Available: {list(BANK_INDICATORS)}")
+    if parameters is None:
+        parameters = {}
+    if columns is None:
+        columns = {}
+
+    windows = np.array([int(w) for w in window], dtype=np.int64)
+    if (windows < 1).any():
+        raise ValueError("Every window must be at least 1.")
+
+    block = BANK_INDICATORS[indicator](data, windows, parameters, columns)
+    names = [f'{indicator.upper()}_{w}' for w in windows]
+    return pd.DataFrame(block, index=data.index, columns=names)
+
+
+def _window_sums(values: np.ndarray, windows: np.ndarray) -> tuple:
+    """
+    Sums every trailing window of each length from one cumulative sum.
+
+    Returns the (n, k) window sums and a mask of the windows that are complete,
+    i.e. that have `window` values and no NaN, as `Series.rolling(window)` requires.
+    """
+    n = len(values)
+    valid = ~np.isnan(values)
+    cumsum = np.concatenate(([0.0], np.cumsum(np.where(valid, values, 0.0))))
+    count = np.concatenate(([0], np.cumsum(valid)))
+
+    end = np.arange(1, n + 1)[:, None]
+    start = np.maximum(end - windows[None, :], 0)
+    sums = cumsum[end] - cumsum[start]
+    complete = (end >= windows[None, :]) & (count[end] - count[start] == windows[None, :])
+    return sums, complete
+
+
+def _centered_close(data: pd.DataFrame, columns: dict) -> tuple:
+    """Returns the close prices minus their mean, which keeps the cumulative sums small, and the mean."""
+    values = data[columns.get('close_col', 'Close')].to_numpy(dtype=float)
+    finite = values[np.isfinite(values)]
+    offset = finite.mean() if len(finite) else 0.0
+    return values - offset, offset
+
+
+def _sma_bank(data: pd.DataFrame, windows: np.ndarray, parameters: dict, columns: dict) -> np.ndarray:
+    values, offset = _centered_close(data, columns)
+    sums, complete = _window_sums(values, windows)
+    return np.where(complete, sums / windows + offset, np.nan)
+
+
+def _std_bank(data: pd.DataFrame, windows: np.ndarray, parameters: dict, columns: dict) -> np.ndarray:
+    ddof = int(parameters.get('ddof', 0))
+    close = data[columns.get('close_col', 'Close')].astype(float)
+    # Variances from cumulative sums of squares lose precision on long trending
+    # series, so each window uses the pandas rolling algorithm
+    block = np.empty((len(close), len(windows)))
+    for j, w in enumerate(windows):
+        block[:, j] = close.rolling(window=int(w)).std(ddof=ddof).to_numpy()
+    return block
+
+
+def _rsi_bank(data: pd.DataFrame, windows: np.ndarray, parameters: dict, columns: dict) -> np.ndarray:
+    close = data[columns.get('close_col', 'Close')]
+    delta = close.diff().to_numpy(dtype=float)
+    # Like the RSI indicator, a missing change counts as neither gain nor loss
+    gain, complete = _window_sums(np.where(delta > 0, delta, 0.0), windows)
+    loss, _ = _window_sums(np.where(delta < 0, -delta, 0.0), windows)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rsi = 100 - (100 / (1 + gain / loss))
+    return np.where(complete, rsi, np.nan)
+
+
+def _ema_bank(data: pd.DataFrame, windows: np.ndarray, parameters: dict, columns: dict) -> np.ndarray:
+    values = data[columns.get('close_col', 'Close')].to_numpy(dtype=float)
+    # Same conversion from span to alpha as Series.ewm(span=window)
+    alphas = 1.0 / (1.0 + (windows - 1) / 2.0)
+    decay = 1.0 - alphas
+    out = np.full((len(values), len(windows)), np.nan)
+
+    # Series.ewm(adjust=False).mean(): the running value is mixed with each new
+    # price, and every missing bar decays its weight once more
+    weighted = None
+    old_weight = decay.copy()
+    mixed = np.empty(len(windows))
+    for i, price in enumerate(values.tolist()):
+        if price != price:
+            if weighted is not None:
+                old_weight *= decay
+                out[i] = weighted
+            continue
+        if weighted is None:
+            weighted = np.full(len(windows), price)
+        else:
+            np.multiply(old_weight, weighted, out=mixed)
+            mixed += alphas * price
+            mixed /= old_weight + alphas
+            np.copyto(weighted, mixed, where=weighted != price)
+            old_weight[:] = decay
+        out[i] = weighted
+    return out
+
+
+def _atr_bank(data: pd.DataFrame, windows: np.ndarray, parameters: dict, columns: dict) -> np.ndarray:
+    high = data[columns.get('high_col', 'High')]
+    low = data[columns.get('low_col', 'Low')]
+    close = data[columns.get('close_col', 'Close')]
+
+    prev_close = close.shift(1)
+    tr = pd.concat([high - low, (high - prev_close).abs(), (low - prev_close).abs()], axis=1).max(axis=1)
+    tr = tr.to_numpy(dtype=float)
+
+    # Each window is seeded with the mean of its first `window` true ranges at
+    # index window - 1, then smoothed with Wilder's method
+    seeds = np.array([pd.Series(tr[:w]).mean() for w in windows])
+    return wilder_smoothing_columns(np.broadcast_to(tr[:, None], (len(tr), len(windows))),
+                                    windows, windows - 1, seeds)
+
+
+BANK_INDICATORS = {
+    'sma': _sma_bank,
+    'ema': _ema_bank,
+    'rsi': _rsi_bank,
+    'atr': _atr_bank,
+    'std': _std_bank,
+}
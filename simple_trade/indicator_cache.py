@@ -0,0 +1,240 @@
+"""
+Opt-in memoization of indicator results.
+
+Premade strategies call `compute_indicator` on every backtest, so an optimizer that
+only sweeps strategy thresholds recomputes the same indicator for every parameter
+combination. When enabled, `compute_indicator` looks results up in a process-wide
+LRU cache keyed by the indicator name, a fingerprint of the price columns the
+indicator can read, and the normalized indicator parameters.
+
+The cache is disabled by default. Enabling it also sets the
+SIMPLE_TRADE_INDICATOR_CACHE_BYTES environment variable, so joblib worker processes
+started afterwards enable their own cache with the same size limit on import.
+"""
+import hashlib
+import os
+from collections import OrderedDict
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+
+CACHE_ENV_VAR = 'SIMPLE_TRADE_INDICATOR_CACHE_BYTES'
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Columns an indicator may read by default; custom names passed via `columns` are added
+_PRICE_COLUMNS = ('Open', 'High', 'Low', 'Close', 'Adj Close', 'Volume')
+
+
+class IndicatorCache:
+    """
+    LRU cache of indicator results bounded by the total size of the cached data.
+
+    Attributes:
+        max_bytes: Upper bound on the summed memory usage of all cached results.
+        hits: Number of lookups answered from the cache.
+        misses: Number of lookups that had to compute the indicator.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        self.max_bytes = int(max_bytes)
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._bytes = 0
+
+    def make_key(self, indicator: str, df: pd.DataFrame, indicator_kwargs: dict) -> tuple:
+        """
+        Builds the cache key for an indicator call on `df` with `indicator_kwargs`.
+
+        Returns None if the parameters cannot be hashed, in which case the call is
+        not cached.
+        """
+        normalized = _normalize(indicator_kwargs)
+        try:
+            hash(normalized)
+        except TypeError:
+            return None
+        column_names = set(_PRICE_COLUMNS)
+        for value in (indicator_kwargs.get('columns') or {}).values():
+            if isinstance(value, str):
+                column_names.add(value)
+        used_columns = [col for col in df.columns if col in column_names]
+        return indicator, data_fingerprint(df, used_columns), normalized
+
+    def get(self, key: tuple) -> Optional[tuple]:
+        """Returns the cached (result, columns) for `key`, or None on a miss."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        result, columns, _ = entry
+        return result, list(columns) if columns is not None else None
+
+    def put(self, key: tuple, result: Any, columns: Optional[list]) -> None:
+        """Stores a result, evicting least recently used entries to stay within max_bytes."""
+        size = _result_nbytes(result)
+        if size > self.max_bytes:
+            return
+        if key in self._entries:
+            self._bytes -= self._entries.pop(key)[2]
+        self._entries[key] = (result, list(columns) if columns is not None else None, size)
+        self._bytes += size
+        self._evict()
+
+    def resize(self, max_bytes: int) -> None:
+        """Changes the size limit, evicting entries if the cache no longer fits."""
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        self.max_bytes = int(max_bytes)
+        self._evict()
+
+    def _evict(self) -> None:
+        while self._bytes > self.max_bytes:
+            _, (_, _, evicted_size) = self._entries.popitem(last=False)
+            self._bytes -= evicted_size
+
+    def clear(self) -> None:
+        """Removes all entries and resets the hit/miss counters."""
+        self._entries.clear()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def info(self) -> dict:
+        """Returns the hit/miss counters and current size of the cache."""
+        return {
+            'enabled': True,
+            'hits': self.hits,
+            'misses': self.misses,
+            'entries': len(self._entries),
+            'bytes': self._bytes,
+            'max_bytes': self.max_bytes,
+        }
+
+
+_cache: Optional[IndicatorCache] = None
+
+
+def enable_indicator_cache(max_bytes: int = DEFAULT_MAX_BYTES, propagate_to_workers: bool = True) -> IndicatorCache:
+    """
+    Enables the process-wide indicator cache used by `compute_indicator`.
+
+    Args:
+        max_bytes: Maximum memory used by cached indicator results. Least recently
+                   used results are evicted beyond this limit. Default is 256 MB.
+        propagate_to_workers: If True, export the limit through the
+                   SIMPLE_TRADE_INDICATOR_CACHE_BYTES environment variable so that
+                   worker processes started afterwards (e.g. by joblib) enable their
+                   own cache on import.
+
+    Returns:
+        IndicatorCache: The active cache. An already enabled cache keeps its entries
+                        and only has its size limit updated.
+
+    Example:
+        >>> enable_indicator_cache(max_bytes=512 * 1024 * 1024)
+        >>> premade_optimizer(data, 'rsi', {'upper': [70, 75, 80], 'lower': [20, 25, 30]})
+        >>> indicator_cache_info()
+    """
+    global _cache
+    if _cache is None:
+        _cache = IndicatorCache(max_bytes)
+    else:
+        _cache.resize(max_bytes)
+    if propagate_to_workers:
+        os.environ[CACHE_ENV_VAR] = str(int(max_bytes))
+    return _cache
+
+
+def disable_indicator_cache() -> None:
+    """Disables the indicator cache, drops its entries and stops propagating it to workers."""
+    global _cache
+    _cache = None
+    os.environ.pop(CACHE_ENV_VAR, None)
+
+
+def get_indicator_cache() -> Optional[IndicatorCache]:
+    """Returns the active IndicatorCache, or None if caching is disabled."""
+    return _cache
+
+
+def clear_indicator_cache() -> None:
+    """Drops all cached results and resets the counters of the active cache."""
+    if _cache is not None:
+        _cache.clear()
+
+
+def indicator_cache_info() -> dict:
+    """
+    Returns hit/miss counters and size information for the indicator cache.
+
+    Counters are per process: results computed inside joblib workers are counted
+    by the worker's own cache.
+
+    Returns:
+        dict: Keys 'enabled', 'hits', 'misses', 'entries', 'bytes', 'max_bytes'.
+    """
+    if _cache is None:
+        return {'enabled': False, 'hits': 0, 'misses': 0, 'entries': 0, 'bytes': 0, 'max_bytes': 0}
+    return _cache.info()
+
+
+def data_fingerprint(df: pd.DataFrame, columns: list) -> tuple:
+    """
+    Returns a fingerprint of the index and the given columns of `df`.
+
+    The raw bytes are hashed with BLAKE2b, which runs at memory bandwidth speed, so
+    fingerprinting is far cheaper than recomputing an indicator.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(str(len(df)).encode())
+    _update_digest(digest, df.index)
+    for col in columns:
+        digest.update(str(col).encode())
+        _update_digest(digest, df[col])
+    return tuple(columns), digest.hexdigest()
+
+
+def _update_digest(digest, values) -> None:
+    """Feeds the dtype and raw bytes of an index or Series into `digest`."""
+    if isinstance(values, pd.DatetimeIndex):
+        array = values.asi8
+        digest.update(str(values.tz).encode())
+    else:
+        array = np.asarray(values)
+    digest.update(str(array.dtype).encode())
+    if array.dtype == object:
+        digest.update(pd.util.hash_array(array).tobytes())
+    else:
+        digest.update(np.ascontiguousarray(array).view(np.uint8))
+
+
+def _normalize(value: Any) -> Any:
+    """Converts parameter containers to hashable, order-independent equivalents."""
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), _normalize(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_normalize(v) for v in value)
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def _result_nbytes(result: Any) -> int:
+    """Approximate memory usage of an indicator result."""
+    if isinstance(result, tuple):
+        return sum(_result_nbytes(part) for part in result)
+    if isinstance(result, pd.DataFrame):
+        return int(result.memory_usage(deep=True).sum())
+    if isinstance(result, pd.Series):
+        return int(result.memory_usage(deep=True))
+    return 0
+
+
+if os.environ.get(CACHE_ENV_VAR):
+    enable_indicator_cache(int(os.environ[CACHE_ENV_VAR]), propagate_to_workers=False)
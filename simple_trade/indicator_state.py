@@ -0,0 +1,391 @@
+"""
+Building blocks for streaming (incremental) indicators.
+
+The batch indicator functions recompute the whole history on every call. An
+indicator state instead keeps just enough of the past to produce the value of
+the newest bar in O(1) per bar, which suits live loops that receive one bar at a
+time:
+
+    state = SMAState(parameters={'window': 20}).initialize(history)
+    for bar in live_bars:
+        value = state.update(bar)
+
+A bar is any mapping of column names to prices (a dict or a DataFrame row), or a
+plain number for indicators that only read the close. The batch functions remain
+the reference: a state fed the bars of a DataFrame produces the values of the
+matching batch function for its last row.
+
+States can be saved with `to_dict()`, which returns plain JSON-compatible data,
+and restored with `IndicatorState.from_dict()`, so a restarted process resumes
+where it stopped instead of replaying the history.
+
+The running aggregates below reproduce the pandas algorithms they replace
+(`Series.rolling(w).sum()/.mean()` and `Series.ewm(adjust=False).mean()`), so the
+streaming values match the batch values exactly rather than to within rounding.
+"""
+import math
+from collections import deque
+from numbers import Number
+
+import numpy as np
+import pandas as pd
+
+
+DEFAULT_COLUMNS = {
+    'open_col': 'Open',
+    'high_col': 'High',
+    'low_col': 'Low',
+    'close_col': 'Close',
+    'volume_col': 'Volume',
+}
+
+
+def window_parameter(parameters: dict, default: int, name: str = 'window') -> int:
+    """Reads a window parameter and its 'period' alias the way the indicator functions do."""
+    alias = name.replace('window', 'period')
+    window_param = parameters.get(name)
+    period_param = parameters.get(alias)
+    if window_param is None and period_param is not None:
+        window_param = period_param
+    elif window_param is not None and period_param is not None:
+        if int(window_param) != int(period_param):
+            raise ValueError(f"Provide either '{name}' or '{alias}' (aliases) with the same value if both are set.")
+    return int(window_param if window_param is not None else default)
+
+
+def divide(numerator: float, denominator: float) -> float:
+    """Float division with NumPy semantics: division by zero gives +/-inf or NaN instead of raising."""
+    try:
+        return numerator / denominator
+    except ZeroDivisionError:
+        if numerator == 0 or numerator != numerator:
+            return math.nan
+        return math.copysign(math.inf, numerator) * math.copysign(1.0, denominator)
+
+
+class RollingSum:
+    """
+    Sum and mean of the last `window` values, updated in O(1).
+
+    Mirrors the compensated (Kahan) add/remove algorithm of pandas' fixed-window
+    rolling sum and mean, including its handling of NaN, so the results equal
+    `Series.rolling(window).sum()` and `.mean()` exactly.
+    """
+
+    def __init__(self, window: int):
+        if window < 1:
+            raise ValueError("window must be at least 1.")
+        self.window = window
+        self.values = deque()
+        self._reset()
+
+    def _reset(self):
+        self.nobs = 0
+        self.total = 0.0
+        self.neg_count = 0
+        self.compensation_add = 0.0
+        self.compensation_remove = 0.0
+        self.same_count = 0
+        self.last = math.nan
+
+    def _add(self, value: float):
+        if value == value:
+            self.nobs += 1
+            y = value - self.compensation_add
+            t = self.total + y
+            self.compensation_add = t - self.total - y
+            self.total = t
+            if math.copysign(1.0, value) < 0:
+                self.neg_count += 1
+            self.same_count = self.same_count + 1 if value == self.last else 1
+            self.last = value
+
+    def _remove(self, value: float):
+        if value == value:
+            self.nobs -= 1
+            y = -value - self.compensation_remove
+            t = self.total + y
+            self.compensation_remove = t - self.total - y
+            self.total = t
+            if math.copysign(1.0, value) < 0:
+                self.neg_count -= 1
+
+    def update(self, value: float):
+        """Adds the newest value and drops the oldest one once the window is full."""
+        self.values.append(value)
+        if self.window == 1 or len(self.values) == 1:
+            # pandas starts the aggregate afresh when a window shares no value with the previous one
+            if len(self.values) > self.window:
+                self.values.popleft()
+            self._reset()
+            self.last = self.values[0]
+            self.same_count = 0
+            self._add(value)
+        else:
+            if len(self.values) > self.window:
+                self._remove(self.values.popleft())
+            self._add(value)
+
+    def sum(self) -> float:
+        """Sum of the window, NaN until it holds `window` non-NaN values."""
+        if self.nobs < self.window:
+            return math.nan
+        if self.same_count >= self.nobs:
+            return self.last * self.nobs
+        return self.total
+
+    def mean(self) -> float:
+        """Mean of the window, NaN until it holds `window` non-NaN values."""
+        if self.nobs < self.window:
+            return math.nan
+        if self.same_count >= self.nobs:
+            return self.last
+        result = self.total / self.nobs
+        if self.neg_count == 0 and result < 0:
+            result = 0.0
+        elif self.neg_count == self.nobs and result > 0:
+            result = 0.0
+        return result
+
+
+class RollingExtreme:
+    """
+    Maximum (or minimum) of the last `window` values, updated in amortized O(1)
+    with a monotonic queue. Equal to `Series.rolling(window).max()` (`.min()`):
+    NaN until the window holds `window` non-NaN values.
+    """
+
+    def __init__(self, window: int, largest: bool = True):
+        if window < 1:
+            raise ValueError("window must be at least 1.")
+        self.window = window
+        self.largest = largest
+        self.count = 0
+        # [position, value] pairs that can still become the extreme, best first
+        self.candidates = deque()
+        self.nan_positions = deque()
+
+    def update(self, value: float) -> float:
+        position = self.count
+        self.count += 1
+        if value != value:
+            self.nan_positions.append(position)
+        else:
+            while self.candidates and (self.candidates[-1][1] <= value if self.largest
+                                       else self.candidates[-1][1] >= value):
+                self.candidates.pop()
+            self.candidates.append([position, value])
+
+        oldest = position - self.window + 1
+        while self.candidates and self.candidates[0][0] < oldest:
+            self.candidates.popleft()
+        while self.nan_positions and self.nan_positions[0] < oldest:
+            self.nan_positions.popleft()
+
+        if self.count < self.window or self.nan_positions:
+            return math.nan
+        return self.candidates[0][1]
+
+
+class ExponentialMean:
+    """
+    Exponential moving average updated in O(1), equal to
+    `Series.ewm(alpha=alpha, adjust=False, min_periods=min_periods).mean()`.
+
+    It starts at the first non-NaN value. A NaN value leaves the average unchanged
+    but decays its weight once more before the next value is mixed in. The
+    average is reported as NaN until `min_periods` non-NaN values were seen.
+    """
+
+    def __init__(self, alpha: float, min_periods: int = 0):
+        self.alpha = alpha
+        self.decay = 1.0 - alpha
+        self.min_periods = max(min_periods, 1)
+        self.mean = math.nan
+        self.old_weight = 1.0
+        self.nobs = 0
+
+    @classmethod
+    def from_span(cls, span: float, min_periods: int = 0) -> 'ExponentialMean':
+        """Creates the average with the smoothing of `Series.ewm(span=span)`."""
+        return cls(1.0 / (1.0 + (span - 1) / 2.0), min_periods)
+
+    def update(self, value: float) -> float:
+        if value == value:
+            self.nobs += 1
+        if self.mean != self.mean:
+            self.mean = value
+        else:
+            self.old_weight *= self.decay
+            if value == value:
+                if self.mean != value:
+                    self.mean = (self.old_weight * self.mean + self.alpha * value) / (self.old_weight + self.alpha)
+                self.old_weight = 1.0
+        return self.mean if self.nobs >= self.min_periods else math.nan
+
+
+class RollingWeightedMean:
+    """
+    Linearly weighted mean of the last `window` values (weights 1..window, newest
+    heaviest), updated in O(1).
+
+    The weighted sum is updated as W = W - S + window * value from the plain sum
+    S. Both are recomputed from the buffer every `window` updates, so rounding
+    errors cannot accumulate. Windows containing NaN give NaN, as in the batch WMA.
+    """
+
+    def __init__(self, window: int):
+        if window < 1:
+            raise ValueError("window must be at least 1.")
+        self.window = window
+        self.divisor = window * (window + 1) / 2
+        self.values = deque()
+        self.plain_sum = 0.0
+        self.weighted_sum = 0.0
+        self.nan_count = 0
+        self.since_resync = 0
+
+    def update(self, value: float) -> float:
+        missing = value != value
+        self.nan_count += missing
+        x = 0.0 if missing else value
+        # Every weight drops by one; the oldest value's weight becomes zero
+        self.weighted_sum += self.window * x - self.plain_sum
+        self.plain_sum += x
+        self.values.append(value)
+        if len(self.values) > self.window:
+            oldest = self.values.popleft()
+            if oldest != oldest:
+                self.nan_count -= 1
+            else:
+                self.plain_sum -= oldest
+
+        self.since_resync += 1
+        if self.since_resync >= self.window:
+            self._resync()
+
+        if len(self.values) < self.window or self.nan_count:
+            return math.nan
+        return self.weighted_sum / self.divisor
+
+    def _resync(self):
+        values = np.nan_to_num(np.array(self.values, dtype=float), nan=0.0)
+        weights = np.arange(self.window - len(values) + 1, self.window + 1)
+        self.plain_sum = float(values.sum())
+        self.weighted_sum = float(values @ weights)
+        self.since_resync = 0
+
+
+class IndicatorState:
+    """
+    Base class of streaming indicators.
+
+    Subclasses list the columns they read in `inputs` (keys of the `columns`
+    mapping, e.g. 'close_col'), set `names` to the output column names of the
+    matching batch function and implement `_step`, which takes the input prices
+    of one bar and returns the new value.
+
+    Attributes:
+        parameters: The indicator parameters, as for the batch function.
+        names: Output column names, as returned by the batch function.
+        value: The value after the latest bar: a float for single-output
+            indicators, a dict of column name to float otherwise. None before
+            the first bar.
+    """
+
+    inputs = ('close_col',)
+
+    def __init__(self, parameters: dict = None, columns: dict = None):
+        self.parameters = dict(parameters or {})
+        self.columns = dict(columns or {})
+        self.input_columns = [self.columns.get(key, DEFAULT_COLUMNS[key]) for key in self.inputs]
+        self.names = []
+        self.value = None
+
+    def update(self, bar):
+        """
+        Feeds one bar and returns the indicator value for it.
+
+        Args:
+            bar: A mapping with the input columns (a dict or a DataFrame row), or a
+                number for indicators that only read the close.
+        """
+        if isinstance(bar, Number):
+            if len(self.inputs) != 1:
+                raise ValueError(f"{type(self).__name__} reads {self.input_columns}; pass the bar as a mapping.")
+            prices = (float(bar),)
+        else:
+            prices = tuple(float(bar[column]) for column in self.input_columns)
+        self.value = self._step(*prices)
+        return self.value
+
+    def initialize(self, df: pd.DataFrame) -> 'IndicatorState':
+        """Feeds every row of `df` in order, e.g. the history before going live, and returns the state."""
+        arrays = [df[column].to_numpy(dtype=float).tolist() for column in self.input_columns]
+        for prices in zip(*arrays):
+            self.value = self._step(*prices)
+        return self
+
+    def _step(self, *prices):
+        raise NotImplementedError
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _STATE_CLASSES[cls.__name__] = cls
+
+    def to_dict(self) -> dict:
+        """
+        Returns the full state as plain data (dicts, lists, numbers and strings)
+        that `json.dumps` can write. NaN and infinity are kept as floats, which
+        the json module writes as NaN and Infinity by default.
+        """
+        return {'indicator': type(self).__name__, 'state': _encode(vars(self))}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'IndicatorState':
+        """Restores a state saved with `to_dict`; the result continues exactly where the saved state stopped."""
+        state_cls = _STATE_CLASSES.get(data['indicator'])
+        if state_cls is None or not issubclass(state_cls, cls):
+            raise ValueError(f"Unknown indicator state '{data['indicator']}'.")
+        state = state_cls.__new__(state_cls)
+        state.__dict__.update(_decode(data['state']))
+        return state
+
+
+_STATE_CLASSES = {}
+
+# Running aggregates that may appear inside an indicator state
+_AGGREGATE_CLASSES = {cls.__name__: cls for cls in (RollingSum, RollingExtreme, ExponentialMean, RollingWeightedMean)}
+
+
+def _encode(value):
+    """Converts state attributes to JSON-compatible data."""
+    if isinstance(value, tuple(_AGGREGATE_CLASSES.values())):
+        return {'__aggregate__': type(value).__name__, 'state': _encode(vars(value))}
+    if isinstance(value, deque):
+        return {'__deque__': [_encode(item) for item in value], 'maxlen': value.maxlen}
+    if isinstance(value, dict):
+        return {key: _encode(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_encode(item) for item in value]
+    if isinstance(value, (bool, int, str)) or value is None:
+        return value
+    if isinstance(value, Number):
+        return float(value)
+    raise TypeError(f"Cannot serialize state value of type {type(value).__name__}.")
+
+
+def _decode(value):
+    """Inverse of `_encode`."""
+    if isinstance(value, dict):
+        if '__aggregate__' in value:
+            aggregate_cls = _AGGREGATE_CLASSES[value['__aggregate__']]
+            aggregate = aggregate_cls.__new__(aggregate_cls)
+            aggregate.__dict__.update(_decode(value['state']))
+            return aggregate
+        if '__deque__' in value:
+            return deque((_decode(item) for item in value['__deque__']), maxlen=value['maxlen'])
+        return {key: _decode(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_decode(item) for item in value]
+    return value
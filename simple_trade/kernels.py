@@ -0,0 +1,530 @@
+"""
+Array kernels shared by indicator modules.
+
+Indicators whose values depend on the previous output (cumulative volume lines,
+recursive smoothers) used to be written as loops over `Series.iloc`. The kernels
+here operate on NumPy arrays instead: recursions that are plain running sums use
+`np.cumsum`, and the remaining ones iterate over Python floats, which avoids all
+per-element pandas indexing while performing the same floating point operations
+in the same order, so results are identical to the original loops.
+
+State machines that cannot be vectorized (Parabolic SAR, Supertrend, adaptive
+moving averages) are written as scalar loops over preallocated arrays. They are
+compiled with Numba when it is installed and otherwise run as plain Python over
+lists of floats.
+"""
+import math
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+try:
+    import numba
+except ImportError:  # Numba is an optional accelerator
+    numba = None
+
+# Upper bound on the memory touched per block by rolling_window_apply
+WINDOW_BLOCK_BYTES = 32 * 1024 * 1024
+
+# Coefficients of Ehlers' four-tap Hilbert transform FIR
+HILBERT_A = 0.0962
+HILBERT_B = 0.5769
+
+
+def price_direction(close: np.ndarray) -> np.ndarray:
+    """
+    Returns +1, -1 or 0 for each bar depending on whether close rose, fell or was
+    unchanged (or undefined) relative to the previous bar. The first bar is 0.
+    """
+    change = np.diff(close, prepend=np.nan)
+    direction = np.zeros(len(close), dtype=np.int64)
+    direction[change > 0] = 1
+    direction[change < 0] = -1
+    return direction
+
+
+def masked_compound(initial: float, rates: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    """
+    Compounds `initial` by `rates` on the bars where `mask` is True:
+
+        out[0] = initial
+        out[i] = out[i-1] + out[i-1] * rates[i]   if mask[i]
+        out[i] = out[i-1]                         otherwise
+
+    Only the masked bars are visited; the value is carried forward in between.
+    """
+    n = len(rates)
+    out = np.empty(n, dtype=np.float64)
+    if n == 0:
+        return out
+
+    steps = np.flatnonzero(mask[1:]) + 1
+    step_values = np.empty(len(steps), dtype=np.float64)
+    value = float(initial)
+    for j, rate in enumerate(rates[steps].tolist()):
+        value = value + value * rate
+        step_values[j] = value
+
+    # Carry each value forward to the next masked bar
+    last_step = np.zeros(n, dtype=np.int64)
+    last_step[steps] = np.arange(1, len(steps) + 1)
+    np.maximum.accumulate(last_step, out=last_step)
+    out[:] = np.concatenate(([float(initial)], step_values))[last_step]
+    return out
+
+
+def run_cumsum(values: np.ndarray, continues: np.ndarray) -> np.ndarray:
+    """
+    Cumulative sum that restarts whenever `continues` is False:
+
+        out[0] = values[0]
+        out[i] = out[i-1] + values[i]       if continues[i]
+        out[i] = values[i-1] + values[i]    otherwise
+
+    A restarted run is seeded with the previous bar's value, as in Klinger's
+    cumulative measurement.
+    """
+    n = len(values)
+    out = np.empty(n, dtype=np.float64)
+    if n == 0:
+        return out
+    vals = values.tolist()
+    cont = continues.tolist()
+    total = vals[0]
+    out[0] = total
+    for i in range(1, n):
+        if cont[i]:
+            total = total + vals[i]
+        else:
+            total = vals[i - 1] + vals[i]
+        out[i] = total
+    return out
+
+
+def wilder_smoothing(
+    values: np.ndarray,
+    window: int,
+    start: int,
+    seed: float,
+    out: np.ndarray = None
+) -> np.ndarray:
+    """
+    Wilder's running moving average (RMA), a first-order IIR filter:
+
+        out[:start] = NaN
+        out[start] = seed
+        out[i] = (out[i-1] * (window - 1) + values[i]) / window    for i > start
+
+    ATR-style indicators seed it with the mean of the first `window` values at
+    start = window - 1. With window=2 it is the Heikin-Ashi open recursion
+    (previous open + input) / 2.
+
+    Args:
+        values: Input array.
+        window: Smoothing length; the weight of each new value is 1 / window.
+        start: Index of the seed value. If it is beyond the end of `values`, the
+               result is all NaN.
+        seed: Initial value of the recursion.
+        out: Optional float64 array of the same length to write the result into.
+
+    Returns:
+        np.ndarray: The smoothed values (`out` if it was given).
+    """
+    n = len(values)
+    if out is None:
+        out = np.empty(n, dtype=np.float64)
+    out[:min(start, n)] = np.nan
+    if start >= n:
+        return out
+
+    prev = float(seed)
+    out[start] = prev
+    weight = window - 1
+    for i, value in enumerate(values[start + 1:].tolist(), start + 1):
+        prev = (prev * weight + value) / window
+        out[i] = prev
+    return out
+
+
+def wilder_smoothing_columns(
+    values: np.ndarray,
+    window,
+    start,
+    seed
+) -> np.ndarray:
+    """
+    `wilder_smoothing` applied to every column of a 2D array at once. The
+    recursions of all columns advance together, one vectorized step per row.
+
+    Args:
+        values: Input array of shape (n, k).
+        window: Smoothing length, a scalar or one value per column.
+        start: Row of the seed value, a scalar or one value per column.
+        seed: Initial value of the recursion, a scalar or one value per column.
+
+    Returns:
+        np.ndarray: The (n, k) smoothed values. Each column equals
+        `wilder_smoothing` of that column with its window, start and seed.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    n, k = values.shape
+    window = np.broadcast_to(np.asarray(window, dtype=np.float64), (k,))
+    start = np.broadcast_to(np.asarray(start), (k,))
+    seed = np.broadcast_to(np.asarray(seed, dtype=np.float64), (k,))
+    weight = window - 1
+
+    out = np.empty((n, k), dtype=np.float64)
+    prev = np.full(k, np.nan)
+    for i in range(n):
+        prev = (prev * weight + values[i]) / window
+        seeded = start == i
+        if seeded.any():
+            prev[seeded] = seed[seeded]
+        out[i] = prev
+    return out
+
+
+def rolling_weighted_sum(values: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """
+    Dot product of every trailing window of `values` with a fixed weight vector,
+    computed as a single convolution:
+
+        out[i] = sum(values[i-w+1+k] * weights[k] for k in range(w))
+
+    `weights[0]` applies to the oldest value of the window. As with
+    `Series.rolling(w)`, the first w-1 values and any window containing a NaN
+    are NaN.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    weights = np.asarray(weights, dtype=np.float64)
+    window = len(weights)
+    if window < 1:
+        raise ValueError("weights must contain at least one value.")
+
+    n = len(values)
+    out = np.full(n, np.nan)
+    if n < window:
+        return out
+
+    missing = np.isnan(values)
+    out[window - 1:] = np.convolve(np.where(missing, 0.0, values), weights[::-1], mode='valid')
+    out[window - 1:][~_complete_windows(missing, window)] = np.nan
+    return out
+
+
+def _complete_windows(missing: np.ndarray, window: int) -> np.ndarray:
+    """Flags, for each trailing window of `missing`, whether it has no missing values."""
+    missing_count = np.cumsum(missing)
+    return (missing_count[window - 1:] - np.concatenate(([0], missing_count[:-window]))) == 0
+
+
+def rolling_window_apply(
+    values: np.ndarray,
+    window: int,
+    func,
+    block_bytes: int = WINDOW_BLOCK_BYTES
+) -> np.ndarray:
+    """
+    Vectorized replacement for `Series.rolling(window).apply(func)`.
+
+    `func` receives a 2D array whose rows are trailing windows (oldest value first)
+    and must return one value per row. The windows are read-only views from
+    `sliding_window_view`, passed in blocks of rows so that a block spans about
+    `block_bytes` of window data however long the series is.
+
+    As with `Series.rolling(window)`, the first window-1 values and any window
+    containing a NaN are NaN; `func` only sees complete windows.
+    """
+    if window < 1:
+        raise ValueError("window must be at least 1.")
+    values = np.asarray(values, dtype=np.float64)
+    n = len(values)
+    out = np.full(n, np.nan)
+    if n < window:
+        return out
+
+    windows = sliding_window_view(values, window)
+    complete = _complete_windows(np.isnan(values), window)
+
+    rows_per_block = max(1, block_bytes // (window * values.itemsize))
+    result = out[window - 1:]
+    for start in range(0, len(windows), rows_per_block):
+        stop = start + rows_per_block
+        rows = np.flatnonzero(complete[start:stop]) + start
+        if len(rows) == len(complete[start:stop]):
+            result[start:stop] = func(windows[start:stop])
+        elif len(rows):
+            result[rows] = func(windows[rows])
+    return out
+
+
+def _compiled(func):
+    """Compiles a scalar loop with Numba if it is installed, otherwise returns it unchanged."""
+    if numba is None:
+        return func
+    return numba.njit(cache=True, nogil=True)(func)
+
+
+def _loop_inputs(*arrays):
+    """Prepares inputs for a `_compiled` loop: float64 arrays for Numba, lists of floats otherwise."""
+    arrays = tuple(np.ascontiguousarray(a, dtype=np.float64) for a in arrays)
+    if numba is None:
+        return tuple(a.tolist() for a in arrays)
+    return arrays
+
+
+@_compiled
+def _parabolic_sar_loop(high, low, af_initial, af_step, af_max, sar, is_bull):
+    bull = True
+    af = af_initial
+    ep = high[0]
+    current = low[0]
+    sar[0] = current
+    is_bull[0] = True
+
+    for i in range(1, len(high)):
+        current = current + af * (ep - current)
+        if bull:
+            # SAR cannot be higher than the low of the previous two periods
+            current = min(current, low[i - 1], low[i - 2] if i > 1 else low[i - 1])
+            if low[i] < current:
+                bull = False
+                current = ep
+                ep = low[i]
+                af = af_initial
+            elif high[i] > ep:
+                ep = high[i]
+                af = min(af + af_step, af_max)
+        else:
+            # SAR cannot be lower than the high of the previous two periods
+            current = max(current, high[i - 1], high[i - 2] if i > 1 else high[i - 1])
+            if high[i] > current:
+                bull = True
+                current = ep
+                ep = high[i]
+                af = af_initial
+            elif low[i] < ep:
+                ep = low[i]
+                af = min(af + af_step, af_max)
+        sar[i] = current
+        is_bull[i] = bull
+
+
+def parabolic_sar(
+    high: np.ndarray,
+    low: np.ndarray,
+    af_initial: float,
+    af_step: float,
+    af_max: float
+) -> tuple:
+    """
+    Wilder's Parabolic SAR, starting in an uptrend with the SAR at the first low.
+
+    Returns:
+        tuple: The SAR values and a boolean array that is True while the trend is up.
+    """
+    n = len(high)
+    sar = np.zeros(n, dtype=np.float64)
+    is_bull = np.zeros(n, dtype=bool)
+    if n > 0:
+        _parabolic_sar_loop(*_loop_inputs(high, low), float(af_initial), float(af_step), float(af_max),
+                            sar, is_bull)
+    return sar, is_bull
+
+
+@_compiled
+def _supertrend_loop(close, up_band, low_band, start, line, direction):
+    # Initial trend: up if close is above the lower band
+    if close[start] > low_band[start]:
+        trend = 1
+        current = low_band[start]
+    else:
+        trend = -1
+        current = up_band[start]
+    line[start] = current
+    direction[start] = trend
+
+    for i in range(start + 1, len(close)):
+        if trend == 1:
+            # The line can only rise during an uptrend
+            current = max(current, low_band[i])
+            if close[i] < current:
+                trend = -1
+                current = up_band[i]
+        else:
+            # The line can only fall during a downtrend
+            current = min(current, up_band[i])
+            if close[i] > current:
+                trend = 1
+                current = low_band[i]
+        line[i] = current
+        direction[i] = trend
+
+
+def supertrend(close: np.ndarray, up_band: np.ndarray, low_band: np.ndarray, start: int) -> tuple:
+    """
+    Supertrend line and direction from precomputed upper and lower bands.
+
+    The trend is initialized at `start` and followed from there: during an uptrend
+    the line is the ratcheting lower band until close falls below it, and vice versa.
+
+    Returns:
+        tuple: The Supertrend line (NaN before `start`) and the direction as an int64
+        array of 1 (up), -1 (down) or 0 (before `start`).
+    """
+    n = len(close)
+    line = np.full(n, np.nan)
+    direction = np.zeros(n, dtype=np.int64)
+    if 0 <= start < n:
+        _supertrend_loop(*_loop_inputs(close, up_band, low_band), int(start), line, direction)
+    return line, direction
+
+
+@_compiled
+def _adaptive_ema_loop(values, alpha, start, seed, out):
+    prev = seed
+    out[start] = prev
+    for i in range(start + 1, len(values)):
+        price = values[i]
+        if prev != prev:
+            # No previous average yet: start from the current price
+            prev = price
+        a = alpha[i]
+        if price == price and a == a:
+            prev = a * price + (1 - a) * prev
+        out[i] = prev
+
+
+def adaptive_ema(values: np.ndarray, alpha: np.ndarray, start: int = None, seed: float = None) -> np.ndarray:
+    """
+    Exponential moving average with a time-varying smoothing factor:
+
+        out[:start] = NaN
+        out[start] = seed
+        out[i] = alpha[i] * values[i] + (1 - alpha[i]) * out[i-1]    for i > start
+
+    Bars where `values` or `alpha` is NaN hold the previous average, and while the
+    previous average is NaN the current value takes its place.
+
+    Args:
+        values: Input prices.
+        alpha: Smoothing factor for each bar, aligned with `values`.
+        start: Index of the seed. Defaults to the first non-NaN value.
+        seed: Initial average. Defaults to `values[start]`.
+
+    Returns:
+        np.ndarray: The adaptive average.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    n = len(values)
+    out = np.full(n, np.nan)
+    if start is None:
+        valid = np.flatnonzero(~np.isnan(values))
+        if not len(valid):
+            return out
+        start = valid[0]
+    if not 0 <= start < n:
+        return out
+    seed = values[start] if seed is None else seed
+    _adaptive_ema_loop(*_loop_inputs(values, alpha), int(start), float(seed), out)
+    return out
+
+
+def _loop_buffers(n: int, count: int) -> tuple:
+    """Zeroed work buffers for a `_compiled` loop: arrays for Numba, lists of floats otherwise."""
+    if numba is None:
+        return tuple([0.0] * n for _ in range(count))
+    return tuple(np.zeros(n) for _ in range(count))
+
+
+def hilbert_fir(values: np.ndarray) -> np.ndarray:
+    """
+    Ehlers' Hilbert transform FIR applied to a whole series:
+
+        out[i] = A * x[i] + B * x[i-2] - B * x[i-4] - A * x[i-6]
+
+    The first six values are NaN.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    out = np.full(len(values), np.nan)
+    if len(values) > 6:
+        out[6:] = (HILBERT_A * values[6:] + HILBERT_B * values[4:-2]
+                   - HILBERT_B * values[2:-4] - HILBERT_A * values[:-6])
+    return out
+
+
+@_compiled
+def _hilbert_transform_loop(price, smooth, detrender, i1, q1, i2, q2, re, im, period, smooth_period, phase):
+    a = HILBERT_A
+    b = HILBERT_B
+    for i in range(min(6, len(price))):
+        smooth[i] = price[i]
+        period[i] = 10.0
+        smooth_period[i] = 10.0
+
+    for i in range(6, len(price)):
+        smooth[i] = (4 * price[i] + 3 * price[i-1] + 2 * price[i-2] + price[i-3]) / 10.0
+        gain = 0.075 * period[i-1] + 0.54
+
+        # Detrender, then InPhase and Quadrature components
+        detrender[i] = (a * smooth[i] + b * smooth[i-2] - b * smooth[i-4] - a * smooth[i-6]) * gain
+        q1[i] = (a * detrender[i] + b * detrender[i-2] - b * detrender[i-4] - a * detrender[i-6]) * gain
+        i1[i] = detrender[i-3]
+
+        # Advance the phase of I1 and Q1 by 90 degrees
+        ji = (a * i1[i] + b * i1[i-2] - b * i1[i-4] - a * i1[i-6]) * gain
+        jq = (a * q1[i] + b * q1[i-2] - b * q1[i-4] - a * q1[i-6]) * gain
+
+        # Phasor addition, smoothed before applying the discriminator
+        i2[i] = 0.2 * (i1[i] - jq) + 0.8 * i2[i-1]
+        q2[i] = 0.2 * (q1[i] + ji) + 0.8 * q2[i-1]
+
+        # Homodyne discriminator
+        re[i] = 0.2 * (i2[i] * i2[i-1] + q2[i] * q2[i-1]) + 0.8 * re[i-1]
+        im[i] = 0.2 * (i2[i] * q2[i-1] - q2[i] * i2[i-1]) + 0.8 * im[i-1]
+
+        current = period[i]
+        if im[i] != 0 and re[i] != 0:
+            current = 2 * math.pi / math.atan(im[i] / re[i])
+        if current > 1.5 * period[i-1]:
+            current = 1.5 * period[i-1]
+        if current < 0.67 * period[i-1]:
+            current = 0.67 * period[i-1]
+        if current < 6:
+            current = 6.0
+        if current > 50:
+            current = 50.0
+        period[i] = 0.2 * current + 0.8 * period[i-1]
+        smooth_period[i] = 0.33 * period[i] + 0.67 * smooth_period[i-1]
+
+        if i1[i] != 0:
+            phase[i] = math.degrees(math.atan(q1[i] / i1[i]))
+
+
+def hilbert_transform(price: np.ndarray) -> dict:
+    """
+    Ehlers' Hilbert transform homodyne discriminator, as used by MESA indicators.
+
+    The first six bars are warm-up: the smoothed price equals the price, the
+    period is 10 and the remaining components are zero.
+
+    Returns:
+        dict: float64 arrays aligned with `price`:
+            - smooth: Four-bar weighted price.
+            - in_phase, quadrature: The InPhase (I1) and Quadrature (Q1) components.
+            - period: Dominant cycle period, limited to 6-50 bars.
+            - smooth_period: Further smoothed dominant cycle period.
+            - phase: Phase of the dominant cycle in degrees.
+    """
+    (price,) = _loop_inputs(price)
+    buffers = _loop_buffers(len(price), 11)
+    _hilbert_transform_loop(price, *buffers)
+    smooth, _, i1, q1, _, _, _, _, period, smooth_period, phase = (np.asarray(b, dtype=np.float64) for b in buffers)
+    return {
+        'smooth': smooth,
+        'in_phase': i1,
+        'quadrature': q1,
+        'period': period,
+        'smooth_period': smooth_period,
+        'phase': phase,
+    }
@@ -109,22 +109,11 @@ def calculate_performance_metrics(
     total_return_pct = ((final_value - initial_value) / initial_value) * 100
     
     # Detect data frequency to properly annualize metrics
-    time_deltas = portfolio_df.index.to_series().diff().dt.days.dropna()
-    median_delta = time_deltas.median() if len(time_deltas) > 0 else 1
-    
-    # Determine periods per year based on data frequency
-    if median_delta <= 2:  # Daily or near-daily data
-        periods_per_year = 252
-    elif 5 <= median_delta <= 9:  # Weekly data
-        periods_per_year = 52
-    elif 25 <= median_delta <= 35:  # Monthly data
-        periods_per_year = 12
-    else:  # Default to daily
-        periods_per_year = 252
+    periods_per_year = _periods_per_year(portfolio_df.index)
     
     # Calculate period returns (daily, weekly, etc.)
-    portfolio_df = portfolio_df.copy()  # Avoid modifying original
-    portfolio_df['daily_return'] = portfolio_df['PortfolioValue'].pct_change()
+    portfolio_values = portfolio_df['PortfolioValue']
+    period_returns = portfolio_values.pct_change()
     
     # Annualized return and volatility
     periods_in_backtest = len(portfolio_df)
@@ -132,19 +121,19 @@ def calculate_performance_metrics(
     annualized_return = ((final_value / initial_value) ** (1 / years)) - 1 if years > 0 else 0
     
     # Volatility (annualized standard deviation of returns)
-    period_volatility = portfolio_df['daily_return'].std()
+    period_volatility = period_returns.std()
     annualized_volatility = period_volatility * np.sqrt(periods_per_year)
     
     # Sharpe Ratio
     period_risk_free = ((1 + risk_free_rate) ** (1/periods_per_year)) - 1
-    excess_return = portfolio_df['daily_return'] - period_risk_free
+    excess_return = period_returns - period_risk_free
     if period_volatility > 1e-10 and not np.isnan(period_volatility):
         sharpe_ratio = excess_return.mean() / period_volatility * np.sqrt(periods_per_year)
     else:
         sharpe_ratio = np.nan 
     
     # Sortino Ratio (uses downside deviation instead of total volatility)
-    negative_returns = portfolio_df['daily_return'][portfolio_df['daily_return'] < 0]
+    negative_returns = period_returns[period_returns < 0]
     downside_deviation = negative_returns.std() * np.sqrt(periods_per_year) if len(negative_returns) > 0 else 0
     sortino_ratio = (annualized_return - risk_free_rate) / downside_deviation if downside_deviation > 0 else np.inf
         
@@ -152,41 +141,14 @@ def calculate_performance_metrics(
     total_commissions = portfolio_df['CommissionPaid'].iloc[-1] if 'CommissionPaid' in portfolio_df.columns else None
     
     # Drawdown analysis
-    portfolio_df['cum_max'] = portfolio_df['PortfolioValue'].cummax()
-    portfolio_df['drawdown'] = (portfolio_df['PortfolioValue'] - portfolio_df['cum_max']) / portfolio_df['cum_max'] * 100
-    max_drawdown = portfolio_df['drawdown'].min()
-    avg_drawdown = portfolio_df['drawdown'][portfolio_df['drawdown'] < 0].mean() if len(portfolio_df['drawdown'][portfolio_df['drawdown'] < 0]) > 0 else 0
+    cum_max = portfolio_values.cummax()
+    drawdown = (portfolio_values - cum_max) / cum_max * 100
+    max_drawdown = drawdown.min()
+    underwater = drawdown[drawdown < 0]
+    avg_drawdown = underwater.mean() if len(underwater) > 0 else 0
     
     # Drawdown duration analysis
-    portfolio_df['drawdown_start'] = ~(portfolio_df['drawdown'] == 0) & (portfolio_df['drawdown'].shift(1) == 0)
-    portfolio_df['drawdown_end'] = (portfolio_df['drawdown'] == 0) & ~(portfolio_df['drawdown'].shift(1) == 0)
-    
-    # Find all drawdown periods
-    drawdown_periods = []
-    in_drawdown = False
-    drawdown_start = None
-    
-    for date, row in portfolio_df.iterrows():
-        if row['drawdown_start'] and not in_drawdown:
-            drawdown_start = date
-            in_drawdown = True
-        elif row['drawdown_end'] and in_drawdown:
-            if drawdown_start is not None:
-                drawdown_periods.append((drawdown_start, date, (date - drawdown_start).days))
-            in_drawdown = False
-            drawdown_start = None
-            
-    # If we're still in a drawdown at the end of the data
-    if in_drawdown and drawdown_start is not None:
-        drawdown_periods.append((drawdown_start, end_date, (end_date - drawdown_start).days))
-    
-    # Calculate drawdown duration metrics
-    if drawdown_periods:
-        max_drawdown_duration = max([period[2] for period in drawdown_periods])
-        avg_drawdown_duration = sum([period[2] for period in drawdown_periods]) / len(drawdown_periods)
-    else:
-        max_drawdown_duration = 0
-        avg_drawdown_duration = 0
+    max_drawdown_duration, avg_drawdown_duration = _drawdown_durations(drawdown.to_numpy(), portfolio_df.index)
     
     # Calmar Ratio (Annualized Return / Max Drawdown)
     calmar_ratio = annualized_return / (abs(max_drawdown) / 100) if max_drawdown != 0 else np.inf
@@ -214,6 +176,204 @@ def calculate_performance_metrics(
     return metrics
 
 
+def calculate_performance_metrics_batch(
+    portfolio_values: pd.DataFrame | np.ndarray,
+    risk_free_rate: float = 0.0,
+    index: pd.DatetimeIndex | None = None
+) -> pd.DataFrame:
+    """
+    Calculates performance metrics for many equity curves at once.
+
+    Each column of `portfolio_values` is one equity curve (e.g. one strategy or
+    parameter set) over a shared index. The metrics follow the definitions of
+    `calculate_performance_metrics` but are computed with column-wise array
+    reductions, which makes ranking thousands of candidates cheap.
+
+    Args:
+        portfolio_values: 2D DataFrame or array of portfolio values with one row per
+                          bar and one column per equity curve. Curves are expected to
+                          be free of NaN values.
+        risk_free_rate: Annual risk-free rate for Sharpe and Sortino ratios.
+        index: DatetimeIndex of the bars. Required when portfolio_values is an array;
+               a DataFrame's own index is used otherwise.
+
+    Returns:
+        pd.DataFrame: One row per equity curve (labelled by the DataFrame's columns or
+                      by position) with total_return_pct, annualized_return_pct,
+                      annualized_volatility_pct, sharpe_ratio, sortino_ratio,
+                      calmar_ratio, max_drawdown_pct, avg_drawdown_pct,
+                      max_drawdown_duration_days and avg_drawdown_duration_days.
+
+    Raises:
+        TypeError: If the index is not a DatetimeIndex.
+        ValueError: If portfolio_values is not 2D, is empty, or does not match the index.
+
+    Example:
+        >>> equity = pd.DataFrame({name: df['PortfolioValue'] for name, df in portfolios.items()})
+        >>> table = calculate_performance_metrics_batch(equity, risk_free_rate=0.02)
+        >>> table.sort_values('sharpe_ratio', ascending=False).head()
+    """
+    if isinstance(portfolio_values, pd.DataFrame):
+        index = portfolio_values.index
+        labels = portfolio_values.columns
+        values = portfolio_values.to_numpy(dtype=np.float64)
+    else:
+        if index is None:
+            raise ValueError("index is required when portfolio_values is an array.")
+        values = np.asarray(portfolio_values, dtype=np.float64)
+        labels = pd.RangeIndex(values.shape[1]) if values.ndim == 2 else None
+
+    if values.ndim != 2:
+        raise ValueError("portfolio_values must be 2D with one column per equity curve.")
+    if not isinstance(index, pd.DatetimeIndex):
+        raise TypeError("portfolio_values index must be a DatetimeIndex.")
+    if len(index) != len(values):
+        raise ValueError(f"index has {len(index)} entries but portfolio_values has {len(values)} rows.")
+    if len(values) == 0:
+        raise ValueError("portfolio_values must contain at least one row.")
+
+    periods_per_year = _periods_per_year(index)
+    periods_in_backtest = len(values)
+    years = periods_in_backtest / periods_per_year
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        initial_values = values[0]
+        final_values = values[-1]
+        total_return_pct = (final_values - initial_values) / initial_values * 100
+        annualized_return = (final_values / initial_values) ** (1 / years) - 1
+
+        period_returns = np.full_like(values, np.nan)
+        period_returns[1:] = values[1:] / values[:-1] - 1
+        period_volatility = _nanstd(period_returns)
+        annualized_volatility = period_volatility * np.sqrt(periods_per_year)
+
+        # Sharpe Ratio
+        period_risk_free = ((1 + risk_free_rate) ** (1/periods_per_year)) - 1
+        excess_mean = _nanmean(period_returns - period_risk_free)
+        has_volatility = (period_volatility > 1e-10) & ~np.isnan(period_volatility)
+        sharpe_ratio = np.where(has_volatility, excess_mean / period_volatility * np.sqrt(periods_per_year), np.nan)
+
+        # Sortino Ratio
+        is_negative = period_returns < 0
+        downside_deviation = np.where(
+            is_negative.any(axis=0),
+            _nanstd(np.where(is_negative, period_returns, np.nan)) * np.sqrt(periods_per_year),
+            0.0
+        )
+        sortino_ratio = np.where(downside_deviation > 0, (annualized_return - risk_free_rate) / downside_deviation, np.inf)
+
+        # Drawdowns
+        running_max = np.fmax.accumulate(values, axis=0)
+        drawdown = (values - running_max) / running_max * 100
+        max_drawdown = _nanmin(drawdown)
+        underwater = drawdown < 0
+        underwater_count = underwater.sum(axis=0)
+        avg_drawdown = np.where(
+            underwater_count > 0,
+            np.where(underwater, drawdown, 0.0).sum(axis=0) / np.maximum(underwater_count, 1),
+            0.0
+        )
+        calmar_ratio = np.where(max_drawdown != 0, annualized_return / (np.abs(max_drawdown) / 100), np.inf)
+
+    max_duration, avg_duration = _drawdown_durations_matrix(drawdown, index)
+
+    return pd.DataFrame({
+        'total_return_pct': np.round(total_return_pct, 2),
+        'annualized_return_pct': np.round(annualized_return * 100, 2),
+        'annualized_volatility_pct': np.round(annualized_volatility * 100, 2),
+        'sharpe_ratio': np.round(sharpe_ratio, 2),
+        'sortino_ratio': np.round(sortino_ratio, 2),
+        'calmar_ratio': np.round(calmar_ratio, 2),
+        'max_drawdown_pct': np.round(max_drawdown, 2),
+        'avg_drawdown_pct': np.round(avg_drawdown, 2),
+        'max_drawdown_duration_days': max_duration,
+        'avg_drawdown_duration_days': np.round(avg_duration, 2),
+    }, index=labels)
+
+
+def _periods_per_year(index: pd.DatetimeIndex) -> int:
+    """Infers the number of periods per year from the median spacing of the index."""
+    time_deltas = index.to_series().diff().dt.days.dropna()
+    median_delta = time_deltas.median() if len(time_deltas) > 0 else 1
+    
+    # Determine periods per year based on data frequency
+    if median_delta <= 2:  # Daily or near-daily data
+        return 252
+    elif 5 <= median_delta <= 9:  # Weekly data
+        return 52
+    elif 25 <= median_delta <= 35:  # Monthly data
+        return 12
+    else:  # Default to daily
+        return 252
+
+
+def _nanmean(values: np.ndarray) -> np.ndarray:
+    """Column-wise mean ignoring NaN; NaN for columns without values."""
+    count = (~np.isnan(values)).sum(axis=0)
+    total = np.where(np.isnan(values), 0.0, values).sum(axis=0)
+    return np.where(count > 0, total / np.maximum(count, 1), np.nan)
+
+
+def _nanstd(values: np.ndarray) -> np.ndarray:
+    """Column-wise sample standard deviation ignoring NaN, like pandas' std."""
+    count = (~np.isnan(values)).sum(axis=0)
+    deviations = np.where(np.isnan(values), 0.0, values - _nanmean(values))
+    variance = (deviations ** 2).sum(axis=0) / np.maximum(count - 1, 1)
+    return np.where(count > 1, np.sqrt(variance), np.nan)
+
+
+def _nanmin(values: np.ndarray) -> np.ndarray:
+    """Column-wise minimum ignoring NaN; NaN for columns without values."""
+    minimum = np.where(np.isnan(values), np.inf, values).min(axis=0)
+    return np.where(np.isnan(values).all(axis=0), np.nan, minimum)
+
+
+def _drawdown_durations_matrix(drawdown: np.ndarray, index: pd.DatetimeIndex) -> tuple:
+    """Column-wise counterpart of `_drawdown_durations` for a (bars x curves) drawdown matrix."""
+    n = len(drawdown)
+    at_peak = drawdown == 0
+    starts = np.zeros_like(at_peak)
+    starts[1:] = ~at_peak[1:] & at_peak[:-1]
+
+    # First peak at or after each bar (n if the curve never recovers)
+    positions = np.where(at_peak, np.arange(n)[:, None], n)
+    next_peak = np.minimum.accumulate(positions[::-1], axis=0)[::-1]
+    ends = np.where(next_peak == n, n - 1, next_peak)
+
+    nanoseconds = index.values.astype('datetime64[ns]').view(np.int64)
+    durations = (nanoseconds[ends] - nanoseconds[:, None]) // 86_400_000_000_000
+    durations = np.where(starts, durations, 0)
+
+    num_periods = starts.sum(axis=0)
+    max_duration = durations.max(axis=0)
+    avg_duration = np.where(num_periods > 0, durations.sum(axis=0) / np.maximum(num_periods, 1), 0.0)
+    return max_duration, avg_duration
+
+
+def _drawdown_durations(drawdown: np.ndarray, index: pd.DatetimeIndex) -> tuple:
+    """
+    Returns the maximum and average duration in days of the drawdown periods.
+
+    A drawdown period starts at the first bar below a previous peak (a bar whose
+    predecessor has zero drawdown) and ends at the next bar back at the peak, or at
+    the last bar if the drawdown is never recovered.
+    """
+    at_peak = drawdown == 0
+    starts = np.flatnonzero(~at_peak[1:] & at_peak[:-1]) + 1
+    if len(starts) == 0:
+        return 0, 0
+
+    # Each period ends at the first peak after its start
+    peaks = np.flatnonzero(at_peak)
+    next_peak = np.searchsorted(peaks, starts, side='right')
+    ends = np.full(len(starts), len(drawdown) - 1)
+    recovered = next_peak < len(peaks)
+    ends[recovered] = peaks[next_peak[recovered]]
+
+    durations = np.asarray((index[ends] - index[starts]).days)
+    return int(durations.max()), int(durations.sum()) / len(durations)
+
+
 def print_results(results: dict, detailed: bool = True) -> None:
     """
     Prints the backtest results in a nicely formatted way.
@@ -32,5 +32,6 @@ from .ult import ult
 from .vor import vor
 from .wad import wad
 from .wil import wil
+from .streaming import RSIState, STOState, MACState, CCIState, ROCState, WILState, TSIState, PPOState, ULTState
 
 __all__ = ['awo', 'bop', 'cci', 'cmo', 'cog', 'crs', 'dpo', 'eri', 'fis', 'imi', 'kst', 'lsi', 'mac', 'msi', 'pgo', 'ppo', 'psy', 'qst', 'roc', 'rmi', 'rsi', 'rvg', 'sri', 'stc', 'sto', 'tsi', 'ttm', 'ult', 'vor', 'wad', 'wil']
@@ -1,6 +1,8 @@
 import pandas as pd
 import numpy as np
 
+from ..kernels import rolling_window_apply
+
 
 def cci(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tuple:
     """
@@ -76,9 +78,10 @@ def cci(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tupl
     sma_tp = typical_price.rolling(window=window).mean()
     
     # Calculate the Mean Deviation
-    mean_deviation = typical_price.rolling(window=window).apply(
-        lambda x: np.mean(np.abs(x - np.mean(x)))
-    )
+    mean_deviation = pd.Series(rolling_window_apply(
+        typical_price.to_numpy(dtype=float), window,
+        lambda x: np.mean(np.abs(x - np.mean(x, axis=1, keepdims=True)), axis=1)
+    ), index=typical_price.index)
     
     # Avoid division by zero
     mean_deviation = mean_deviation.replace(0, np.nan)
@@ -1,6 +1,8 @@
 import numpy as np
 import pandas as pd
 
+from ..kernels import rolling_weighted_sum
+
 
 def cog(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tuple:
     """
@@ -57,17 +59,14 @@ def cog(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tupl
 
     series = df[close_col]
 
-    def _cog(values: np.ndarray) -> float:
-        if len(values) < window:
-            return np.nan
-        denom = values.sum()
-        if denom == 0:
-            return np.nan
-        weights = np.arange(1, len(values) + 1, dtype=float)
-        weighted_sum = (values[::-1] * weights).sum()
-        return -weighted_sum / denom + (len(values) + 1) / 2
-
-    cog_series = series.rolling(window=window, min_periods=window).apply(_cog, raw=True)
+    # Oldest price gets weight `window`, the most recent weight 1
+    values = series.to_numpy(dtype=float)
+    weighted_sum = rolling_weighted_sum(values, np.arange(window, 0, -1, dtype=float))
+    denom = rolling_weighted_sum(values, np.ones(window))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cog_values = np.where(denom == 0, np.nan, -weighted_sum / denom + (window + 1) / 2)
+
+    cog_series = pd.Series(cog_values, index=series.index)
     cog_series.name = f'COG_{window}'
 
     columns_list = [cog_series.name]
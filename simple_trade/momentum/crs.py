@@ -1,6 +1,8 @@
 import numpy as np
 import pandas as pd
 
+from ..kernels import price_direction, rolling_window_apply
+
 
 def crs(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tuple:
     """
@@ -89,58 +91,50 @@ def crs(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tupl
         # Handle edge cases: when avg_loss is 0, RSI should be 100 (all gains)
         # When avg_gain is 0, RSI should be 0 (all losses)
         # When both are 0, RSI should be 50 (neutral)
-        rsi_values = pd.Series(index=series.index, dtype=float)
-        for i in range(len(series)):
-            ag = avg_gain.iloc[i]
-            al = avg_loss.iloc[i]
-            if pd.isna(ag) or pd.isna(al):
-                rsi_values.iloc[i] = np.nan
-            elif al == 0 and ag == 0:
-                rsi_values.iloc[i] = 50.0  # Neutral when no movement
-            elif al == 0:
-                rsi_values.iloc[i] = 100.0  # All gains
-            else:
-                rs = ag / al
-                rsi_values.iloc[i] = 100 - (100 / (1 + rs))
-        return rsi_values
+        ag = avg_gain.to_numpy(dtype=float)
+        al = avg_loss.to_numpy(dtype=float)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rs = ag / al
+            rsi_values = np.select(
+                [np.isnan(ag) | np.isnan(al), (al == 0) & (ag == 0), al == 0],
+                [np.nan, 50.0, 100.0],  # Neutral when no movement, 100 when all gains
+                default=100 - (100 / (1 + rs))
+            )
+        return pd.Series(rsi_values, index=series.index)
 
     # Component 1: RSI of closing prices
     price_rsi = _rsi(close, rsi_window)
 
     # Component 2: RSI of streak length
-    delta = close.diff()
-    streak = pd.Series(0.0, index=close.index)
-    for i in range(1, len(close)):
-        if delta.iloc[i] > 0:
-            streak.iloc[i] = streak.iloc[i - 1] + 1 if streak.iloc[i - 1] > 0 else 1
-        elif delta.iloc[i] < 0:
-            streak.iloc[i] = streak.iloc[i - 1] - 1 if streak.iloc[i - 1] < 0 else -1
-        else:
-            streak.iloc[i] = 0
+    # Streak: number of consecutive up (positive) or down (negative) closes,
+    # i.e. the signed position within each run of equal price directions
+    direction = price_direction(close.to_numpy(dtype=float))
+    positions = np.arange(len(direction))
+    run_start = np.ones(len(direction), dtype=bool)
+    run_start[1:] = direction[1:] != direction[:-1]
+    run_start_position = np.maximum.accumulate(np.where(run_start, positions, 0))
+    streak = pd.Series((direction * (positions - run_start_position + 1)).astype(float), index=close.index)
     streak_rsi = _rsi(streak, streak_window)
 
     # Component 3: Percent rank of price change
     price_change = close.diff()
 
-    def _percent_rank(window_values):
-        valid = window_values[~pd.isna(window_values)]
-        if len(valid) < len(window_values) or len(valid) <= 1:
-            return np.nan
-        last = valid.iloc[-1]
-        less_count = (valid.iloc[:-1] < last).sum()
-        equal_count = (valid.iloc[:-1] == last).sum()
-        denom = len(valid) - 1
+    def _percent_rank(windows):
+        # Share of the previous values below the latest one, counting ties as half
+        denom = windows.shape[1] - 1
         if denom <= 0:
-            return np.nan
+            return np.full(len(windows), np.nan)
+        last = windows[:, -1:]
+        less_count = (windows[:, :-1] < last).sum(axis=1)
+        equal_count = (windows[:, :-1] == last).sum(axis=1)
         rank = (less_count + 0.5 * equal_count) / denom
         return rank * 100
 
-    percent_rank = price_change.rolling(window=rank_window, min_periods=rank_window).apply(
-        lambda x: _percent_rank(pd.Series(x)), raw=False
+    percent_rank = pd.Series(
+        rolling_window_apply(price_change.to_numpy(dtype=float), rank_window, _percent_rank),
+        index=close.index
     )
 
-    percent_rank = percent_rank.astype(float)
-
     crsi_values = (price_rsi + streak_rsi + percent_rank) / 3
     crsi_values.name = f'CRS_{rsi_window}_{streak_window}_{rank_window}'
 
@@ -69,26 +69,25 @@ def fis(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tupl
     normalized = 2 * ((median_price - lowest_low) / price_range - 0.5)
     normalized = normalized.clip(-0.999, 0.999)
 
-    fisher_values = pd.Series(index=df.index, dtype=float)
+    smoothed = _smooth_normalized(normalized.to_numpy(dtype=float, na_value=np.nan))
+    fisher_values = pd.Series(0.5 * np.log((1 + smoothed) / (1 - smoothed)), index=df.index)
     fisher_values.name = f'FIS_{window}'
 
-    prev_value = 0.0
+    columns_list = [fisher_values.name]
+    return fisher_values, columns_list
 
-    for idx in range(len(df)):
-        value = normalized.iat[idx]
-        if pd.isna(value):
-            fisher_values.iat[idx] = np.nan
-            continue
 
+def _smooth_normalized(normalized: np.ndarray) -> np.ndarray:
+    """Smooths the normalized price recursively, skipping missing bars, and clamps it to +/-0.999."""
+    out = np.full(len(normalized), np.nan)
+    prev_value = 0.0
+    for idx, value in enumerate(normalized.tolist()):
+        if value != value:
+            continue
         value = 0.33 * value + 0.67 * prev_value
-        value = max(min(value, 0.999), -0.999)
-
-        fisher = 0.5 * np.log((1 + value) / (1 - value))
-        fisher_values.iat[idx] = fisher
-        prev_value = value
-
-    columns_list = [fisher_values.name]
-    return fisher_values, columns_list
+        prev_value = max(min(value, 0.999), -0.999)
+        out[idx] = prev_value
+    return out
 
 
 def strategy_fis(
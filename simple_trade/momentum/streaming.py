@@ -0,0 +1,257 @@
+"""
+Streaming versions of momentum oscillators.
+
+Each state produces, one bar at a time, the values of the batch function of the
+same name (`RSIState` for `rsi`, ...). Updates are O(1) per bar except for CCI,
+whose mean absolute deviation depends on the mean of the current window and is
+recomputed over the window on every bar. See `simple_trade.indicator_state` for
+the common interface and for saving and restoring states.
+"""
+import math
+from collections import deque
+
+import numpy as np
+
+from ..indicator_state import (
+    ExponentialMean, IndicatorState, RollingExtreme, RollingSum, divide, window_parameter
+)
+
+
+def _nan_min(a: float, b: float) -> float:
+    """Minimum that skips NaN, like DataFrame.min(axis=1) over two columns."""
+    if a != a:
+        return b
+    if b != b:
+        return a
+    return min(a, b)
+
+
+def _nan_max(a: float, b: float) -> float:
+    """Maximum that skips NaN, like DataFrame.max(axis=1) over two columns."""
+    if a != a:
+        return b
+    if b != b:
+        return a
+    return max(a, b)
+
+
+class RSIState(IndicatorState):
+    """Streaming Relative Strength Index, equal to `rsi` with the same parameters."""
+
+    def __init__(self, parameters: dict = None, columns: dict = None):
+        super().__init__(parameters, columns)
+        self.window = window_parameter(self.parameters, 14)
+        self.names = [f'RSI_{self.window}']
+        self.prev_close = math.nan
+        self.gain = RollingSum(self.window)
+        self.loss = RollingSum(self.window)
+
+    def _step(self, close):
+        delta = close - self.prev_close
+        self.prev_close = close
+        # As in the batch version a missing change counts as 0, and a bar without
+        # a loss adds -0.0 to the losses
+        self.gain.update(delta if delta > 0 else 0.0)
+        self.loss.update(-(delta if delta < 0 else 0.0))
+        rs = divide(self.gain.mean(), self.loss.mean())
+        return 100 - divide(100, 1 + rs)
+
+
+class STOState(IndicatorState):
+    """Streaming Stochastic Oscillator, equal to `sto` with the same parameters."""
+
+    inputs = ('high_col', 'low_col', 'close_col')
+
+    def __init__(self, parameters: dict = None, columns: dict = None):
+        super().__init__(parameters, columns)
+        self.k_period = window_parameter(self.parameters, 14, 'k_window')
+        self.d_period = window_parameter(self.parameters, 3, 'd_window')
+        self.smooth_k = int(self.parameters.get('smooth_k', 3))
+        suffix = f'{self.k_period}_{self.d_period}_{self.smooth_k}'
+        self.names = [f'STO_K_{suffix}', f'STO_D_{suffix}']
+        self.lowest_low = RollingExtreme(self.k_period, largest=False)
+        self.highest_high = RollingExtreme(self.k_period)
+        self.k_mean = RollingSum(self.smooth_k) if self.smooth_k > 1 else None
+        self.d_mean = RollingSum(self.d_period)
+
+    def _step(self, high, low, close):
+        lowest_low = self.lowest_low.update(low)
+        highest_high = self.highest_high.update(high)
+        fast_k = 100 * divide(close - lowest_low, highest_high - lowest_low)
+        if self.k_mean is not None:
+            self.k_mean.update(fast_k)
+            k = self.k_mean.mean()
+        else:
+            k = fast_k
+        self.d_mean.update(k)
+        return dict(zip(self.names, (k, self.d_mean.mean())))
+
+
+class MACState(IndicatorState):
+    """Streaming MACD, equal to `mac` with the same parameters."""
+
+    def __init__(self, parameters: dict = None, columns: dict = None):
+        super().__init__(parameters, columns)
+        self.window_fast = window_parameter(self.parameters, 12, 'window_fast')
+        self.window_slow = window_parameter(self.parameters, 26, 'window_slow')
+        self.window_signal = window_parameter(self.parameters, 9, 'window_signal')
+        self.names = [
+            f'MAC_{self.window_fast}_{self.window_slow}',
+            f'Signal_{self.window_signal}',
+            f'Hist_{self.window_fast}_{self.window_slow}_{self.window_signal}',
+        ]
+        self.ema_fast = ExponentialMean.from_span(self.window_fast)
+        self.ema_slow = ExponentialMean.from_span(self.window_slow)
+        self.ema_signal = ExponentialMean.from_span(self.window_signal)
+
+    def _step(self, close):
+        mac_line = self.ema_fast.update(close) - self.ema_slow.update(close)
+        signal_line = self.ema_signal.update(mac_line)
+        return dict(zip(self.names, (mac_line, signal_line, mac_line - signal_line)))
+
+
+class CCIState(IndicatorState):
+    """Streaming Commodity Channel Index, equal to `cci` with the same parameters."""
+
+    inputs = ('high_col', 'low_col', 'close_col')
+
+    def __init__(self, parameters: dict = None, columns: dict = None):
+        super().__init__(parameters, columns)
+        self.window = window_parameter(self.parameters, 20)
+        self.constant = float(self.parameters.get('constant', 0.015))
+        self.names = [f'CCI_{self.window}_{self.constant}']
+        self.typical_prices = deque(maxlen=self.window)
+        self.sma = RollingSum(self.window)
+
+    def _step(self, high, low, close):
+        typical_price = (high + low + close) / 3
+        self.typical_prices.append(typical_price)
+        self.sma.update(typical_price)
+        sma_tp = self.sma.mean()
+        if sma_tp != sma_tp:
+            return math.nan
+
+        window = np.array(self.typical_prices)
+        mean_deviation = np.mean(np.abs(window - np.mean(window)))
+        if mean_deviation == 0:
+            return math.nan
+        return (typical_price - sma_tp) / (self.constant * float(mean_deviation))
+
+
+class ROCState(IndicatorState):
+    """Streaming Rate of Change, equal to `roc` with the same parameters."""
+
+    def __init__(self, parameters: dict = None, columns: dict = None):
+        super().__init__(parameters, columns)
+        self.window = window_parameter(self.parameters, 12)
+        self.names = [f'ROC_{self.window}']
+        self.closes = deque(maxlen=self.window + 1)
+
+    def _step(self, close):
+        self.closes.append(close)
+        if len(self.closes) <= self.window:
+            return math.nan
+        return (divide(close, self.closes[0]) - 1) * 100
+
+
+class WILState(IndicatorState):
+    """Streaming Williams %R, equal to `wil` with the same parameters."""
+
+    inputs = ('high_col', 'low_col', 'close_col')
+
+    def __init__(self, parameters: dict = None, columns: dict = None):
+        super().__init__(parameters, columns)
+        self.window = window_parameter(self.parameters, 14)
+        self.names = [f'WIL_{self.window}']
+        self.highest_high = RollingExtreme(self.window)
+        self.lowest_low = RollingExtreme(self.window, largest=False)
+
+    def _step(self, high, low, close):
+        highest_high = self.highest_high.update(high)
+        lowest_low = self.lowest_low.update(low)
+        range_value = highest_high - lowest_low
+        if range_value == 0:
+            return math.nan
+        return ((highest_high - close) / range_value) * -100
+
+
+class TSIState(IndicatorState):
+    """Streaming True Strength Index, equal to `tsi` with the same parameters."""
+
+    def __init__(self, parameters: dict = None, columns: dict = None):
+        super().__init__(parameters, columns)
+        self.slow = int(self.parameters.get('slow', 25))
+        self.fast = int(self.parameters.get('fast', 13))
+        self.names = [f'TSI_{self.slow}_{self.fast}']
+        self.prev_close = math.nan
+        self.momentum = self._double_ema()
+        self.abs_momentum = self._double_ema()
+
+    def _double_ema(self) -> list:
+        return [ExponentialMean.from_span(self.slow, min_periods=self.slow),
+                ExponentialMean.from_span(self.fast, min_periods=self.slow + self.fast - 1)]
+
+    def _step(self, close):
+        momentum = close - self.prev_close
+        self.prev_close = close
+        first, second = self.momentum
+        smoothed_momentum = second.update(first.update(momentum))
+        first, second = self.abs_momentum
+        smoothed_abs_momentum = second.update(first.update(abs(momentum)))
+        if smoothed_abs_momentum == 0:
+            return math.nan
+        return 100 * smoothed_momentum / smoothed_abs_momentum
+
+
+class PPOState(IndicatorState):
+    """Streaming Percentage Price Oscillator, equal to `ppo` with the same parameters."""
+
+    def __init__(self, parameters: dict = None, columns: dict = None):
+        super().__init__(parameters, columns)
+        self.fast_window = window_parameter(self.parameters, 12, 'fast_window')
+        self.slow_window = window_parameter(self.parameters, 26, 'slow_window')
+        self.signal_window = window_parameter(self.parameters, 9, 'signal_window')
+        self.names = [f'PPO_{self.fast_window}_{self.slow_window}', f'PPO_SIG_{self.signal_window}', 'PPO_HIST']
+        self.ema_fast = ExponentialMean.from_span(self.fast_window)
+        self.ema_slow = ExponentialMean.from_span(self.slow_window)
+        self.ema_signal = ExponentialMean.from_span(self.signal_window)
+
+    def _step(self, close):
+        ema_fast = self.ema_fast.update(close)
+        ema_slow = self.ema_slow.update(close)
+        ppo_line = divide(ema_fast - ema_slow, ema_slow) * 100
+        signal_line = self.ema_signal.update(ppo_line)
+        return dict(zip(self.names, (ppo_line, signal_line, ppo_line - signal_line)))
+
+
+class ULTState(IndicatorState):
+    """Streaming Ultimate Oscillator, equal to `ult` with the same parameters."""
+
+    inputs = ('high_col', 'low_col', 'close_col')
+
+    def __init__(self, parameters: dict = None, columns: dict = None):
+        super().__init__(parameters, columns)
+        self.short_window = window_parameter(self.parameters, 7, 'short_window')
+        self.medium_window = window_parameter(self.parameters, 14, 'medium_window')
+        self.long_window = window_parameter(self.parameters, 28, 'long_window')
+        self.names = [f'ULT_{self.short_window}_{self.medium_window}_{self.long_window}']
+        self.prev_close = math.nan
+        windows = (self.short_window, self.medium_window, self.long_window)
+        self.buying_pressure = [RollingSum(window) for window in windows]
+        self.true_range = [RollingSum(window) for window in windows]
+
+    def _step(self, high, low, close):
+        min_low_close = _nan_min(low, self.prev_close)
+        max_high_close = _nan_max(high, self.prev_close)
+        self.prev_close = close
+        buying_pressure = close - min_low_close
+        true_range = max_high_close - min_low_close
+
+        averages = []
+        for bp_sum, tr_sum in zip(self.buying_pressure, self.true_range):
+            bp_sum.update(buying_pressure)
+            tr_sum.update(true_range)
+            total_range = tr_sum.sum()
+            averages.append(bp_sum.sum() / total_range if total_range != 0 else math.nan)
+        avg_short, avg_medium, avg_long = averages
+        return 100 * ((4 * avg_short) + (2 * avg_medium) + avg_long) / 7
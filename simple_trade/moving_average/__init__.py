@@ -24,6 +24,7 @@ from .tt3 import tt3
 from .mam import mam
 from .evw import evw
 from .tsf import tsf
+from .streaming import SMAState, EMAState, WMAState, HMAState, TEMState, AMAState
 
 __all__ = [
     'sma', 'ema', 'wma', 'hma', 'soa', 'ama', 'tma', 'fma', 'gma', 'jma', 'zma',
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 
@@ -60,38 +61,10 @@ def ads(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tupl
 
     series = df[close_col].copy()
     
-    # Initialize ADSMA with first value
-    adsma = pd.Series(index=series.index, dtype=float)
-    adsma.iloc[0] = series.iloc[0]
-    
-    # Calculate adaptive EMA with dynamic alpha based on price changes
-    for i in range(1, len(series)):
-        if pd.notna(series.iloc[i]) and pd.notna(adsma.iloc[i-1]):
-            # Calculate price change ratio
-            price_change = abs(series.iloc[i] - adsma.iloc[i-1]) / (adsma.iloc[i-1] + 1e-10)
-            
-            # Scale by sensitivity
-            scaled_change = price_change * sensitivity
-            
-            # Convert to alpha: larger changes = higher alpha (more responsive)
-            # Smaller changes = lower alpha (more smoothing)
-            base_alpha = 2.0 / (window + 1)  # Base EMA alpha
-            
-            # Adaptive multiplier: ranges from 1.0 (no change) to higher values (large changes)
-            # Use a bounded multiplier to prevent convergence of different windows
-            adaptive_multiplier = 1.0 + scaled_change
-            
-            # Calculate adaptive alpha with bounds that respect the window parameter
-            # Min bound: half of base alpha (more smoothing during consolidation)
-            # Max bound: 3x base alpha or 0.9, whichever is smaller (prevents hitting 1.0 too easily)
-            adaptive_alpha = base_alpha * adaptive_multiplier
-            adaptive_alpha = max(adaptive_alpha, base_alpha * 0.5)
-            adaptive_alpha = min(adaptive_alpha, min(base_alpha * 3.0, 0.9))
-            
-            # Apply adaptive EMA formula
-            adsma.iloc[i] = adaptive_alpha * series.iloc[i] + (1 - adaptive_alpha) * adsma.iloc[i-1]
-        else:
-            adsma.iloc[i] = series.iloc[i]
+    # The smoothing factor depends on the distance from the previous ADSMA value,
+    # so the recursion is evaluated bar by bar
+    adsma = pd.Series(_adaptive_sensitivity_ema(series.to_numpy(dtype=float), window, sensitivity),
+                      index=series.index)
     
     adsma.name = f'ADS_{window}'
     
@@ -99,6 +72,33 @@ def ads(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tupl
     return adsma, columns_list
 
 
+def _adaptive_sensitivity_ema(values: np.ndarray, window: int, sensitivity: float) -> np.ndarray:
+    """Runs the ADSMA recursion over Python floats, starting from the first value."""
+    out = np.full(len(values), np.nan)
+    if len(values) == 0:
+        return out
+
+    # Base EMA alpha and the bounds that respect the window parameter
+    base_alpha = 2.0 / (window + 1)
+    min_alpha = base_alpha * 0.5
+    max_alpha = min(base_alpha * 3.0, 0.9)
+
+    prev = values[0]
+    out[0] = prev
+    for i, price in enumerate(values[1:].tolist(), 1):
+        if price == price and prev == prev:
+            # Larger price changes relative to the average give a higher alpha
+            price_change = abs(price - prev) / (prev + 1e-10)
+            adaptive_alpha = base_alpha * (1.0 + price_change * sensitivity)
+            adaptive_alpha = max(adaptive_alpha, min_alpha)
+            adaptive_alpha = min(adaptive_alpha, max_alpha)
+            prev = adaptive_alpha * price + (1 - adaptive_alpha) * prev
+        else:
+            prev = price
+        out[i] = prev
+    return out
+
+
 def strategy_ads(
     data: pd.DataFrame,
     parameters: dict = None,
@@ -2,6 +2,8 @@ import math
 import numpy as np
 import pandas as pd
 
+from ..kernels import rolling_weighted_sum
+
 
 def alm(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tuple:
     """
@@ -76,10 +78,7 @@ def alm(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tupl
     weights = np.array(w)
     weights = weights / weights.sum()  # Normalize
 
-    def weighted_avg(x):
-        return np.dot(x, weights)
-
-    alma_series = series.rolling(window=window).apply(weighted_avg, raw=True)
+    alma_series = pd.Series(rolling_weighted_sum(series.to_numpy(dtype=float), weights), index=series.index)
     alma_series.name = f'ALM_{window}'
 
     columns_list = [alma_series.name]
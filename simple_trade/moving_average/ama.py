@@ -1,6 +1,8 @@
 import numpy as np
 import pandas as pd
 
+from ..kernels import adaptive_ema
+
 
 def ama(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tuple:
     """
@@ -72,24 +74,9 @@ def ama(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tupl
     slow_sc = 2 / (slow_period + 1)
     smoothing_constant = (er * (fast_sc - slow_sc) + slow_sc) ** 2
 
-    values = close.to_numpy(dtype=float)
-    sc_values = smoothing_constant.to_numpy(dtype=float)
-    ama_values = np.full_like(values, np.nan)
-
-    valid_idx = np.where(~np.isnan(values))[0]
-    if valid_idx.size:
-        start = valid_idx[0]
-        ama_values[start] = values[start]
-        for i in range(start + 1, len(values)):
-            previous = ama_values[i - 1]
-            price = values[i]
-            sc = sc_values[i]
-            if np.isnan(price):
-                ama_values[i] = previous
-                continue
-            if np.isnan(sc):
-                sc = 0.0
-            ama_values[i] = previous + sc * (price - previous)
+    # Seeded with the first valid price; bars without a price or smoothing constant
+    # hold the previous value
+    ama_values = adaptive_ema(close.to_numpy(dtype=float), smoothing_constant.to_numpy(dtype=float))
 
     ama_series = pd.Series(ama_values, index=close.index,
                            name=f'AMA_{er_window}_{fast_period}_{slow_period}')
@@ -1,5 +1,8 @@
+import numpy as np
 import pandas as pd
 
+from ..kernels import adaptive_ema
+
 
 def evw(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tuple:
     """
@@ -63,20 +66,15 @@ def evw(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tupl
     # Calculate rolling sum of volume
     vol_sum = volume.rolling(window=window, min_periods=1).sum()
 
-    # Initialize EVWMA
-    evwma = pd.Series(index=price.index, dtype=float)
-    evwma.iloc[0] = price.iloc[0]
-
-    for i in range(1, len(price)):
-        if pd.notna(price.iloc[i]) and pd.notna(volume.iloc[i]) and vol_sum.iloc[i] > 0:
-            # Calculate adaptive alpha based on volume ratio
-            alpha = volume.iloc[i] / vol_sum.iloc[i]
-            alpha = min(max(alpha, 0.01), 1.0)  # Bound alpha
+    # Calculate adaptive alpha based on volume ratio; bars without volume keep the previous value
+    volume_values = volume.to_numpy(dtype=float)
+    vol_sum_values = vol_sum.to_numpy(dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        alpha = np.where(vol_sum_values > 0, volume_values / vol_sum_values, np.nan)
+    alpha = np.clip(alpha, 0.01, 1.0)  # Bound alpha
 
-            prev_evwma = evwma.iloc[i-1] if pd.notna(evwma.iloc[i-1]) else price.iloc[i]
-            evwma.iloc[i] = alpha * price.iloc[i] + (1 - alpha) * prev_evwma
-        else:
-            evwma.iloc[i] = evwma.iloc[i-1] if pd.notna(evwma.iloc[i-1]) else price.iloc[i]
+    # Initialize EVWMA with the first price
+    evwma = pd.Series(adaptive_ema(price.to_numpy(dtype=float), alpha, start=0), index=price.index)
 
     evwma.name = f'EVW_{window}'
 
@@ -1,6 +1,9 @@
 import math
 import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+from ..kernels import adaptive_ema
 
 
 def fma(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tuple:
@@ -73,8 +76,9 @@ def fma(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tupl
     frama_values[start_idx] = values[start_idx]
 
     half_window = max(1, window // 2)
+    warmup_end = min(n, start_idx + window)
 
-    for i in range(start_idx + 1, n):
+    for i in range(start_idx + 1, warmup_end):
         price = values[i]
         prev = frama_values[i - 1]
 
@@ -82,51 +86,46 @@ def fma(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tupl
             frama_values[i] = prev
             continue
 
-        if i < start_idx + window:
-            # Use simple moving average during warmup period
-            lookback = min(i - start_idx + 1, window)
-            warmup_slice = values[max(0, i - lookback + 1):i + 1]
-            warmup_slice = warmup_slice[~np.isnan(warmup_slice)]
-            if warmup_slice.size > 0:
-                frama_values[i] = warmup_slice.mean()
-            else:
-                frama_values[i] = price if np.isnan(prev) else prev
-            continue
+        # Use simple moving average during warmup period
+        lookback = min(i - start_idx + 1, window)
+        warmup_slice = values[max(0, i - lookback + 1):i + 1]
+        warmup_slice = warmup_slice[~np.isnan(warmup_slice)]
+        if warmup_slice.size > 0:
+            frama_values[i] = warmup_slice.mean()
+        else:
+            frama_values[i] = price if np.isnan(prev) else prev
 
-        dimension = _fractal_dimension(values, i, window, half_window)
-        alpha = math.exp(-4.6 * (dimension - 1))
-        alpha = min(max(alpha, alpha_floor), 1.0)
+    if warmup_end < n:
+        dimension = np.full(n, np.nan)
+        dimension[window - 1:] = _fractal_dimension(values, window, half_window)
+        alpha = np.exp(-4.6 * (dimension - 1))
+        alpha = np.minimum(np.maximum(alpha, alpha_floor), 1.0)
 
-        if np.isnan(prev):
-            frama_values[i] = price
-        else:
-            frama_values[i] = alpha * price + (1 - alpha) * prev
+        # Continue from the last warmup value with the fractal-adaptive alpha
+        seed_idx = warmup_end - 1
+        frama_values[seed_idx:] = adaptive_ema(values, alpha, seed_idx, frama_values[seed_idx])[seed_idx:]
 
     frama_series = pd.Series(frama_values, index=close.index, name=f'FMA_{window}')
     return frama_series, [frama_series.name]
 
 
-def _fractal_dimension(values: np.ndarray, idx: int, window: int, half_window: int) -> float:
-    start = idx - window + 1
-    window_slice = values[start: idx + 1]
-    first_slice = window_slice[:half_window]
-    second_slice = window_slice[half_window: half_window * 2]
-
-    def _range(data: np.ndarray) -> float:
-        data = data[~np.isnan(data)]
-        if data.size == 0:
-            return 0.0
-        return data.max() - data.min()
+def _fractal_dimension(values: np.ndarray, window: int, half_window: int) -> np.ndarray:
+    """Fractal dimension of every trailing window of `window` values, ignoring NaNs."""
+    windows = sliding_window_view(values, window)
 
-    n1 = _range(first_slice) / half_window if half_window else 0.0
-    n2 = _range(second_slice) / half_window if half_window else 0.0
-    n3 = _range(window_slice) / window if window else 0.0
+    def _range(data: np.ndarray) -> np.ndarray:
+        # Windows without any values have a range of zero
+        value_range = np.fmax.reduce(data, axis=1) - np.fmin.reduce(data, axis=1)
+        return np.where(np.isnan(value_range), 0.0, value_range)
 
-    if n3 <= 0 or (n1 + n2) <= 0:
-        return 1.0
+    n1 = _range(windows[:, :half_window]) / half_window
+    n2 = _range(windows[:, half_window:half_window * 2]) / half_window
+    n3 = _range(windows) / window
 
-    dimension = (math.log(n1 + n2) - math.log(n3)) / math.log(2)
-    return min(max(dimension, 1.0), 2.0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        dimension = (np.log(n1 + n2) - np.log(n3)) / math.log(2)
+    dimension = np.minimum(np.maximum(dimension, 1.0), 2.0)
+    return np.where((n3 <= 0) | ((n1 + n2) <= 0), 1.0, dimension)
 
 
 def strategy_fma(
@@ -1,6 +1,7 @@
-import numpy as np
 import pandas as pd
 
+from ..rolling_regression import rolling_regression
+
 
 def lsm(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tuple:
     """
@@ -54,30 +55,8 @@ def lsm(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tupl
 
     series = df[close_col]
 
-    def linear_regression_forecast(x):
-        """Calculate the forecast value from linear regression."""
-        if len(x) < 2:
-            return np.nan
-        
-        # Create time index
-        t = np.arange(len(x))
-        
-        # Calculate linear regression coefficients
-        # y = a + b*t
-        n = len(x)
-        sum_t = np.sum(t)
-        sum_x = np.sum(x)
-        sum_tx = np.sum(t * x)
-        sum_t2 = np.sum(t * t)
-        
-        # Calculate slope (b) and intercept (a)
-        b = (n * sum_tx - sum_t * sum_x) / (n * sum_t2 - sum_t * sum_t)
-        a = (sum_x - b * sum_t) / n
-        
-        # Return forecast for the next point (end of window)
-        return a + b * (n - 1)
-
-    lsma_series = series.rolling(window=window).apply(linear_regression_forecast, raw=True)
+    # Value of the least-squares line at the end of each window
+    lsma_series = rolling_regression(series, window)['endpoint']
     lsma_series.name = f'LSM_{window}'
 
     columns_list = [lsma_series.name]
@@ -1,6 +1,8 @@
 import numpy as np
 import pandas as pd
 
+from ..kernels import adaptive_ema, hilbert_transform
+
 
 def mam(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tuple:
     """
@@ -14,11 +16,14 @@ def mam(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tupl
         parameters (dict, optional): Dictionary containing calculation parameters:
             - fast_limit (float): Fast limit for alpha. Default is 0.5.
             - slow_limit (float): Slow limit for alpha. Default is 0.05.
+            - include_cycle (bool): Also return the dominant cycle period and phase
+              measured by the Hilbert transform as MAM_PERIOD and MAM_PHASE. Default is False.
         columns (dict, optional): Dictionary containing column name mappings:
             - close_col (str): The column name for closing prices. Default is 'Close'.
 
     Returns:
-        tuple: A tuple containing a DataFrame with MAM and FAMA columns, and a list of column names.
+        tuple: A tuple containing a DataFrame with MAM and FAMA columns (plus the cycle
+        columns if requested), and a list of column names.
 
     The mam is calculated as follows:
 
@@ -48,110 +53,46 @@ def mam(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tupl
     fast_limit = float(parameters.get('fast_limit', 0.5))
     slow_limit = float(parameters.get('slow_limit', 0.05))
 
-    price = df[close_col].values
+    include_cycle = bool(parameters.get('include_cycle', False))
+
+    price = df[close_col].to_numpy(dtype=float)
     n = len(price)
 
-    # Initialize arrays
-    smooth = np.zeros(n)
-    detrender = np.zeros(n)
-    i1 = np.zeros(n)
-    q1 = np.zeros(n)
-    ji = np.zeros(n)
-    jq = np.zeros(n)
-    i2 = np.zeros(n)
-    q2 = np.zeros(n)
-    re = np.zeros(n)
-    im = np.zeros(n)
-    period = np.zeros(n)
-    smooth_period = np.zeros(n)
-    phase = np.zeros(n)
-    mama = np.zeros(n)
-    fama = np.zeros(n)
-
-    # Handle initial values
-    # Initialize with price to avoid startup artifacts
-    mama[:6] = price[:6]
-    fama[:6] = price[:6]
-    smooth[:6] = price[:6]
-    period[:6] = 10.0
-    smooth_period[:6] = 10.0
-
-    # Hilbert Transform constants
-    for i in range(6, n):
-        # Smooth price
-        smooth[i] = (4 * price[i] + 3 * price[i-1] + 2 * price[i-2] + price[i-3]) / 10.0
-
-        # Compute Detrender
-        detrender[i] = (0.0962 * smooth[i] + 0.5769 * smooth[i-2] -
-                       0.5769 * smooth[i-4] - 0.0962 * smooth[i-6]) * (0.075 * period[i-1] + 0.54)
-
-        # Compute InPhase and Quadrature components
-        q1[i] = (0.0962 * detrender[i] + 0.5769 * detrender[i-2] -
-                0.5769 * detrender[i-4] - 0.0962 * detrender[i-6]) * (0.075 * period[i-1] + 0.54)
-        i1[i] = detrender[i-3]
-
-        # Advance the phase of I1 and Q1 by 90 degrees
-        ji[i] = (0.0962 * i1[i] + 0.5769 * i1[i-2] -
-                0.5769 * i1[i-4] - 0.0962 * i1[i-6]) * (0.075 * period[i-1] + 0.54)
-        jq[i] = (0.0962 * q1[i] + 0.5769 * q1[i-2] -
-                0.5769 * q1[i-4] - 0.0962 * q1[i-6]) * (0.075 * period[i-1] + 0.54)
-
-        # Phasor addition for 3-bar averaging
-        i2[i] = i1[i] - jq[i]
-        q2[i] = q1[i] + ji[i]
-
-        # Smooth the I and Q components before applying the discriminator
-        i2[i] = 0.2 * i2[i] + 0.8 * i2[i-1]
-        q2[i] = 0.2 * q2[i] + 0.8 * q2[i-1]
-
-        # Homodyne Discriminator
-        re[i] = i2[i] * i2[i-1] + q2[i] * q2[i-1]
-        im[i] = i2[i] * q2[i-1] - q2[i] * i2[i-1]
-        re[i] = 0.2 * re[i] + 0.8 * re[i-1]
-        im[i] = 0.2 * im[i] + 0.8 * im[i-1]
-
-        if im[i] != 0 and re[i] != 0:
-            period[i] = 2 * np.pi / np.arctan(im[i] / re[i])
-        if period[i] > 1.5 * period[i-1]:
-            period[i] = 1.5 * period[i-1]
-        if period[i] < 0.67 * period[i-1]:
-            period[i] = 0.67 * period[i-1]
-        if period[i] < 6:
-            period[i] = 6
-        if period[i] > 50:
-            period[i] = 50
-        period[i] = 0.2 * period[i] + 0.8 * period[i-1]
-        smooth_period[i] = 0.33 * period[i] + 0.67 * smooth_period[i-1]
-
-        # Compute Phase
-        if i1[i] != 0:
-            phase[i] = np.degrees(np.arctan(q1[i] / i1[i]))
-
-        # Compute DeltaPhase
-        delta_phase = phase[i-1] - phase[i]
-        if delta_phase < 1:
-            delta_phase = 1
-
-        # Compute Alpha
-        alpha = fast_limit / delta_phase
-        if alpha < slow_limit:
-            alpha = slow_limit
-        if alpha > fast_limit:
-            alpha = fast_limit
-
-        # Compute MAMA and FAMA
-        mama[i] = alpha * price[i] + (1 - alpha) * mama[i-1]
-        fama[i] = 0.5 * alpha * mama[i] + (1 - 0.5 * alpha) * fama[i-1]
-
-    # Handle initial values
-    # (Moved to before loop)
+    # Dominant cycle and phase from the Hilbert transform
+    hilbert = hilbert_transform(price)
+    phase = hilbert['phase']
+
+    # Alpha from the phase rate of change (DeltaPhase), limited to [slow_limit, fast_limit]
+    alpha = np.full(n, np.nan)
+    if n > 6:
+        delta_phase = phase[5:-1] - phase[6:]
+        delta_phase = np.where(delta_phase < 1, 1.0, delta_phase)
+        alpha[6:] = fast_limit / delta_phase
+        alpha = np.where(alpha < slow_limit, slow_limit, alpha)
+        alpha = np.where(alpha > fast_limit, fast_limit, alpha)
+
+    # Compute MAMA and FAMA, initialized with price to avoid startup artifacts
+    mama = price.copy()
+    fama = price.copy()
+    if n > 6:
+        mama[6:] = adaptive_ema(price, alpha, 5, price[5])[6:]
+        fama[6:] = adaptive_ema(mama, 0.5 * alpha, 5, price[5])[6:]
+        # A missing price leaves the Hilbert transform undefined from then on
+        undefined = np.isnan(alpha)
+        undefined[:6] = False
+        mama[undefined] = np.nan
+        fama[undefined] = np.nan
 
     result_df = pd.DataFrame({
         'MAM': mama,
         'MAM_FAMA': fama
     }, index=df.index)
 
-    columns_list = ['MAM', 'MAM_FAMA']
+    if include_cycle:
+        result_df['MAM_PERIOD'] = hilbert['period']
+        result_df['MAM_PHASE'] = phase
+
+    columns_list = list(result_df.columns)
     return result_df, columns_list
 
 
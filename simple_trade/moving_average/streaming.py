@@ -0,0 +1,136 @@
+"""
+Streaming versions of moving averages.
+
+Each state produces, one bar at a time and in O(1) per bar, the values of the
+batch function of the same name (`SMAState` for `sma`, ...). See
+`simple_trade.indicator_state` for the common interface.
+"""
+import math
+from collections import deque
+
+from ..indicator_state import (
+    ExponentialMean, IndicatorState, RollingSum, RollingWeightedMean, divide, window_parameter
+)
+
+
+class SMAState(IndicatorState):
+    """Streaming Simple Moving Average, equal to `sma` with the same parameters."""
+
+    def __init__(self, parameters: dict = None, columns: dict = None):
+        super().__init__(parameters, columns)
+        self.window = window_parameter(self.parameters, 20)
+        self.names = [f'SMA_{self.window}']
+        self.rolling = RollingSum(self.window)
+
+    def _step(self, close):
+        self.rolling.update(close)
+        return self.rolling.mean()
+
+
+class EMAState(IndicatorState):
+    """Streaming Exponential Moving Average, equal to `ema` with the same parameters."""
+
+    def __init__(self, parameters: dict = None, columns: dict = None):
+        super().__init__(parameters, columns)
+        self.window = window_parameter(self.parameters, 20)
+        self.names = [f'EMA_{self.window}']
+        self.ema = ExponentialMean.from_span(self.window)
+
+    def _step(self, close):
+        return self.ema.update(close)
+
+
+class WMAState(IndicatorState):
+    """
+    Streaming Weighted Moving Average, equal to `wma` with the same parameters up
+    to rounding (the batch function sums each window directly).
+    """
+
+    def __init__(self, parameters: dict = None, columns: dict = None):
+        super().__init__(parameters, columns)
+        self.window = window_parameter(self.parameters, 20)
+        self.names = [f'WMA_{self.window}']
+        self.wma = RollingWeightedMean(self.window)
+
+    def _step(self, close):
+        return self.wma.update(close)
+
+
+class HMAState(IndicatorState):
+    """
+    Streaming Hull Moving Average, equal to `hma` with the same parameters up to
+    rounding: WMA(2 * WMA(n/2) - WMA(n), sqrt(n)).
+    """
+
+    def __init__(self, parameters: dict = None, columns: dict = None):
+        super().__init__(parameters, columns)
+        self.window = window_parameter(self.parameters, 20)
+        self.names = [f'HMA_{self.window}']
+        self.wma_half = RollingWeightedMean(int(self.window / 2))
+        self.wma_full = RollingWeightedMean(self.window)
+        self.wma_sqrt = RollingWeightedMean(int(math.sqrt(self.window)))
+
+    def _step(self, close):
+        raw = 2 * self.wma_half.update(close) - self.wma_full.update(close)
+        return self.wma_sqrt.update(raw)
+
+
+class TEMState(IndicatorState):
+    """Streaming Triple Exponential Moving Average, equal to `tem` with the same parameters."""
+
+    def __init__(self, parameters: dict = None, columns: dict = None):
+        super().__init__(parameters, columns)
+        self.window = window_parameter(self.parameters, 20)
+        self.names = [f'TEM_{self.window}']
+        self.ema1 = ExponentialMean.from_span(self.window)
+        self.ema2 = ExponentialMean.from_span(self.window)
+        self.ema3 = ExponentialMean.from_span(self.window)
+
+    def _step(self, close):
+        ema1 = self.ema1.update(close)
+        ema2 = self.ema2.update(ema1)
+        ema3 = self.ema3.update(ema2)
+        return 3 * ema1 - 3 * ema2 + ema3
+
+
+class AMAState(IndicatorState):
+    """Streaming Kaufman Adaptive Moving Average, equal to `ama` with the same parameters."""
+
+    def __init__(self, parameters: dict = None, columns: dict = None):
+        super().__init__(parameters, columns)
+        self.er_window = window_parameter(self.parameters, 10)
+        self.fast_period = int(self.parameters.get('fast_period', 2))
+        self.slow_period = int(self.parameters.get('slow_period', 30))
+        self.names = [f'AMA_{self.er_window}_{self.fast_period}_{self.slow_period}']
+        self.fast_sc = 2 / (self.fast_period + 1)
+        self.slow_sc = 2 / (self.slow_period + 1)
+        # The closes needed for the change over er_window bars
+        self.closes = deque(maxlen=self.er_window + 1)
+        self.volatility = RollingSum(self.er_window)
+        self.started = False
+        self.ama = math.nan
+
+    def _step(self, close):
+        prev_close = self.closes[-1] if self.closes else math.nan
+        self.closes.append(close)
+        self.volatility.update(abs(close - prev_close))
+
+        # Efficiency Ratio, zero while it is undefined
+        direction = abs(close - self.closes[0]) if len(self.closes) > self.er_window else math.nan
+        er = divide(direction, self.volatility.sum())
+        if er != er:
+            er = 0.0
+        # Squared by multiplication to match NumPy's ** 2; Python's float ** 2 can differ by an ulp
+        scale = er * (self.fast_sc - self.slow_sc) + self.slow_sc
+        smoothing_constant = scale * scale
+
+        if not self.started:
+            # Seeded with the first valid price
+            self.started = close == close
+            self.ama = close
+            return self.ama
+        if self.ama != self.ama:
+            self.ama = close
+        if close == close and smoothing_constant == smoothing_constant:
+            self.ama = smoothing_constant * close + (1 - smoothing_constant) * self.ama
+        return self.ama
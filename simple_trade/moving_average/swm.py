@@ -2,6 +2,8 @@ import math
 import numpy as np
 import pandas as pd
 
+from ..kernels import rolling_weighted_sum
+
 
 def swm(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tuple:
     """
@@ -68,10 +70,7 @@ def swm(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tupl
     weights = np.array(weights)
     weights = weights / weights.sum()  # Normalize
 
-    def weighted_avg(x):
-        return np.dot(x, weights)
-
-    swma_series = series.rolling(window=window).apply(weighted_avg, raw=True)
+    swma_series = pd.Series(rolling_weighted_sum(series.to_numpy(dtype=float), weights), index=series.index)
     swma_series.name = f'SWM_{window}'
 
     columns_list = [swma_series.name]
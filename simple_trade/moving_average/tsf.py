@@ -1,6 +1,7 @@
-import numpy as np
 import pandas as pd
 
+from ..rolling_regression import rolling_regression
+
 
 def tsf(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tuple:
     """
@@ -57,34 +58,8 @@ def tsf(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tupl
 
     series = df[close_col]
 
-    def time_series_forecast(x):
-        """Calculate the forecast value from linear regression."""
-        if len(x) < 2:
-            return np.nan
-
-        # Create time index
-        t = np.arange(len(x))
-
-        # Calculate linear regression coefficients
-        # y = a + b*t
-        n = len(x)
-        sum_t = np.sum(t)
-        sum_x = np.sum(x)
-        sum_tx = np.sum(t * x)
-        sum_t2 = np.sum(t * t)
-
-        denominator = n * sum_t2 - sum_t * sum_t
-        if denominator == 0:
-            return np.nan
-
-        # Calculate slope (b) and intercept (a)
-        b = (n * sum_tx - sum_t * sum_x) / denominator
-        a = (sum_x - b * sum_t) / n
-
-        # Return forecast for the next point (one period ahead)
-        return a + b * n
-
-    tsf_series = series.rolling(window=window).apply(time_series_forecast, raw=True)
+    # Value of the least-squares line one period past the end of each window
+    tsf_series = rolling_regression(series, window)['forecast']
     tsf_series.name = f'TSF_{window}'
 
     columns_list = [tsf_series.name]
@@ -1,6 +1,8 @@
 import numpy as np
 import pandas as pd
 
+from ..kernels import adaptive_ema
+
 
 def vid(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tuple:
     """
@@ -82,21 +84,20 @@ def vid(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tupl
 
     base_alpha = 2 / (window + 1)
 
-    vidya = pd.Series(np.nan, index=series.index)
-    prev_vidya = None
-
-    for idx, price in enumerate(series):
-        cmo_value = cmo.iat[idx]
-        if np.isnan(price) or np.isnan(cmo_value):
-            continue
+    prices = series.to_numpy(dtype=float)
+    alpha = base_alpha * np.abs(cmo.to_numpy(dtype=float)) / 100
 
-        alpha = base_alpha * abs(cmo_value) / 100
-        if prev_vidya is None:
-            prev_vidya = price
+    # The first valid bar is smoothed against its own price
+    valid_idx = np.flatnonzero(~np.isnan(prices) & ~np.isnan(alpha))
+    vid_values = np.full(len(prices), np.nan)
+    if valid_idx.size:
+        start = valid_idx[0]
+        seed = alpha[start] * prices[start] + (1 - alpha[start]) * prices[start]
+        vid_values = adaptive_ema(prices, alpha, start, seed)
+        # Bars without a price carry the average forward but are not reported
+        vid_values[np.isnan(prices) | np.isnan(alpha)] = np.nan
 
-        vid_value = alpha * price + (1 - alpha) * prev_vidya
-        vidya.iat[idx] = vid_value
-        prev_vidya = vid_value
+    vidya = pd.Series(vid_values, index=series.index)
 
     name = f'VID_{window}_{cmo_window}'
     vidya.name = name
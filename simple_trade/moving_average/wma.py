@@ -1,6 +1,8 @@
 import pandas as pd
 import numpy as np
 
+from ..kernels import rolling_weighted_sum
+
 
 def wma(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tuple:
     """
@@ -54,7 +56,7 @@ def wma(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tupl
     
     series = df[close_col]
     weights = np.arange(1, window + 1)
-    series = series.rolling(window).apply(lambda prices: np.dot(prices, weights) / weights.sum(), raw=True)
+    series = pd.Series(rolling_weighted_sum(series.to_numpy(dtype=float), weights) / weights.sum(), index=series.index)
     series.name = f'WMA_{window}'
     columns = [series.name]
     return series, columns
@@ -4,7 +4,11 @@ Optimizer functions for trading strategy parameter optimization.
 This module provides function-based implementations for optimizing trading
 strategy parameters, replacing the class-based Optimizer approach.
 """
+import csv
+import heapq
+import inspect
 import itertools
+import math
 import time
 import os
 from typing import Callable, Dict, List, Any, Tuple, Optional
@@ -13,6 +17,11 @@ import pandas as pd
 import numpy as np
 from joblib import Parallel, delayed
 
+from .shared_data import SharedFrame
+
+# joblib >= 1.3 can hand results back as they complete instead of as one list
+_PARALLEL_RETURNS_GENERATOR = 'return_as' in inspect.signature(Parallel).parameters
+
 
 def custom_optimizer(
     backtest_func: Callable,
@@ -23,6 +32,11 @@ def custom_optimizer(
     maximize_metric: bool = True,
     parallel: bool = True,
     n_jobs: int = -1,
+    shared_memory: bool = False,
+    stream: bool = False,
+    batch_size: int = 64,
+    top_k: int = 100,
+    results_path: Optional[str] = None,
 ) -> Tuple[Optional[Dict[str, Any]], float, List[Tuple[Dict[str, Any], float]]]:
     """
     Optimizes trading strategy parameters by iterating through combinations
@@ -42,12 +56,25 @@ def custom_optimizer(
         parallel: If True, run backtests in parallel using joblib.
         n_jobs: Number of CPU cores to use for parallel processing.
                -1 means using all available cores.
+        shared_memory: If True and running in parallel, publish `data` once to shared
+                      memory and let workers read it through zero-copy, read-only views
+                      instead of pickling the DataFrame for every combination. Off by
+                      default because `backtest_func` may modify `data` values in place,
+                      which raises a ValueError with shared data.
+        stream: If True, iterate the parameter grid lazily instead of building every
+               combination up front, run `batch_size` combinations per task and keep
+               only the `top_k` best results in memory. Intended for very large grids.
+        batch_size: Number of combinations evaluated per task in streaming mode.
+        top_k: Number of best results kept in streaming mode.
+        results_path: Optional CSV file that receives one row per combination
+                     (parameters and metric value) in streaming mode.
 
     Returns:
         tuple: A tuple containing:
             - best_params: Dictionary of the best parameters found, or None if no valid results.
             - best_metric_value: The best metric value achieved.
             - all_results: List of (params, metric_value) tuples for all combinations tested.
+                          In streaming mode, only the `top_k` best valid results, best first.
 
     Example:
         >>> param_grid = {
@@ -69,6 +96,12 @@ def custom_optimizer(
     
     if constant_params is None:
         constant_params = {}
+
+    if stream:
+        return _stream_optimizer(
+            backtest_func, data, param_grid, metric_to_optimize, constant_params,
+            maximize_metric, parallel, n_jobs, shared_memory, batch_size, top_k, results_path
+        )
     
     # Generate all parameter combinations
     parameter_combinations = _generate_parameter_combinations(param_grid)
@@ -79,21 +112,24 @@ def custom_optimizer(
     print(f"Metric: {metric_to_optimize} ({'Maximize' if maximize_metric else 'Minimize'}) | Parallel: {parallel}{f' (n_jobs={n_jobs})' if parallel else ''}")
 
     if parallel:
-        max_cores = os.cpu_count() or 1
-        if n_jobs == -1 or n_jobs > max_cores:
-            n_jobs = max_cores
+        n_jobs = _resolve_n_jobs(n_jobs)
         print(f"Using {n_jobs} parallel jobs.")
 
-        results_list = Parallel(n_jobs=n_jobs, verbose=5)(
-            delayed(_run_single_backtest)(
-                params=param_combo,
-                backtest_func=backtest_func,
-                data=data,
-                metric_to_optimize=metric_to_optimize,
-                constant_params=constant_params
+        shared_data = SharedFrame(data) if shared_memory else None
+        try:
+            results_list = Parallel(n_jobs=n_jobs, verbose=5)(
+                delayed(_run_single_backtest)(
+                    params=param_combo,
+                    backtest_func=backtest_func,
+                    data=shared_data if shared_data is not None else data,
+                    metric_to_optimize=metric_to_optimize,
+                    constant_params=constant_params
+                )
+                for param_combo in parameter_combinations
             )
-            for param_combo in parameter_combinations
-        )
+        finally:
+            if shared_data is not None:
+                shared_data.close()
     else:
         results_list = []
         for i, param_combo in enumerate(parameter_combinations):
@@ -149,12 +185,173 @@ def _generate_parameter_combinations(param_grid: Dict[str, List[Any]]) -> List[D
     return param_dicts
 
 
-def _run_single_backtest(
-    params: Dict[str, Any],
+def _stream_optimizer(
     backtest_func: Callable,
     data: pd.DataFrame,
+    param_grid: Dict[str, List[Any]],
+    metric_to_optimize: str,
+    constant_params: Dict[str, Any],
+    maximize_metric: bool,
+    parallel: bool,
+    n_jobs: int,
+    shared_memory: bool,
+    batch_size: int,
+    top_k: int,
+    results_path: Optional[str],
+) -> Tuple[Optional[Dict[str, Any]], float, List[Tuple[Dict[str, Any], float]]]:
+    """
+    Streaming variant of custom_optimizer.
+
+    Combinations are generated lazily and submitted in batches, only a few batches per
+    worker ahead of the results being consumed, so memory use is bounded by that and the
+    top-K heap rather than the size of the grid.
+    Non-finite metric values (failed backtests) are written to the results file but
+    never enter the top-K results.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    if top_k < 1:
+        raise ValueError("top_k must be at least 1")
+
+    keys = list(param_grid.keys())
+    num_combinations = math.prod(len(values) for values in param_grid.values())
+    batches = _iter_parameter_batches(param_grid, batch_size)
+
+    start_time = time.time()
+    print(f"Starting streaming optimization for {num_combinations} combinations "
+          f"(batch_size={batch_size}, top_k={top_k})...")
+    print(f"Metric: {metric_to_optimize} ({'Maximize' if maximize_metric else 'Minimize'}) | Parallel: {parallel}{f' (n_jobs={n_jobs})' if parallel else ''}")
+
+    # Min-heap of (score, -sequence, params, metric_value): the root is the worst kept
+    # result, and among equal scores the earliest combination ranks highest.
+    heap = []
+    sequence = 0
+    processed = 0
+
+    sink_file = open(results_path, 'w', newline='') if results_path else None
+    writer = None
+    if sink_file is not None:
+        writer = csv.writer(sink_file)
+        writer.writerow(keys + [metric_to_optimize])
+
+    def consume(batch_results):
+        nonlocal sequence, processed
+        for params, metric_value in batch_results:
+            if writer is not None:
+                writer.writerow([params[k] for k in keys] + [metric_value])
+            sequence += 1
+            if not np.isfinite(metric_value):
+                continue
+            score = metric_value if maximize_metric else -metric_value
+            item = (score, -sequence, params, metric_value)
+            if len(heap) < top_k:
+                heapq.heappush(heap, item)
+            elif item[:2] > heap[0][:2]:
+                heapq.heapreplace(heap, item)
+        processed += len(batch_results)
+
+    try:
+        if parallel:
+            n_jobs = _resolve_n_jobs(n_jobs)
+            print(f"Using {n_jobs} parallel jobs.")
+
+            shared_data = SharedFrame(data) if shared_memory else None
+            task_data = shared_data if shared_data is not None else data
+            tasks = (
+                delayed(_run_backtest_batch)(batch, backtest_func, task_data, metric_to_optimize, constant_params)
+                for batch in batches
+            )
+            try:
+                if _PARALLEL_RETURNS_GENERATOR:
+                    # Batches are pulled from the lazy grid as workers free up, at most
+                    # a few per worker ahead, and results are consumed in grid order
+                    with Parallel(n_jobs=n_jobs, pre_dispatch='4*n_jobs', return_as='generator') as parallel_pool:
+                        for i, batch_results in enumerate(parallel_pool(tasks), start=1):
+                            consume(batch_results)
+                            if i % (4 * n_jobs) == 0 or processed == num_combinations:
+                                print(f"Processed {processed}/{num_combinations} combinations...")
+                else:
+                    # Older joblib returns a list only once every task finished, so the
+                    # grid is submitted in waves to bound memory
+                    wave_size = 4 * n_jobs
+                    with Parallel(n_jobs=n_jobs) as parallel_pool:
+                        while True:
+                            wave = list(itertools.islice(tasks, wave_size))
+                            if not wave:
+                                break
+                            for batch_results in parallel_pool(wave):
+                                consume(batch_results)
+                            print(f"Processed {processed}/{num_combinations} combinations...")
+            finally:
+                if shared_data is not None:
+                    shared_data.close()
+        else:
+            for batch in batches:
+                consume(_run_backtest_batch(batch, backtest_func, data, metric_to_optimize, constant_params))
+                print(f"Processed {processed}/{num_combinations} combinations...")
+    finally:
+        if sink_file is not None:
+            sink_file.close()
+
+    top_results = [(params, metric_value) for _, _, params, metric_value in sorted(heap, reverse=True)]
+
+    end_time = time.time()
+    print(f"Optimization finished in {end_time - start_time:.2f} seconds.")
+
+    if not top_results:
+        print("No valid results found during optimization.")
+        return None, -np.inf if maximize_metric else np.inf, top_results
+
+    best_params, best_metric_value = top_results[0]
+    print(f"Best Parameters found: {best_params}")
+    print(f"Best Metric Value ({metric_to_optimize}): {best_metric_value:.4f}")
+    return best_params, best_metric_value, top_results
+
+
+def _resolve_n_jobs(n_jobs: int) -> int:
+    """Resolves a joblib-style n_jobs (-1 for all cores, -2 for all but one, ...) to a job count."""
+    max_cores = os.cpu_count() or 1
+    if n_jobs < 0:
+        n_jobs = max(1, max_cores + 1 + n_jobs)
+    return min(n_jobs, max_cores)
+
+
+def _iter_parameter_batches(param_grid: Dict[str, List[Any]], batch_size: int):
+    """Lazily yields lists of at most `batch_size` parameter dictionaries."""
+    keys = list(param_grid.keys())
+    combinations = (dict(zip(keys, combo)) for combo in itertools.product(*param_grid.values()))
+    while True:
+        batch = list(itertools.islice(combinations, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def _run_backtest_batch(
+    batch: List[Dict[str, Any]],
+    backtest_func: Callable,
+    data: pd.DataFrame | SharedFrame,
     metric_to_optimize: str,
     constant_params: Dict[str, Any]
+) -> List[Tuple[Dict[str, Any], float]]:
+    """Runs `_run_single_backtest` for every combination of a batch within one task."""
+    # Combinations of a batch share one frame, as in sequential runs
+    shared = isinstance(data, SharedFrame)
+    if shared:
+        data = data.to_frame()
+    return [
+        _run_single_backtest(params, backtest_func, data, metric_to_optimize, constant_params, shared=shared)
+        for params in batch
+    ]
+
+
+def _run_single_backtest(
+    params: Dict[str, Any],
+    backtest_func: Callable,
+    data: pd.DataFrame | SharedFrame,
+    metric_to_optimize: str,
+    constant_params: Dict[str, Any],
+    shared: bool = False
 ) -> Tuple[Dict[str, Any], float]:
     """
     Worker function to run a single backtest instance for optimization.
@@ -162,17 +359,25 @@ def _run_single_backtest(
     Args:
         params: Dictionary of parameters specific to this run.
         backtest_func: The function to call for backtesting.
-        data: The input data for the backtest.
+        data: The input data for the backtest, or a SharedFrame published by the caller.
         metric_to_optimize: The key in the results dictionary to use as the optimization metric.
         constant_params: Dictionary of parameters constant across all runs.
+        shared: Whether `data` was read from a SharedFrame by the caller.
 
     Returns:
         Tuple containing the parameter dictionary and the resulting metric value.
         Returns -np.inf if the backtest fails or metric is not found.
+
+    Raises:
+        ValueError: If the backtest writes into read-only shared data.
     """
     current_params = {**constant_params, **params}
+    shared = shared or isinstance(data, SharedFrame)
     
     try:
+        if isinstance(data, SharedFrame):
+            data = data.to_frame()
+
         # Call the backtest function
         result = backtest_func(data=data, **current_params)
         
@@ -195,6 +400,12 @@ def _run_single_backtest(
         return params, float(metric_value)
 
     except Exception as e:
+        # Failing every combination silently would hide the cause
+        if shared and isinstance(e, ValueError) and 'read-only' in str(e):
+            raise ValueError(
+                "backtest_func modified the read-only shared data. "
+                "Pass shared_memory=False to give every task its own copy."
+            ) from e
         print(f"Error during backtest with params {params}: {e}")
         return params, -np.inf
 
@@ -1,9 +1,11 @@
+import numbers
 import pandas as pd
 import itertools
 from typing import Dict, List, Any
 from joblib import Parallel, delayed
 
 from .run_premade_strategies import run_premade_trade
+from .shared_data import SharedFrame
 
 def _generate_parameter_combinations(param_grid) -> List[Dict[str, Any]]:
     """Generates all possible parameter combinations from the grid."""
@@ -15,13 +17,21 @@ def _generate_parameter_combinations(param_grid) -> List[Dict[str, Any]]:
     print(f"Generated {len(param_dicts)} parameter combinations.")
     return param_dicts
 
-def _run_backtest_worker(params: dict, data: pd.DataFrame, strategy_name: str, base_parameters: dict, metric: str) -> dict:
-    """Helper function to run a single backtest instance for parallel processing."""
+def _run_backtest_worker(params: dict, data: pd.DataFrame | SharedFrame, strategy_name: str, base_parameters: dict, metric: str,
+                         lightweight: bool = False) -> dict:
+    """
+    Helper function to run a single backtest instance for parallel processing.
+
+    With lightweight=True only the numeric metrics of the results are returned, which keeps
+    the payload sent back from worker processes small.
+    """
     # Combine the iteration-specific params with the base parameters
     current_run_params = {**base_parameters, **params}
     
     # Run the backtest. Use a copy of the data to avoid race conditions if it's modified in-place.
-    results_df, _, _ = run_premade_trade(data.copy(), strategy_name, current_run_params)
+    # Shared data is read-only and to_frame() already returns a shallow copy.
+    data = data.to_frame() if isinstance(data, SharedFrame) else data.copy()
+    results_df, _, _ = run_premade_trade(data, strategy_name, current_run_params)
     
     # Safely get the score from the last row of the results DataFrame
     score = results_df[metric]
@@ -30,8 +40,22 @@ def _run_backtest_worker(params: dict, data: pd.DataFrame, strategy_name: str, b
         print(f"    Warning: Metric '{metric}' not found in results for params {params}. Skipping.")
         return {'params': params, 'score': None, 'results_df': None}
 
+    if lightweight:
+        results_df = _scalar_metrics(results_df)
+
     return {'params': params, 'score': score, 'results_df': results_df}
 
+def _scalar_metrics(results: dict) -> dict:
+    """Keeps only the numeric entries of a backtest results dictionary."""
+    return {k: v for k, v in results.items() if isinstance(v, numbers.Number)}
+
+def _run_entry(worker_result: dict, lightweight: bool) -> dict:
+    """Structures a worker result for the list of all runs."""
+    entry = {'params': worker_result['params'], 'results_summary': worker_result['results_df'], 'score': worker_result['score']}
+    if not lightweight:
+        entry['full_results'] = worker_result['results_df']
+    return entry
+
 def premade_optimizer(data: pd.DataFrame, strategy_name: str, param_grid: dict, parameters: dict | None = None):
     """
     Optimizes a trading strategy by searching through a grid of parameters, with optional parallel processing.
@@ -44,11 +68,19 @@ def premade_optimizer(data: pd.DataFrame, strategy_name: str, param_grid: dict,
                            'maximize' (bool): Whether to maximize or minimize the metric.
                            'parallel' (bool): Whether to run in parallel.
                            'n_jobs' (int): The number of parallel jobs to run (-1 for all cores).
+                           'shared_memory' (bool): When running in parallel, publish the data once
+                               to shared memory instead of pickling it for every combination
+                               (default True).
+                           'lightweight' (bool): If True, workers return only the numeric metrics of
+                               each run and the full results of the best combination are recomputed
+                               once at the end. Reduces inter-process traffic and peak memory for
+                               large grids (default False).
         param_grid (dict): A dictionary where keys are parameter names and values are lists of values to test.
 
     Returns:
         A tuple containing the best results DataFrame, a dictionary with the best parameters,
-        and a list of all results.
+        and a list of all results. In lightweight mode the entries of the list hold only
+        'params', 'score' and the numeric metrics under 'results_summary'.
     """
         
     parameter_combinations = _generate_parameter_combinations(param_grid)
@@ -62,9 +94,12 @@ def premade_optimizer(data: pd.DataFrame, strategy_name: str, param_grid: dict,
     maximize = parameters.get('maximize', True)
     parallel = parameters.get('parallel', False)
     n_jobs = parameters.get('n_jobs', -1)
+    shared_memory = parameters.get('shared_memory', True)
+    lightweight = parameters.get('lightweight', False)
 
     # Base parameters are those that are not part of the optimization grid settings
-    base_parameters = {k: v for k, v in parameters.items() if k not in ['metric', 'maximize', 'parallel', 'n_jobs']}
+    base_parameters = {k: v for k, v in parameters.items()
+                       if k not in ['metric', 'maximize', 'parallel', 'n_jobs', 'shared_memory', 'lightweight']}
 
     print(f"Starting optimization for {num_combinations} combinations...")
     print(f"Metric: {metric} ({'Maximize' if maximize else 'Minimize'}) | Parallel: {parallel}{f' (n_jobs={n_jobs})' if parallel else ''}")
@@ -72,21 +107,27 @@ def premade_optimizer(data: pd.DataFrame, strategy_name: str, param_grid: dict,
     all_run_results = []
     if parallel:
         # Parallel execution
-        results_list = Parallel(n_jobs=n_jobs, verbose=10)(
-            delayed(_run_backtest_worker)(params, data, strategy_name, base_parameters, metric)
-            for params in parameter_combinations
-        )
+        shared_data = SharedFrame(data) if shared_memory else None
+        try:
+            results_list = Parallel(n_jobs=n_jobs, verbose=10)(
+                delayed(_run_backtest_worker)(params, shared_data if shared_data is not None else data,
+                                              strategy_name, base_parameters, metric, lightweight)
+                for params in parameter_combinations
+            )
+        finally:
+            if shared_data is not None:
+                shared_data.close()
         # Filter out failed runs and structure results
         for res in results_list:
             if res and res['score'] is not None:
-                all_run_results.append({'params': res['params'], 'results_summary': res['results_df'], 'score': res['score'], 'full_results': res['results_df']})
+                all_run_results.append(_run_entry(res, lightweight))
     else:
         # Sequential execution
         for i, params in enumerate(parameter_combinations):
             print(f"  Testing combination {i+1}/{num_combinations}: {params}")
-            worker_result = _run_backtest_worker(params, data, strategy_name, base_parameters, metric)
+            worker_result = _run_backtest_worker(params, data, strategy_name, base_parameters, metric, lightweight)
             if worker_result and worker_result['score'] is not None:
-                all_run_results.append({'params': worker_result['params'], 'results_summary': worker_result['results_df'], 'score': worker_result['score'], 'full_results': worker_result['results_df']})
+                all_run_results.append(_run_entry(worker_result, lightweight))
 
     if not all_run_results:
         print("No valid results were generated. This might be due to the metric not being found in any backtest results.")
@@ -97,7 +138,11 @@ def premade_optimizer(data: pd.DataFrame, strategy_name: str, param_grid: dict,
     
     best_score = best_run['score']
     best_params = best_run['params']
-    best_results = best_run['full_results']
+    if lightweight:
+        # Only the winner's full results are needed, so recompute them once
+        best_results = _run_backtest_worker(best_params, data, strategy_name, base_parameters, metric)['results_df']
+    else:
+        best_results = best_run['full_results']
 
     print("\nOptimization finished.")
     print(f"Best score ({metric}): {best_score:.4f}")
@@ -0,0 +1,217 @@
+"""
+Computes an indicator for many symbols at once.
+
+A panel holds the OHLCV data of several symbols in one DataFrame, in one of two
+layouts:
+
+- Wide: the columns are a MultiIndex of (field, symbol), e.g. ('Close', 'AAPL'),
+  as returned by `yfinance.download` for several tickers. Rows are timestamps.
+- Long: the rows are a MultiIndex with one level holding the symbol, e.g.
+  (date, symbol), and the columns are the OHLCV fields. The rows of each symbol
+  must be in time order.
+
+Common indicators have panel implementations that work on time x symbol frames,
+so every symbol is computed by the same column-wise pandas and NumPy operations.
+Long panels are laid out side by side first, one column per symbol, with each
+symbol's bars stacked from the top. A symbol with fewer or different dates than
+the others therefore gets the same values as when it is computed on its own.
+Other indicators are computed symbol by symbol with their regular function.
+"""
+import numpy as np
+import pandas as pd
+
+from .core import INDICATORS
+from .indicator_state import window_parameter
+from .kernels import wilder_smoothing_columns
+
+
+def compute_panel_indicator(
+    data: pd.DataFrame,
+    indicator: str,
+    parameters: dict = None,
+    columns: dict = None,
+    symbol_level=-1
+) -> tuple:
+    """
+    Computes an indicator for every symbol of a wide or long panel.
+
+    Args:
+        data (pd.DataFrame): The panel. Wide panels have (field, symbol) MultiIndex
+            columns; long panels have a row MultiIndex with a symbol level.
+        indicator (str): Technical indicator to compute (e.g., 'rsi', 'sma', 'atr').
+        parameters (dict, optional): Parameters of the indicator.
+        columns (dict, optional): Field name mappings of the indicator, e.g.
+            {'close_col': 'Adj Close'}.
+        symbol_level (int or str, optional): The row level holding the symbol in a
+            long panel. Default is the last level, as in (date, symbol).
+
+    Returns:
+        tuple: The panel with the indicator added and the list of indicator column
+        names. Wide panels gain one (name, symbol) column per symbol for each
+        indicator column, so `result['RSI_14']` is a time x symbol frame. Long
+        panels gain one column per indicator column.
+
+    Raises:
+        ValueError: If the indicator is not supported or `data` is not a panel.
+    """
+    if indicator not in INDICATORS:
+        raise ValueError(f"Indicator '{indicator}' not supported. Available: {list(INDICATORS.keys())}")
+    if parameters is None:
+        parameters = {}
+    if columns is None:
+        columns = {}
+
+    if isinstance(data.columns, pd.MultiIndex):
+        return _compute_wide(data, indicator, parameters, columns)
+    if isinstance(data.index, pd.MultiIndex):
+        return _compute_long(data, indicator, parameters, columns, symbol_level)
+    raise ValueError("A panel needs (field, symbol) MultiIndex columns or a MultiIndex with a symbol level on the rows.")
+
+
+def is_panel(data: pd.DataFrame) -> bool:
+    """Returns True if `data` is a wide or long panel rather than a single-symbol frame."""
+    return isinstance(data.columns, pd.MultiIndex) or isinstance(data.index, pd.MultiIndex)
+
+
+def _compute_wide(data: pd.DataFrame, indicator: str, parameters: dict, columns: dict) -> tuple:
+    fields = data.columns.get_level_values(0).unique()
+    frames = {field: data[field] for field in fields}
+
+    if indicator in PANEL_INDICATORS:
+        results = PANEL_INDICATORS[indicator](frames, parameters, columns)
+    else:
+        results = _per_symbol(_wide_symbol_frames(frames), indicator, parameters, columns)
+        results = {name: pd.DataFrame(by_symbol) for name, by_symbol in results.items()}
+
+    result = pd.concat(results, axis=1, names=data.columns.names)
+    return pd.concat([data, result], axis=1), list(results)
+
+
+def _compute_long(data: pd.DataFrame, indicator: str, parameters: dict, columns: dict, symbol_level) -> tuple:
+    symbols = data.index.get_level_values(symbol_level)
+    groups = data.groupby(level=symbol_level, sort=False)
+    df = data.copy()
+
+    if indicator in PANEL_INDICATORS:
+        # Lay the symbols out side by side, each symbol's bars starting at row 0
+        position = groups.cumcount().to_numpy()
+        compact = data.set_axis(pd.MultiIndex.from_arrays([position, symbols]), axis=0).unstack(-1)
+        results = PANEL_INDICATORS[indicator]({field: compact[field] for field in data.columns}, parameters, columns)
+        # Pick every row's value back out of the position x symbol results
+        for name, frame in results.items():
+            df[name] = frame.to_numpy()[frame.index.get_indexer(position), frame.columns.get_indexer(symbols)]
+        return df, list(results)
+
+    symbol_frames = {symbol: rows.droplevel(symbol_level) for symbol, rows in groups}
+    results = _per_symbol(symbol_frames, indicator, parameters, columns)
+    rows = groups.indices
+    for name, by_symbol in results.items():
+        pieces = [series.set_axis(rows[symbol]) for symbol, series in by_symbol.items()]
+        df[name] = pd.concat(pieces).sort_index().to_numpy()
+    return df, list(results)
+
+
+def _wide_symbol_frames(frames: dict) -> dict:
+    """Splits wide field frames into one single-symbol OHLCV frame per symbol."""
+    symbols = next(iter(frames.values())).columns
+    return {symbol: pd.DataFrame({field: frame[symbol] for field, frame in frames.items()})
+            for symbol in symbols}
+
+
+def _per_symbol(symbol_frames: dict, indicator: str, parameters: dict, columns: dict) -> dict:
+    """Runs the regular indicator function on each symbol and collects its output columns by symbol."""
+    indicator_func = INDICATORS[indicator]
+    collected = {}
+    for symbol, frame in symbol_frames.items():
+        result, names = indicator_func(frame, parameters=parameters, columns=columns)
+        if isinstance(result, pd.Series):
+            result = result.to_frame(names[0])
+        for name in names:
+            collected.setdefault(name, {})[symbol] = result[name]
+    return collected
+
+
+def _sma_panel(frames: dict, parameters: dict, columns: dict) -> dict:
+    window = window_parameter(parameters, 20)
+    close = frames[columns.get('close_col', 'Close')]
+    return {f'SMA_{window}': close.rolling(window=window).mean()}
+
+
+def _ema_panel(frames: dict, parameters: dict, columns: dict) -> dict:
+    window = window_parameter(parameters, 20)
+    close = frames[columns.get('close_col', 'Close')]
+    return {f'EMA_{window}': close.ewm(span=window, adjust=False).mean()}
+
+
+def _std_panel(frames: dict, parameters: dict, columns: dict) -> dict:
+    window = window_parameter(parameters, 20)
+    ddof = int(parameters.get('ddof', 0))
+    close = frames[columns.get('close_col', 'Close')]
+    return {f'STD_{window}': close.rolling(window=window).std(ddof=ddof)}
+
+
+def _roc_panel(frames: dict, parameters: dict, columns: dict) -> dict:
+    window = window_parameter(parameters, 12)
+    close = frames[columns.get('close_col', 'Close')]
+    return {f'ROC_{window}': ((close / close.shift(window)) - 1) * 100}
+
+
+def _rsi_panel(frames: dict, parameters: dict, columns: dict) -> dict:
+    window = window_parameter(parameters, 14)
+    delta = frames[columns.get('close_col', 'Close')].diff()
+    gain = (delta.where(delta > 0, 0)).rolling(window=window).mean()
+    loss = (-delta.where(delta < 0, 0)).rolling(window=window).mean()
+    return {f'RSI_{window}': 100 - (100 / (1 + gain / loss))}
+
+
+def _mac_panel(frames: dict, parameters: dict, columns: dict) -> dict:
+    window_fast = window_parameter(parameters, 12, 'window_fast')
+    window_slow = window_parameter(parameters, 26, 'window_slow')
+    window_signal = window_parameter(parameters, 9, 'window_signal')
+    close = frames[columns.get('close_col', 'Close')]
+    mac_line = close.ewm(span=window_fast, adjust=False).mean() - close.ewm(span=window_slow, adjust=False).mean()
+    signal_line = mac_line.ewm(span=window_signal, adjust=False).mean()
+    return {
+        f'MAC_{window_fast}_{window_slow}': mac_line,
+        f'Signal_{window_signal}': signal_line,
+        f'Hist_{window_fast}_{window_slow}_{window_signal}': mac_line - signal_line,
+    }
+
+
+def _bol_panel(frames: dict, parameters: dict, columns: dict) -> dict:
+    window = window_parameter(parameters, 20)
+    num_std = float(parameters.get('num_std', 2))
+    close = frames[columns.get('close_col', 'Close')]
+    sma = close.rolling(window=window).mean()
+    std = close.rolling(window=window).std()
+    return {
+        f'BOL_Middle_{window}': sma,
+        f'BOL_Upper_{window}_{num_std}': sma + (std * num_std),
+        f'BOL_Lower_{window}_{num_std}': sma - (std * num_std),
+    }
+
+
+def _atr_panel(frames: dict, parameters: dict, columns: dict) -> dict:
+    window = window_parameter(parameters, 14)
+    high = frames[columns.get('high_col', 'High')]
+    low = frames[columns.get('low_col', 'Low')]
+    close = frames[columns.get('close_col', 'Close')]
+
+    prev_close = close.shift(1)
+    # Element-wise maximum that skips NaN, like max(axis=1) over the three ranges
+    tr = np.fmax(np.fmax(high - low, (high - prev_close).abs()), (low - prev_close).abs())
+    seeds = [tr[symbol].iloc[:window].mean() for symbol in tr.columns]
+    atr = wilder_smoothing_columns(tr.to_numpy(dtype=float), window, window - 1, seeds)
+    return {f'ATR_{window}': pd.DataFrame(atr, index=tr.index, columns=tr.columns)}
+
+
+PANEL_INDICATORS = {
+    'sma': _sma_panel,
+    'ema': _ema_panel,
+    'std': _std_panel,
+    'roc': _roc_panel,
+    'rsi': _rsi_panel,
+    'mac': _mac_panel,
+    'bol': _bol_panel,
+    'atr': _atr_panel,
+}
@@ -0,0 +1,66 @@
+"""
+Rolling least-squares line fits shared by regression-based indicators.
+
+Each window of `window` values is fitted with y = intercept + slope * t, where
+t = 0 is the oldest value of the window and t = window - 1 the most recent. All
+windows are fitted in one vectorized pass: the slope is a fixed-weight rolling
+sum (the values weighted by the centered time index), so no per-window Python
+function is called.
+"""
+import numpy as np
+import pandas as pd
+
+from .kernels import rolling_weighted_sum
+
+
+REGRESSION_COLUMNS = ['slope', 'intercept', 'endpoint', 'forecast', 'r2']
+
+
+def rolling_regression(series: pd.Series, window: int) -> pd.DataFrame:
+    """
+    Fits a least-squares line to every trailing window of a series.
+
+    Args:
+        series (pd.Series): The values to fit.
+        window (int): The number of values in each fit. Windows shorter than two
+            values cannot be fitted and give NaN.
+
+    Returns:
+        pd.DataFrame: Indexed like `series`, with the columns:
+            - slope: Change per period of the fitted line.
+            - intercept: Value of the line at the oldest bar of the window.
+            - endpoint: Value of the line at the current bar (t = window - 1).
+            - forecast: Value of the line one period ahead (t = window).
+            - r2: Coefficient of determination of the fit, NaN when the window is flat.
+
+        As with `Series.rolling(window)`, the first window-1 rows and any window
+        containing a NaN are NaN.
+    """
+    window = int(window)
+    values = series.astype(float)
+    if window < 2:
+        nan = np.full(len(values), np.nan)
+        return pd.DataFrame({col: nan for col in REGRESSION_COLUMNS}, index=series.index)
+
+    # Mean and population variance of t = 0, 1, ..., window - 1
+    t_mean = (window - 1) / 2
+    var_t = (window * window - 1) / 12
+
+    # slope = sum((t - t_mean) * x) / sum((t - t_mean) ** 2). Weighting by the
+    # centered time index avoids the cancellation of the n*sum(t*x) - sum(t)*sum(x) form.
+    slope = rolling_weighted_sum(values.to_numpy(), np.arange(window) - t_mean) / (window * var_t)
+    rolling = values.rolling(window=window)
+    mean_x = rolling.mean().to_numpy()
+    var_x = rolling.var(ddof=0).to_numpy()
+    intercept = mean_x - slope * t_mean
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        r2 = np.where(var_x > 0, np.minimum(slope * slope * var_t / var_x, 1.0), np.nan)
+
+    return pd.DataFrame({
+        'slope': slope,
+        'intercept': intercept,
+        'endpoint': intercept + slope * (window - 1),
+        'forecast': intercept + slope * window,
+        'r2': r2,
+    }, index=series.index)
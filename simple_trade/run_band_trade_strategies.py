@@ -4,6 +4,7 @@ Band Trade backtesting functions.
 This module provides function-based implementations for band trade strategies,
 replacing the class-based BandTradeBacktester approach.
 """
+import numpy as np
 import pandas as pd
 from typing import Optional
 
@@ -21,6 +22,7 @@ def run_band_trade(
     trading_type: str = 'long',
     strategy_type: int = 1,
     day1_position: str = 'none',
+    engine: str = 'loop',
     # Legacy parameters for backward compatibility
     initial_cash: Optional[float] = None,
     commission_long: Optional[float] = None,
@@ -57,6 +59,9 @@ def run_band_trade(
         trading_type: Defines the trading behavior ('long', 'short', 'mixed').
         strategy_type: Defines the band trade logic (1: mean_reversion, 2: breakout).
         day1_position: Specifies whether to take a position on day 1 ('none', 'long', 'short').
+        engine: Simulation engine ('loop' or 'array'). 'loop' walks the signal DataFrame
+               row by row; 'array' runs the same position logic over NumPy arrays and
+               builds the portfolio DataFrame once at the end. Both produce identical values.
         
         # Legacy parameters (used if config is None):
         initial_cash: Starting cash balance for the backtest.
@@ -98,6 +103,9 @@ def run_band_trade(
         data, indicator_col, upper_band_col, lower_band_col,
         price_col, trading_type, strategy_type, day1_position, config
     )
+    valid_engines = ['loop', 'array']
+    if engine not in valid_engines:
+        raise ValueError(f"Invalid engine '{engine}'. Must be one of {valid_engines}")
 
     # --- Signal Generation ---
     df = _generate_band_signals(data.copy(), indicator_col, upper_band_col, lower_band_col, strategy_type)
@@ -111,26 +119,38 @@ def run_band_trade(
         ), pd.DataFrame()
 
     # --- Run Backtest ---
-    portfolio_log, end_state = _run_band_backtest(
-        signal_df=df,
-        config=config,
-        price_col=price_col,
-        trading_type=trading_type,
-        day1_position=day1_position,
-    )
-
-    # --- Prepare and Return Results ---
-    if not portfolio_log:
-        final_df = pd.DataFrame({
-            'PositionSize': [0],
-            'PositionValue': [0.0],
-            'Cash': [config.initial_cash],
-            'PortfolioValue': [config.initial_cash],
-            'Close': [df[price_col].iloc[-1]]
-        }, index=df.index[[-1]])
+    if engine == 'array':
+        portfolio_log = _run_band_backtest_array(
+            price=df[price_col].to_numpy(),
+            buy_signal=df['buy_signal'].to_numpy(dtype=bool),
+            sell_signal=df['sell_signal'].to_numpy(dtype=bool),
+            index=df.index,
+            config=config,
+            trading_type=trading_type,
+            day1_position=day1_position,
+        )
+        final_df = portfolio_log
     else:
-        final_df = end_state
+        portfolio_log, end_state = _run_band_backtest(
+            signal_df=df,
+            config=config,
+            price_col=price_col,
+            trading_type=trading_type,
+            day1_position=day1_position,
+        )
+
+        if not portfolio_log:
+            final_df = pd.DataFrame({
+                'PositionSize': [0],
+                'PositionValue': [0.0],
+                'Cash': [config.initial_cash],
+                'PortfolioValue': [config.initial_cash],
+                'Close': [df[price_col].iloc[-1]]
+            }, index=df.index[[-1]])
+        else:
+            final_df = end_state
 
+    # --- Prepare and Return Results ---
     results, portfolio_df = _prepare_band_results(
         portfolio_log=portfolio_log,
         final_df=final_df,
@@ -349,6 +369,147 @@ def _run_band_backtest(
     return portfolio_log, end_state
 
 
+def _run_band_backtest_array(
+    price: np.ndarray,
+    buy_signal: np.ndarray,
+    sell_signal: np.ndarray,
+    index: pd.DatetimeIndex,
+    config: BacktestConfig,
+    trading_type: str,
+    day1_position: str,
+) -> pd.DataFrame:
+    """
+    Runs the backtest simulation over NumPy arrays.
+
+    Mirrors `_run_band_backtest` step for step (same execution helpers, same order
+    of floating point operations) but writes each bar into preallocated output
+    columns instead of building a dict per row, and returns the portfolio
+    DataFrame (indexed by 'Date') directly.
+    """
+    n = len(price)
+    cash_out = np.empty(n, dtype=np.float64)
+    size_out = np.empty(n, dtype=np.int64)
+    value_out = np.empty(n, dtype=np.float64)
+    type_out = np.empty(n, dtype=object)
+    portfolio_out = np.empty(n, dtype=np.float64)
+    commission_out = np.empty(n, dtype=np.float64)
+    short_fee_out = np.zeros(n, dtype=np.float64)
+    long_fee_out = np.zeros(n, dtype=np.float64)
+    action_out = np.empty(n, dtype=object)
+
+    if trading_type == 'long':
+        execute = _execute_long_only
+    elif trading_type == 'short':
+        execute = _execute_short_only
+    else:
+        execute = _execute_mixed
+
+    short_fee_rate = config.short_borrow_fee_inc_rate
+    long_fee_rate = config.long_borrow_fee_inc_rate
+
+    cash = config.initial_cash
+    position_size = 0
+    position_value = 0.0
+    position_type = 'none'
+    commission_paid = 0.0
+    # The loop engine lets pandas infer each column's dtype, so a column that only
+    # ever holds integers (e.g. whole shares times integer prices) comes out as int64
+    integer_cash = integer_value = integer_portfolio = integer_commission = True
+
+    # Handle day1_position if not 'none'
+    if day1_position != 'none' and n > 0:
+        first_price = price[0]
+
+        if day1_position == 'long':
+            shares_to_buy = int((cash * config.long_entry_pct_cash) / first_price)
+            if shares_to_buy > 0:
+                commission = shares_to_buy * first_price * config.commission_long
+                cash -= (shares_to_buy * first_price + commission)
+                position_size = shares_to_buy
+                position_value = shares_to_buy * first_price
+                position_type = 'long'
+                commission_paid += commission
+
+        elif day1_position == 'short':
+            shares_to_short = int((cash * config.short_entry_pct_cash) / first_price)
+            if shares_to_short > 0:
+                commission = shares_to_short * first_price * config.commission_short
+                cash += (shares_to_short * first_price - commission)
+                position_size = -shares_to_short
+                position_value = abs(position_size) * first_price
+                position_type = 'short'
+                commission_paid += commission
+
+    for i in range(n):
+        current_price = price[i]
+        buy = buy_signal[i]
+        sell = sell_signal[i]
+
+        # Apply borrow fees and update position value
+        if position_type == 'short':
+            fee = position_value * short_fee_rate
+            cash -= fee
+            short_fee_out[i] = fee
+            position_value = abs(position_size) * current_price
+        elif position_type == 'long':
+            fee = position_value * long_fee_rate
+            cash -= fee
+            long_fee_out[i] = fee
+            position_value = position_size * current_price
+        else:
+            position_value = 0.0
+
+        action = 'HOLD'
+
+        # Without a signal every execution helper leaves the state untouched
+        if buy or sell:
+            cash, position_size, position_value, position_type, commission_paid, action = execute(
+                buy, sell, position_type, position_size, position_value,
+                cash, current_price, config, commission_paid
+            )
+
+        portfolio_value = cash
+        if position_type == 'long':
+            portfolio_value += position_value
+        elif position_type == 'short':
+            portfolio_value -= position_value
+
+        cash_out[i] = cash
+        size_out[i] = position_size
+        value_out[i] = position_value
+        type_out[i] = position_type
+        portfolio_out[i] = portfolio_value
+        commission_out[i] = commission_paid
+        action_out[i] = action
+        integer_cash = integer_cash and not isinstance(cash, float)
+        integer_value = integer_value and not isinstance(position_value, float)
+        integer_portfolio = integer_portfolio and not isinstance(portfolio_value, float)
+        integer_commission = integer_commission and not isinstance(commission_paid, float)
+
+    date_index = pd.DatetimeIndex(index, freq=None, name='Date')
+
+    return pd.DataFrame({
+        'Price': price,
+        'Close': price.copy(),
+        'Cash': _as_inferred(cash_out, integer_cash and n > 0),
+        'PositionSize': size_out,
+        'PositionValue': _as_inferred(value_out, integer_value and n > 0),
+        'PositionType': type_out,
+        'PortfolioValue': _as_inferred(portfolio_out, integer_portfolio and n > 0),
+        'CommissionPaid': _as_inferred(commission_out, integer_commission and n > 0),
+        'ShortFee': short_fee_out,
+        'LongFee': long_fee_out,
+        'BuySignal': buy_signal,
+        'SellSignal': sell_signal,
+        'Action': action_out,
+    }, index=date_index)
+
+
+def _as_inferred(values: np.ndarray, integer: bool) -> np.ndarray:
+    """Casts a float output column to int64 when every value written to it was an integer."""
+    return values.astype(np.int64) if integer else values
+
+
 def _execute_long_only(
     buy_signal: bool,
     sell_signal: bool,
@@ -509,7 +670,7 @@ def _execute_mixed(
 
 
 def _prepare_band_results(
-    portfolio_log: list,
+    portfolio_log: list | pd.DataFrame,
     final_df: pd.DataFrame,
     data: pd.DataFrame,
     config: BacktestConfig,
@@ -521,7 +682,10 @@ def _prepare_band_results(
     day1_position: str,
 ) -> tuple:
     """Prepares the final results dictionary and portfolio DataFrame."""
-    portfolio_df = pd.DataFrame(portfolio_log).set_index('Date')
+    if isinstance(portfolio_log, pd.DataFrame):
+        portfolio_df = portfolio_log
+    else:
+        portfolio_df = pd.DataFrame(portfolio_log).set_index('Date')
     if 'Cash' in portfolio_df.columns:
         portfolio_df = portfolio_df.drop(columns=['Cash'])
     
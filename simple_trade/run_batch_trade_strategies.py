@@ -0,0 +1,448 @@
+"""
+Batch backtesting functions.
+
+This module simulates many signal sets over the same price series in a single
+pass. Each column of the buy/sell signal matrices is one parameter set; the
+position state of all columns is held in NumPy arrays and advanced bar by bar
+with vectorized operations, following the same execution rules as
+`run_band_trade` and `run_cross_trade`. Instead of one portfolio DataFrame per
+column, a metrics table with one row per column is returned.
+"""
+import numpy as np
+import pandas as pd
+from typing import Optional, Union
+
+from .config import BacktestConfig
+from .metrics import calculate_performance_metrics_batch
+
+_NONE = 0
+_LONG = 1
+_SHORT = -1
+
+
+def run_band_trade_batch(
+    data: pd.DataFrame,
+    buy_signals: Union[pd.DataFrame, np.ndarray],
+    sell_signals: Union[pd.DataFrame, np.ndarray],
+    config: Optional[BacktestConfig] = None,
+    price_col: str = 'Close',
+    trading_type: str = 'long',
+    day1_position: str = 'none',
+) -> pd.DataFrame:
+    """
+    Runs band trade backtests for many signal sets at once.
+
+    Positions are opened and closed with the same rules as `run_band_trade`
+    (including its handling of conflicting signals and day 1 positions), so a
+    column produces the same final value and trade count as a single run over
+    the same bars.
+
+    Args:
+        data: DataFrame containing price data. Must have a DatetimeIndex.
+        buy_signals: Boolean matrix (n_bars x n_sets) of buy signals. A DataFrame is
+                    aligned on data's index and its columns label the parameter sets.
+        sell_signals: Boolean matrix of sell signals with the same shape as buy_signals.
+        config: BacktestConfig object with all configuration parameters. Defaults to
+               BacktestConfig with long_entry_pct_cash and short_entry_pct_cash of 1.0,
+               matching run_band_trade's defaults.
+        price_col: Column name to use for trade execution prices.
+        trading_type: Defines the trading behavior ('long', 'short', 'mixed').
+        day1_position: Specifies whether to take a position on day 1 ('none', 'long', 'short').
+
+    Returns:
+        pd.DataFrame: One row per signal set with final_value, num_trades,
+                      total_commissions and the metrics of
+                      `calculate_performance_metrics_batch` (returns, volatility,
+                      Sharpe, Sortino, Calmar and drawdown statistics).
+
+    Example:
+        >>> buys = pd.DataFrame({w: rsi_w < 30 for w, rsi_w in rsi_by_window.items()})
+        >>> sells = pd.DataFrame({w: rsi_w > 70 for w, rsi_w in rsi_by_window.items()})
+        >>> table = run_band_trade_batch(data, buys, sells, trading_type='long')
+        >>> table.sort_values('total_return_pct', ascending=False).head()
+    """
+    config = _batch_config(config)
+    price, buy, sell, labels, index = _prepare_batch_inputs(
+        data, buy_signals, sell_signals, price_col, trading_type, day1_position
+    )
+    portfolio_values, num_trades, commissions = _simulate_band_batch(
+        price, buy, sell, config, trading_type, day1_position
+    )
+    return _batch_results_table(portfolio_values, num_trades, commissions, labels, index, config.risk_free_rate)
+
+
+def run_cross_trade_batch(
+    data: pd.DataFrame,
+    buy_signals: Union[pd.DataFrame, np.ndarray],
+    sell_signals: Union[pd.DataFrame, np.ndarray],
+    config: Optional[BacktestConfig] = None,
+    price_col: str = 'Close',
+    trading_type: str = 'long',
+    day1_position: str = 'none',
+) -> pd.DataFrame:
+    """
+    Runs cross trade backtests for many signal sets at once.
+
+    Positions are opened and closed with the same rules as `run_cross_trade`
+    (including its day 1 position override and reversal handling), so a column
+    produces the same final value and trade count as a single run over the same bars.
+
+    Args:
+        data: DataFrame containing price data. Must have a DatetimeIndex.
+        buy_signals: Boolean matrix (n_bars x n_sets) of buy signals. A DataFrame is
+                    aligned on data's index and its columns label the parameter sets.
+        sell_signals: Boolean matrix of sell signals with the same shape as buy_signals.
+        config: BacktestConfig object with all configuration parameters. Defaults to
+               BacktestConfig with long_entry_pct_cash and short_entry_pct_cash of 1.0,
+               matching run_cross_trade's defaults.
+        price_col: Column name to use for trade execution prices.
+        trading_type: Defines the trading behavior ('long', 'short', 'mixed').
+        day1_position: Specifies whether to take a position on day 1 ('none', 'long', 'short').
+
+    Returns:
+        pd.DataFrame: One row per signal set with final_value, num_trades,
+                      total_commissions and the metrics of
+                      `calculate_performance_metrics_batch` (returns, volatility,
+                      Sharpe, Sortino, Calmar and drawdown statistics).
+
+    Example:
+        >>> golden = pd.DataFrame({(s, l): cross_up(sma[s], sma[l]) for s, l in pairs})
+        >>> death = pd.DataFrame({(s, l): cross_down(sma[s], sma[l]) for s, l in pairs})
+        >>> table = run_cross_trade_batch(data, golden, death, trading_type='mixed')
+    """
+    config = _batch_config(config)
+    price, buy, sell, labels, index = _prepare_batch_inputs(
+        data, buy_signals, sell_signals, price_col, trading_type, day1_position
+    )
+    portfolio_values, num_trades, commissions = _simulate_cross_batch(
+        price, buy, sell, config, trading_type, day1_position
+    )
+    return _batch_results_table(portfolio_values, num_trades, commissions, labels, index, config.risk_free_rate)
+
+
+def _batch_config(config: Optional[BacktestConfig]) -> BacktestConfig:
+    """Returns the config to use, mirroring the legacy defaults of the single-run functions."""
+    if config is None:
+        config = BacktestConfig(long_entry_pct_cash=1.0, short_entry_pct_cash=1.0)
+    return config
+
+
+def _prepare_batch_inputs(
+    data: pd.DataFrame,
+    buy_signals: Union[pd.DataFrame, np.ndarray],
+    sell_signals: Union[pd.DataFrame, np.ndarray],
+    price_col: str,
+    trading_type: str,
+    day1_position: str,
+) -> tuple:
+    """Validates inputs and returns (price, buy, sell, labels, index) with contiguous arrays."""
+    if not isinstance(data, pd.DataFrame):
+        raise TypeError("data must be a pandas DataFrame.")
+    if not isinstance(data.index, pd.DatetimeIndex):
+        raise TypeError("DataFrame index must be a DatetimeIndex.")
+    if price_col not in data.columns:
+        raise ValueError(f"Price column '{price_col}' not found in DataFrame.")
+
+    valid_trading_types = ['long', 'short', 'mixed']
+    if trading_type not in valid_trading_types:
+        raise ValueError(f"Invalid trading_type '{trading_type}'. Must be one of {valid_trading_types}")
+
+    valid_day1_positions = ['none', 'long', 'short']
+    if day1_position not in valid_day1_positions:
+        raise ValueError(f"Invalid day1_position '{day1_position}'. Must be one of {valid_day1_positions}")
+    if day1_position == 'long' and trading_type == 'short':
+        raise ValueError("Cannot use day1_position='long' with trading_type='short'")
+    if day1_position == 'short' and trading_type == 'long':
+        raise ValueError("Cannot use day1_position='short' with trading_type='long'")
+
+    buy, labels = _as_signal_matrix(buy_signals, data.index, 'buy_signals')
+    sell, _ = _as_signal_matrix(sell_signals, data.index, 'sell_signals')
+    if buy.shape != sell.shape:
+        raise ValueError(f"buy_signals and sell_signals must have the same shape, got {buy.shape} and {sell.shape}.")
+
+    price = data[price_col].to_numpy(dtype=np.float64)
+    index = data.index
+    valid = ~np.isnan(price)
+    if not valid.all():
+        price, buy, sell, index = price[valid], buy[valid], sell[valid], index[valid]
+    if len(price) == 0:
+        raise ValueError("No bars with a valid price to backtest.")
+
+    return price, np.ascontiguousarray(buy), np.ascontiguousarray(sell), labels, index
+
+
+def _as_signal_matrix(signals, index: pd.DatetimeIndex, name: str) -> tuple:
+    """Converts a signal DataFrame/Series/array to a (n_bars, n_sets) bool array and labels."""
+    if isinstance(signals, pd.Series):
+        signals = signals.to_frame()
+    if isinstance(signals, pd.DataFrame):
+        labels = signals.columns
+        matrix = signals.reindex(index, fill_value=False).to_numpy(dtype=np.float64, na_value=0.0) != 0
+    else:
+        # Missing values count as "no signal"
+        matrix = np.nan_to_num(np.asarray(signals, dtype=np.float64)) != 0
+        if matrix.ndim == 1:
+            matrix = matrix[:, None]
+        if matrix.ndim != 2 or matrix.shape[0] != len(index):
+            raise ValueError(f"{name} must be 2D with one row per bar in data ({len(index)} rows).")
+        labels = pd.RangeIndex(matrix.shape[1])
+    return matrix, labels
+
+
+def _simulate_band_batch(
+    price: np.ndarray,
+    buy: np.ndarray,
+    sell: np.ndarray,
+    config: BacktestConfig,
+    trading_type: str,
+    day1_position: str,
+) -> tuple:
+    """Vectorized counterpart of `_run_band_backtest`; returns (portfolio_values, num_trades, commissions)."""
+    n, k = buy.shape
+    cash = np.full(k, float(config.initial_cash))
+    size = np.zeros(k, dtype=np.int64)
+    value = np.zeros(k)
+    ptype = np.zeros(k, dtype=np.int8)
+    commission_paid = np.zeros(k)
+    num_trades = np.zeros(k, dtype=np.int64)
+    portfolio_values = np.empty((n, k))
+
+    long_factor = 1 + config.commission_long
+    short_factor = 1 + config.commission_short
+
+    # Day 1 position (sized without commission, as in the single-run engine)
+    first_price = price[0]
+    if day1_position == 'long':
+        shares = int((config.initial_cash * config.long_entry_pct_cash) / first_price)
+        if shares > 0:
+            commission = shares * first_price * config.commission_long
+            cash -= (shares * first_price + commission)
+            size[:] = shares
+            value[:] = shares * first_price
+            ptype[:] = _LONG
+            commission_paid += commission
+    elif day1_position == 'short':
+        shares = int((config.initial_cash * config.short_entry_pct_cash) / first_price)
+        if shares > 0:
+            commission = shares * first_price * config.commission_short
+            cash += (shares * first_price - commission)
+            size[:] = -shares
+            value[:] = shares * first_price
+            ptype[:] = _SHORT
+            commission_paid += commission
+
+    def enter_long(mask, p):
+        shares = np.trunc((cash[mask] * config.long_entry_pct_cash) / (p * long_factor)).astype(np.int64)
+        ok = shares > 0
+        idx = np.flatnonzero(mask)[ok]
+        shares = shares[ok]
+        commission = shares * p * config.commission_long
+        cash[idx] -= (shares * p + commission)
+        size[idx] = shares
+        value[idx] = shares * p
+        ptype[idx] = _LONG
+        commission_paid[idx] += commission
+        entered = np.zeros(k, dtype=bool)
+        entered[idx] = True
+        return entered
+
+    def enter_short(mask, p):
+        shares = np.trunc((cash[mask] * config.short_entry_pct_cash) / (p * short_factor)).astype(np.int64)
+        ok = shares > 0
+        idx = np.flatnonzero(mask)[ok]
+        shares = shares[ok]
+        commission = shares * p * config.commission_short
+        cash[idx] += (shares * p - commission)
+        size[idx] = -shares
+        value[idx] = shares * p
+        ptype[idx] = _SHORT
+        commission_paid[idx] += commission
+        entered = np.zeros(k, dtype=bool)
+        entered[idx] = True
+        return entered
+
+    def exit_long(mask):
+        commission = value[mask] * config.commission_long
+        cash[mask] += (value[mask] - commission)
+        commission_paid[mask] += commission
+        size[mask] = 0
+        value[mask] = 0.0
+        ptype[mask] = _NONE
+
+    def exit_short(mask):
+        commission = value[mask] * config.commission_short
+        cash[mask] -= (value[mask] + commission)
+        commission_paid[mask] += commission
+        size[mask] = 0
+        value[mask] = 0.0
+        ptype[mask] = _NONE
+
+    for i in range(n):
+        p = price[i]
+        b = buy[i]
+        s = sell[i]
+        is_long = ptype == _LONG
+        is_short = ptype == _SHORT
+
+        # Borrow fees on the start-of-day position value, then mark to market
+        cash[is_short] -= value[is_short] * config.short_borrow_fee_inc_rate
+        cash[is_long] -= value[is_long] * config.long_borrow_fee_inc_rate
+        value[is_long] = size[is_long] * p
+        value[is_short] = np.abs(size[is_short]) * p
+        value[~(is_long | is_short)] = 0.0
+
+        if b.any() or s.any():
+            if trading_type == 'long':
+                buy_mask = b & ~is_long
+                sell_mask = s & is_long & ~b
+                num_trades += enter_long(buy_mask, p)
+                exit_long(sell_mask)
+                num_trades += sell_mask
+            elif trading_type == 'short':
+                short_mask = s & ~is_short
+                cover_mask = b & is_short & ~s
+                num_trades += enter_short(short_mask, p)
+                exit_short(cover_mask)
+                num_trades += cover_mask
+            else:
+                sell_branch = s & ~b
+                exit_short(b & is_short)
+                entered_long = enter_long(b & ~is_long, p)
+                # 'BUY' and 'COVER' are counted, the combined 'COVER AND BUY' is not
+                num_trades += entered_long & ~is_short
+                num_trades += b & is_short & ~entered_long
+                exit_long(sell_branch & is_long)
+                entered_short = enter_short(sell_branch & ~is_short, p)
+                num_trades += entered_short & ~is_long
+                num_trades += sell_branch & is_long & ~entered_short
+
+        portfolio_values[i] = cash + np.where(ptype == _LONG, value, np.where(ptype == _SHORT, -value, 0.0))
+
+    return portfolio_values, num_trades, commission_paid
+
+
+def _simulate_cross_batch(
+    price: np.ndarray,
+    buy: np.ndarray,
+    sell: np.ndarray,
+    config: BacktestConfig,
+    trading_type: str,
+    day1_position: str,
+) -> tuple:
+    """Vectorized counterpart of `_run_cross_backtest`; returns (portfolio_values, num_trades, commissions)."""
+    n, k = buy.shape
+    cash = np.full(k, float(config.initial_cash))
+    size = np.zeros(k, dtype=np.int64)
+    ptype = np.zeros(k, dtype=np.int8)
+    commission_paid = np.zeros(k)
+    num_trades = np.zeros(k, dtype=np.int64)
+    portfolio_values = np.empty((n, k))
+
+    long_factor = 1 + config.commission_long
+    short_factor = 1 + config.commission_short
+
+    def enter_long(mask, p):
+        shares = np.trunc((cash[mask] * config.long_entry_pct_cash) / (p * long_factor)).astype(np.int64)
+        ok = shares > 0
+        idx = np.flatnonzero(mask)[ok]
+        shares = shares[ok]
+        commission = shares * p * config.commission_long
+        cash[idx] -= (shares * p + commission)
+        size[idx] = shares
+        ptype[idx] = _LONG
+        commission_paid[idx] += commission
+        entered = np.zeros(k, dtype=bool)
+        entered[idx] = True
+        return entered
+
+    def enter_short(mask, p):
+        shares = np.trunc((cash[mask] * config.short_entry_pct_cash) / (p * short_factor)).astype(np.int64)
+        ok = shares > 0
+        idx = np.flatnonzero(mask)[ok]
+        shares = shares[ok]
+        commission = shares * p * config.commission_short
+        cash[idx] += (shares * p - commission)
+        size[idx] = -shares
+        ptype[idx] = _SHORT
+        commission_paid[idx] += commission
+        entered = np.zeros(k, dtype=bool)
+        entered[idx] = True
+        return entered
+
+    def exit_long(mask, p):
+        commission = size[mask] * p * config.commission_long
+        cash[mask] += (size[mask] * p - commission)
+        commission_paid[mask] += commission
+        size[mask] = 0
+        ptype[mask] = _NONE
+
+    def exit_short(mask, p):
+        shares = np.abs(size[mask])
+        commission = shares * p * config.commission_short
+        cash[mask] -= (shares * p + commission)
+        commission_paid[mask] += commission
+        size[mask] = 0
+        ptype[mask] = _NONE
+
+    for i in range(n):
+        p = price[i]
+        if i == 0 and day1_position != 'none':
+            b = np.full(k, day1_position == 'long')
+            s = np.full(k, day1_position == 'short')
+        else:
+            b = buy[i]
+            s = sell[i]
+        is_long = ptype == _LONG
+        is_short = ptype == _SHORT
+        is_none = ~(is_long | is_short)
+
+        # Borrow fees on the current position value
+        if config.long_borrow_fee_inc_rate > 0:
+            cash[is_long] -= size[is_long] * p * config.long_borrow_fee_inc_rate
+        if config.short_borrow_fee_inc_rate > 0:
+            cash[is_short] -= np.abs(size[is_short]) * p * config.short_borrow_fee_inc_rate
+
+        if b.any() or s.any():
+            if trading_type == 'long':
+                num_trades += enter_long(is_none & b, p)
+                sell_mask = is_long & s
+                exit_long(sell_mask, p)
+                num_trades += sell_mask
+            elif trading_type == 'short':
+                num_trades += enter_short(is_none & s, p)
+                cover_mask = is_short & b
+                exit_short(cover_mask, p)
+                num_trades += cover_mask
+            else:
+                num_trades += enter_long(is_none & b, p)
+                num_trades += enter_short(is_none & ~b & s, p)
+                reverse_long = is_long & s & ~b
+                exit_long(reverse_long, p)
+                num_trades += reverse_long
+                num_trades += enter_short(reverse_long, p)
+                reverse_short = is_short & b & ~s
+                exit_short(reverse_short, p)
+                num_trades += reverse_short
+                num_trades += enter_long(reverse_short, p)
+
+        position_value = np.abs(size) * p
+        portfolio_values[i] = cash + np.where(ptype == _LONG, position_value, np.where(ptype == _SHORT, -position_value, 0.0))
+
+    return portfolio_values, num_trades, commission_paid
+
+
+def _batch_results_table(
+    portfolio_values: np.ndarray,
+    num_trades: np.ndarray,
+    commissions: np.ndarray,
+    labels: pd.Index,
+    index: pd.DatetimeIndex,
+    risk_free_rate: float,
+) -> pd.DataFrame:
+    """Builds the per-signal-set results table from the simulated equity curves."""
+    metrics = calculate_performance_metrics_batch(portfolio_values, risk_free_rate, index=index)
+    metrics.index = labels
+    metrics.insert(0, 'final_value', np.round(portfolio_values[-1], 2))
+    metrics.insert(2, 'num_trades', num_trades)
+    metrics.insert(3, 'total_commissions', np.round(commissions, 2))
+    return metrics
@@ -153,62 +153,87 @@ def _combine_signals(
 ) -> pd.DataFrame:
     """
     Merges PositionType from multiple DataFrames and generates final buy/sell signals.
-    """
-    combined_df = price_data[[price_col]].copy()
 
+    Each strategy's PositionType is aligned on the price index, forward filled and
+    encoded as int8 (+1 long, -1 short, 0 otherwise) into one (n_bars, n_strategies)
+    array, so the votes are counted with column-wise reductions.
+    """
     for i, portfolio_df in enumerate(portfolio_dfs):
         if 'PositionType' not in portfolio_df.columns:
             raise ValueError(f"DataFrame at index {i} is missing 'PositionType' column.")
         if not isinstance(portfolio_df.index, pd.DatetimeIndex):
             raise TypeError(f"Index of DataFrame at index {i} must be a DatetimeIndex.")
 
-        position_col = portfolio_df[['PositionType']].rename(columns={'PositionType': f'PositionType_{i}'})
-        combined_df = combined_df.join(position_col, how='left')
-
-    position_cols = [f'PositionType_{i}' for i in range(len(portfolio_dfs))]
-    combined_df[position_cols] = combined_df[position_cols].ffill()
-    combined_df.dropna(inplace=True)
+    aligned, positions = _align_position_types(portfolio_dfs, price_data, price_col)
+    votes = np.empty((len(aligned), len(positions)), dtype=np.int8)
+    valid = aligned[price_col].notna().to_numpy()
+    for i, position in enumerate(positions):
+        position = position.ffill()
+        valid &= position.notna().to_numpy()
+        votes[:, i] = _encode_position_types(position)
 
-    if combined_df.empty:
+    if not valid.any():
         return pd.DataFrame()
 
-    def get_final_position(row):
-        positions = [row[col] for col in position_cols]
+    votes = votes[valid]
+    long_votes = (votes == 1).sum(axis=1)
+    short_votes = (votes == -1).sum(axis=1)
+
+    if combination_logic == 'unanimous':
+        num_strategies = votes.shape[1]
+        is_long = long_votes == num_strategies
+        is_short = short_votes == num_strategies
+    else:  # majority
+        is_long = long_votes > short_votes
+        is_short = short_votes > long_votes
+
+    final_position = np.where(is_long, 'long', np.where(is_short, 'short', 'none')).astype(object)
+    prev_position = np.empty_like(final_position)
+    prev_position[0] = 'none'
+    prev_position[1:] = final_position[:-1]
+
+    was_long = prev_position == 'long'
+    was_short = prev_position == 'short'
+
+    combined_df = aligned.loc[valid, [price_col]].copy()
+    combined_df['PositionType'] = final_position
+    combined_df['prev_PositionType'] = prev_position
+    # Long entry (including a reversal out of a short) / short entry or long exit
+    combined_df['buy_signal'] = is_long & ~was_long
+    combined_df['sell_signal'] = (is_short & ~was_short) | (~is_long & was_long)
+
+    return combined_df
 
-        if combination_logic == 'unanimous':
-            is_all_long = all(p == 'long' for p in positions)
-            is_all_short = all(p == 'short' for p in positions)
-            if is_all_long:
-                return 'long'
-            elif is_all_short:
-                return 'short'
-            else:
-                return 'none'
-
-        elif combination_logic == 'majority':
-            long_votes = positions.count('long')
-            short_votes = positions.count('short')
-            if long_votes > short_votes:
-                return 'long'
-            elif short_votes > long_votes:
-                return 'short'
-            else:
-                return 'none'
 
-        return 'none'
+def _align_position_types(
+    portfolio_dfs: List[pd.DataFrame],
+    price_data: pd.DataFrame,
+    price_col: str
+) -> tuple:
+    """
+    Aligns each strategy's PositionType with the price data.
 
-    combined_df['PositionType'] = combined_df.apply(get_final_position, axis=1)
-    combined_df['prev_PositionType'] = combined_df['PositionType'].shift(1).fillna('none')
+    Returns the price rows the positions are aligned with and one PositionType Series
+    per strategy. With unique indexes every strategy is reindexed on the price index.
+    Duplicate timestamps cannot be reindexed, so the strategies are then left-joined
+    one by one, which matches rows label by label as joins do.
+    """
+    aligned = price_data[[price_col]]
+    if price_data.index.is_unique and all(df.index.is_unique for df in portfolio_dfs):
+        return aligned, [df['PositionType'].reindex(aligned.index) for df in portfolio_dfs]
 
-    buy_entry = (combined_df['PositionType'] == 'long') & (combined_df['prev_PositionType'] != 'long')
-    short_exit = (combined_df['PositionType'] == 'long') & (combined_df['prev_PositionType'] == 'short')
-    combined_df['buy_signal'] = buy_entry | short_exit
+    for i, portfolio_df in enumerate(portfolio_dfs):
+        position_col = portfolio_df[['PositionType']].rename(columns={'PositionType': f'PositionType_{i}'})
+        aligned = aligned.join(position_col, how='left')
+    return aligned, [aligned[f'PositionType_{i}'] for i in range(len(portfolio_dfs))]
 
-    short_entry = (combined_df['PositionType'] == 'short') & (combined_df['prev_PositionType'] != 'short')
-    long_exit = (combined_df['PositionType'] != 'long') & (combined_df['prev_PositionType'] == 'long')
-    combined_df['sell_signal'] = short_entry | long_exit
 
-    return combined_df
+def _encode_position_types(positions: pd.Series) -> np.ndarray:
+    """Encodes PositionType values as int8: 1 for 'long', -1 for 'short', 0 otherwise."""
+    codes = np.zeros(len(positions), dtype=np.int8)
+    codes[(positions == 'long').to_numpy()] = 1
+    codes[(positions == 'short').to_numpy()] = -1
+    return codes
 
 
 def _run_combined_backtest(
@@ -5,6 +5,7 @@ This module provides function-based implementations for cross trade strategies,
 replacing the class-based CrossTradeBacktester approach.
 """
 import warnings
+import numpy as np
 import pandas as pd
 from typing import Optional
 
@@ -12,6 +13,14 @@ from .config import BacktestConfig
 from .metrics import compute_benchmark_return, calculate_performance_metrics
 
 
+# Categories used by the columnar portfolio log (position in tuple == int8 code)
+_POSITION_TYPES = ('none', 'long', 'short')
+_CROSS_ACTIONS = (
+    'HOLD', 'BUY', 'SELL', 'SHORT', 'COVER', 'SELL AND SHORT', 'COVER AND BUY',
+    'INSUFFICIENT_CASH', 'HOLD_CONFLICTING_SIGNAL',
+)
+
+
 def run_cross_trade(
     data: pd.DataFrame,
     short_window_indicator: str,
@@ -20,6 +29,7 @@ def run_cross_trade(
     price_col: str = 'Close',
     trading_type: str = 'long',
     day1_position: str = 'none',
+    log_mode: str = 'records',
     # Legacy parameters for backward compatibility
     initial_cash: Optional[float] = None,
     commission_long: Optional[float] = None,
@@ -46,6 +56,10 @@ def run_cross_trade(
         price_col: Column name to use for trade execution prices.
         trading_type: Defines the trading behavior ('long', 'short', 'mixed').
         day1_position: Specifies whether to take a position on day 1 ('none', 'long', 'short').
+        log_mode: How the portfolio log is recorded ('records' or 'columnar'). 'records'
+                 appends one dict per bar; 'columnar' writes into preallocated typed arrays
+                 and returns 'PositionType' and 'Action' as categorical columns, which
+                 uses far less memory on long intraday histories.
         
         # Legacy parameters (used if config is None):
         initial_cash: Starting cash balance for the backtest.
@@ -87,6 +101,9 @@ def run_cross_trade(
         data, short_window_indicator, long_window_indicator,
         price_col, trading_type, day1_position
     )
+    valid_log_modes = ['records', 'columnar']
+    if log_mode not in valid_log_modes:
+        raise ValueError(f"Invalid log_mode '{log_mode}'. Must be one of {valid_log_modes}")
 
     df = data.copy()
 
@@ -114,25 +131,36 @@ def run_cross_trade(
         ), pd.DataFrame()
 
     # --- Run Backtest ---
-    portfolio_log, num_trades = _run_cross_backtest(
-        signal_df=df,
-        config=config,
-        price_col=price_col,
-        trading_type=trading_type,
-        day1_position=day1_position,
-    )
+    if log_mode == 'columnar':
+        portfolio_df, num_trades = _run_cross_backtest_columnar(
+            price=df[price_col].to_numpy(),
+            buy_signal=df['buy_signal'].to_numpy(dtype=bool),
+            sell_signal=df['sell_signal'].to_numpy(dtype=bool),
+            index=df.index,
+            config=config,
+            trading_type=trading_type,
+            day1_position=day1_position,
+        )
+    else:
+        portfolio_log, num_trades = _run_cross_backtest(
+            signal_df=df,
+            config=config,
+            price_col=price_col,
+            trading_type=trading_type,
+            day1_position=day1_position,
+        )
 
-    # --- Prepare Results ---
-    portfolio_df = pd.DataFrame(portfolio_log)
-    
-    if portfolio_df.empty:
-        return _get_empty_cross_results(
-            config, short_window_indicator, long_window_indicator, trading_type, day1_position
-        ), pd.DataFrame()
-    
-    portfolio_df.set_index('Date', inplace=True)
-    if not isinstance(portfolio_df.index, pd.DatetimeIndex):
-        portfolio_df.index = pd.to_datetime(portfolio_df.index)
+        # --- Prepare Results ---
+        portfolio_df = pd.DataFrame(portfolio_log)
+
+        if portfolio_df.empty:
+            return _get_empty_cross_results(
+                config, short_window_indicator, long_window_indicator, trading_type, day1_position
+            ), pd.DataFrame()
+
+        portfolio_df.set_index('Date', inplace=True)
+        if not isinstance(portfolio_df.index, pd.DatetimeIndex):
+            portfolio_df.index = pd.to_datetime(portfolio_df.index)
 
     # Calculate final metrics
     final_value = portfolio_df['PortfolioValue'].iloc[-1] if not portfolio_df.empty else config.initial_cash
@@ -317,6 +345,131 @@ def _run_cross_backtest(
     return portfolio_log, num_trades
 
 
+def _run_cross_backtest_columnar(
+    price: np.ndarray,
+    buy_signal: np.ndarray,
+    sell_signal: np.ndarray,
+    index: pd.DatetimeIndex,
+    config: BacktestConfig,
+    trading_type: str,
+    day1_position: str,
+) -> tuple:
+    """
+    Runs the backtest simulation, logging into preallocated typed arrays.
+
+    Follows `_run_cross_backtest` bar for bar but stores cash and values as float64,
+    signals as bool and PositionType/Action as int8 codes. The portfolio DataFrame
+    (indexed by 'Date', string columns as categoricals) is materialised once at the end.
+    """
+    n = len(price)
+    cash_out = np.empty(n, dtype=np.float64)
+    size_out = np.empty(n, dtype=np.int64)
+    value_out = np.empty(n, dtype=np.float64)
+    type_codes = np.empty(n, dtype=np.int8)
+    portfolio_out = np.empty(n, dtype=np.float64)
+    commission_out = np.empty(n, dtype=np.float64)
+    short_fee_out = np.zeros(n, dtype=np.float64)
+    long_fee_out = np.zeros(n, dtype=np.float64)
+    buy_out = np.empty(n, dtype=bool)
+    sell_out = np.empty(n, dtype=bool)
+    action_codes = np.empty(n, dtype=np.int8)
+    cost_basis_out = np.zeros(n, dtype=np.float64)
+
+    if trading_type == 'long':
+        execute = _execute_cross_long_only
+    elif trading_type == 'short':
+        execute = _execute_cross_short_only
+    else:
+        execute = _execute_cross_mixed
+
+    type_code_map = {name: code for code, name in enumerate(_POSITION_TYPES)}
+    action_code_map = {name: code for code, name in enumerate(_CROSS_ACTIONS)}
+    hold_code = action_code_map['HOLD']
+    log_buy_codes = {action_code_map[a] for a in ('BUY', 'COVER AND BUY', 'COVER')}
+    log_sell_codes = {action_code_map[a] for a in ('SELL', 'SELL AND SHORT', 'SHORT')}
+
+    cash = config.initial_cash
+    position_size = 0
+    position_type = 'none'
+    num_trades = 0
+    total_commission_paid = 0.0
+
+    for i in range(n):
+        trade_price = price[i]
+
+        # Special handling for first day if day1_position is specified
+        if i == 0 and day1_position != 'none':
+            buy = day1_position == 'long'
+            sell = day1_position == 'short'
+        else:
+            buy = buy_signal[i]
+            sell = sell_signal[i]
+
+        # Apply borrow fees
+        if position_type == 'long':
+            if config.long_borrow_fee_inc_rate > 0:
+                long_fee = position_size * trade_price * config.long_borrow_fee_inc_rate
+                cash -= long_fee
+                long_fee_out[i] = long_fee
+        elif position_type == 'short':
+            if config.short_borrow_fee_inc_rate > 0:
+                short_fee = abs(position_size) * trade_price * config.short_borrow_fee_inc_rate
+                cash -= short_fee
+                short_fee_out[i] = short_fee
+
+        # Without a signal every execution helper leaves the state untouched
+        action_code = hold_code
+        if buy or sell:
+            cash, position_size, position_type, position_cost_basis, commission_paid, action_taken, num_trades = \
+                execute(
+                    buy, sell, position_type, position_size,
+                    cash, trade_price, config, num_trades
+                )
+            action_code = action_code_map[action_taken]
+            cost_basis_out[i] = position_cost_basis
+            total_commission_paid += commission_paid
+
+        # Recalculate position and portfolio value after trades
+        if position_type == 'long':
+            position_value = position_size * trade_price
+            portfolio_value = cash + position_value
+        elif position_type == 'short':
+            position_value = abs(position_size) * trade_price
+            portfolio_value = cash - position_value
+        else:
+            position_value = 0.0
+            portfolio_value = cash
+
+        cash_out[i] = cash
+        size_out[i] = position_size
+        value_out[i] = position_value
+        type_codes[i] = type_code_map[position_type]
+        portfolio_out[i] = portfolio_value
+        commission_out[i] = total_commission_paid
+        buy_out[i] = action_code in log_buy_codes
+        sell_out[i] = action_code in log_sell_codes
+        action_codes[i] = action_code
+
+    portfolio_df = pd.DataFrame({
+        'Price': price,
+        'Close': price.copy(),
+        'Cash': cash_out,
+        'PositionSize': size_out,
+        'PositionValue': value_out,
+        'PositionType': pd.Categorical.from_codes(type_codes, categories=_POSITION_TYPES),
+        'PortfolioValue': portfolio_out,
+        'CommissionPaid': commission_out,
+        'ShortFee': short_fee_out,
+        'LongFee': long_fee_out,
+        'BuySignal': buy_out,
+        'SellSignal': sell_out,
+        'Action': pd.Categorical.from_codes(action_codes, categories=_CROSS_ACTIONS),
+        'PositionCostBasis': cost_basis_out,
+    }, index=pd.DatetimeIndex(index, freq=None, name='Date'))
+
+    return portfolio_df, num_trades
+
+
 def _execute_cross_long_only(
     buy_signal: bool,
     sell_signal: bool,
@@ -0,0 +1,199 @@
+"""
+Shared-memory handoff of price data to parallel optimizer workers.
+
+joblib pickles every argument of every task, so passing an OHLCV DataFrame to each
+backtest serializes and duplicates the whole frame once per parameter combination.
+`SharedFrame` copies the numeric columns and the index into a single shared memory
+block once; pickling it only transfers the block name and column layout, and worker
+processes rebuild the DataFrame as zero-copy, read-only views of that block.
+"""
+from multiprocessing import shared_memory
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+_ALIGNMENT = 64
+_SHAREABLE_KINDS = 'biufcmM'
+
+# Blocks attached by this (worker) process: name -> (SharedMemory, DataFrame)
+_attached = {}
+
+
+class SharedFrame:
+    """
+    A DataFrame published to shared memory for use by worker processes.
+
+    Numeric, boolean and datetime64 columns (and a DatetimeIndex or numeric index)
+    are stored in shared memory. Any other columns, or the whole frame when its
+    column labels are not unique, are pickled with the handle as usual.
+
+    Use as a context manager in the process that publishes the data; the shared
+    memory block is released on exit.
+
+    Example:
+        >>> with SharedFrame(data) as shared:
+        ...     Parallel(n_jobs=8)(delayed(worker)(shared, p) for p in grid)
+
+        where `worker` calls `shared.to_frame()` to obtain the DataFrame.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        self._shm = None
+        self._owner = True
+        self._frame = None
+        self._index_layout = None
+        self._layout = []
+        self._extra = None
+        self.length = len(df)
+
+        if not df.columns.is_unique:
+            self._extra = df
+            self.columns = list(df.columns)
+            return
+
+        self.columns = list(df.columns)
+        shared_cols = [col for col in df.columns if _is_shareable(df[col].dtype)]
+        self._extra = df[[col for col in df.columns if col not in shared_cols]]
+
+        index_values = _index_values(df.index)
+        arrays = [np.asarray(df[col]) for col in shared_cols]
+        sizes = [arr.nbytes for arr in arrays]
+        if index_values is not None:
+            sizes.append(index_values.nbytes)
+        total = sum(_aligned(size) for size in sizes)
+        if total == 0:
+            self._extra = df
+            return
+
+        self._shm = shared_memory.SharedMemory(create=True, size=total)
+        offset = 0
+        for col, arr in zip(shared_cols, arrays):
+            self._layout.append((col, arr.dtype.str, offset))
+            np.ndarray(arr.shape, dtype=arr.dtype, buffer=self._shm.buf, offset=offset)[:] = arr
+            offset += _aligned(arr.nbytes)
+        if index_values is not None:
+            np.ndarray(index_values.shape, dtype=index_values.dtype, buffer=self._shm.buf, offset=offset)[:] = index_values
+            is_datetime = isinstance(df.index, pd.DatetimeIndex)
+            self._index_layout = (index_values.dtype.str, offset, df.index.name,
+                                  df.index.tz if is_datetime else None,
+                                  df.index.freq if is_datetime else None,
+                                  is_datetime)
+            # The index travels through shared memory, so don't pickle it again
+            self._extra = self._extra.reset_index(drop=True)
+
+    @property
+    def name(self) -> Optional[str]:
+        """Name of the shared memory block, or None if nothing is shared."""
+        return self._shm.name if self._shm is not None else None
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Returns the DataFrame. Shared columns are read-only views of the shared memory
+        block; the returned frame is a shallow copy, so adding columns is safe.
+        """
+        if self._shm is None:
+            return self._extra.copy(deep=False)
+        if self._frame is None:
+            if not self._owner and self.name in _attached:
+                self._frame = _attached[self.name][1]
+            else:
+                self._frame = self._build_frame()
+                if not self._owner:
+                    _attached[self.name] = (self._shm, self._frame)
+        return self._frame.copy(deep=False)
+
+    def close(self) -> None:
+        """Releases the shared memory block. Only the publishing process unlinks it."""
+        if self._shm is None:
+            return
+        self._frame = None
+        if self._owner:
+            try:
+                self._shm.close()
+            except BufferError:
+                # Views handed out by to_frame() are still alive; the mapping is
+                # released when they are garbage collected.
+                pass
+            self._shm.unlink()
+            self._shm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_shm'] = self.name
+        state['_frame'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._owner = False
+        name = state['_shm']
+        if name is None:
+            return
+        if name in _attached:
+            self._shm = _attached[name][0]
+        else:
+            _detach_all()
+            # joblib's loky workers share the publishing process's resource tracker, so
+            # the block stays registered exactly once and is unlinked by close().
+            self._shm = shared_memory.SharedMemory(name=name)
+
+    def _build_frame(self) -> pd.DataFrame:
+        buf = self._shm.buf
+        if self._index_layout is not None:
+            dtype, offset, index_name, tz, freq, is_datetime = self._index_layout
+            values = _view(buf, dtype, offset, self.length)
+            if is_datetime:
+                index = pd.DatetimeIndex(values.view('M8[ns]'), name=index_name)
+                if tz is not None:
+                    index = index.tz_localize('UTC').tz_convert(tz)
+                index.freq = freq
+            else:
+                index = pd.Index(values, name=index_name)
+        else:
+            index = self._extra.index
+
+        shared = {col: _view(buf, dtype, offset, self.length) for col, dtype, offset in self._layout}
+        columns = {col: shared[col] if col in shared else self._extra[col].array for col in self.columns}
+        # copy=False keeps one block per column, so no data is copied out of shared memory
+        return pd.DataFrame(columns, index=index, copy=False)
+
+
+def _detach_all() -> None:
+    """Closes blocks attached for a previous optimization run in this worker."""
+    for name in list(_attached):
+        shm, _ = _attached.pop(name)
+        try:
+            shm.close()
+        except BufferError:
+            pass
+
+
+def _is_shareable(dtype) -> bool:
+    return isinstance(dtype, np.dtype) and dtype.kind in _SHAREABLE_KINDS
+
+
+def _index_values(index: pd.Index) -> Optional[np.ndarray]:
+    """Returns the raw values of a DatetimeIndex (as int64 nanoseconds) or numeric index."""
+    if isinstance(index, pd.DatetimeIndex):
+        return index.values.astype('datetime64[ns]').view(np.int64)
+    if _is_shareable(index.dtype):
+        return np.asarray(index)
+    return None
+
+
+def _view(buf, dtype: str, offset: int, length: int) -> np.ndarray:
+    arr = np.ndarray((length,), dtype=np.dtype(dtype), buffer=buf, offset=offset)
+    arr.flags.writeable = False
+    return arr
+
+
+def _aligned(nbytes: int) -> int:
+    return -(-nbytes // _ALIGNMENT) * _ALIGNMENT
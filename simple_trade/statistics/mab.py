@@ -1,6 +1,8 @@
 import pandas as pd
 import numpy as np
 
+from ..kernels import rolling_window_apply
+
 
 def mab(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tuple:
     """
@@ -57,9 +59,9 @@ def mab(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tupl
     
     # Calculate rolling mean absolute deviation
     def calc_mad(x):
-        return np.mean(np.abs(x - np.mean(x)))
+        return np.mean(np.abs(x - np.mean(x, axis=1, keepdims=True)), axis=1)
     
-    mab_values = close.rolling(window=window).apply(calc_mad, raw=True)
+    mab_values = pd.Series(rolling_window_apply(close.to_numpy(dtype=float), window, calc_mad), index=close.index)
     
     mab_values.name = f'MAB_{window}'
     columns_list = [mab_values.name]
@@ -1,5 +1,8 @@
+import numpy as np
 import pandas as pd
 
+from ..kernels import rolling_window_apply
+
 
 def aro(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tuple:
     """
@@ -61,27 +64,25 @@ def aro(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tupl
     high = df[high_col]
     low = df[low_col]
     
-    # Create ARO_up and ARO_down series
-    aro_up = pd.Series(index=high.index, dtype=float)
-    aro_down = pd.Series(index=low.index, dtype=float)
-    
-    # Calculate ARO indicators for each rolling window
-    for i in range(len(high) - period + 1):
-        # Get the current window
-        high_window = high.iloc[i:i+period]
-        low_window = low.iloc[i:i+period]
-        
-        # Find the highest high and lowest low
-        highest_high = high_window.max()
-        lowest_low = low_window.min()
-        
-        # Find the periods since highest high and lowest low
-        periods_since_highest = period - 1 - high_window.values.tolist().index(highest_high)
-        periods_since_lowest = period - 1 - low_window.values.tolist().index(lowest_low)
-        
-        # Calculate ARO Up and ARO Down
-        aro_up.iloc[i+period-1] = ((period - periods_since_highest) / period) * 100
-        aro_down.iloc[i+period-1] = ((period - periods_since_lowest) / period) * 100
+    # Missing values never count as the extreme of a window
+    high_values = high.to_numpy(dtype=float)
+    low_values = low.to_numpy(dtype=float)
+    filled_high = np.where(np.isnan(high_values), -np.inf, high_values)
+    filled_low = np.where(np.isnan(low_values), np.inf, low_values)
+
+    # Position of the first highest high and lowest low in each window (0 = oldest)
+    highest_position = rolling_window_apply(filled_high, period, lambda w: np.argmax(w, axis=1))
+    lowest_position = rolling_window_apply(filled_low, period, lambda w: np.argmin(w, axis=1))
+
+    # Find the periods since highest high and lowest low
+    periods_since_highest = period - 1 - highest_position
+    periods_since_lowest = period - 1 - lowest_position
+
+    # Calculate ARO Up and ARO Down; windows without any values have no extreme
+    aro_up = pd.Series(((period - periods_since_highest) / period) * 100, index=high.index)
+    aro_down = pd.Series(((period - periods_since_lowest) / period) * 100, index=low.index)
+    aro_up[_all_missing(high_values, period)] = np.nan
+    aro_down[_all_missing(low_values, period)] = np.nan
     
     # Calculate ARO Oscillator
     aro_oscillator = aro_up - aro_down
@@ -98,6 +99,12 @@ def aro(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tupl
     return df_aro, columns
 
 
+def _all_missing(values, period: int) -> np.ndarray:
+    """Flags the bars whose trailing window of `period` values is entirely NaN."""
+    valid_count = pd.Series(~np.isnan(values)).rolling(window=period).sum().to_numpy()
+    return valid_count == 0
+
+
 def strategy_aro(
     data: pd.DataFrame,
     parameters: dict = None,
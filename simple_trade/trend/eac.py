@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 
@@ -49,31 +50,14 @@ def eac(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tupl
 
     series = df[close_col].copy()
     
-    # Smooth the price data
-    smooth = pd.Series(index=series.index, dtype=float)
-    smooth.iloc[0] = series.iloc[0]
-    
-    for i in range(1, len(series)):
-        if i < 3:
-            smooth.iloc[i] = series.iloc[i]
-        else:
-            # Simple 4-bar average for smoothing
-            smooth.iloc[i] = (series.iloc[i] + 2*series.iloc[i-1] + 
-                             2*series.iloc[i-2] + series.iloc[i-3]) / 6.0
-    
-    # Initialize cycle
-    cycle = pd.Series(index=series.index, dtype=float)
-    cycle.iloc[:2] = 0.0
+    # Smooth the price data with a 4-bar weighted average
+    values = series.to_numpy(dtype=float)
+    smooth = values.copy()
+    smooth[3:] = (values[3:] + 2*values[2:-1] + 2*values[1:-2] + values[:-3]) / 6.0
+    smooth = pd.Series(smooth, index=series.index)
     
     # Calculate CyberCycle using recursive filter
-    for i in range(2, len(series)):
-        if pd.notna(smooth.iloc[i]) and pd.notna(smooth.iloc[i-1]) and pd.notna(smooth.iloc[i-2]):
-            # Ehlers CyberCycle formula (simplified)
-            cycle.iloc[i] = ((1 - 0.5*alpha)**2 * (smooth.iloc[i] - 2*smooth.iloc[i-1] + smooth.iloc[i-2]) + 
-                            2*(1 - alpha)*cycle.iloc[i-1] - 
-                            (1 - alpha)**2 * cycle.iloc[i-2])
-        else:
-            cycle.iloc[i] = 0.0
+    cycle = pd.Series(_cyber_cycle(smooth.to_numpy(), alpha), index=series.index)
     
     # Create the trend line by subtracting cycle from smoothed price
     trend = smooth - cycle
@@ -83,6 +67,21 @@ def eac(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tupl
     return trend, columns_list
 
 
+def _cyber_cycle(smooth: np.ndarray, alpha: float) -> np.ndarray:
+    """Runs the CyberCycle recursion over Python floats. Bars without three valid smoothed values reset to zero."""
+    c0 = (1 - 0.5*alpha)**2
+    c1 = 2*(1 - alpha)
+    c2 = (1 - alpha)**2
+    values = smooth.tolist()
+    cycle = [0.0] * len(values)
+    for i in range(2, len(values)):
+        s0, s1, s2 = values[i], values[i-1], values[i-2]
+        if s0 == s0 and s1 == s1 and s2 == s2:
+            # Ehlers CyberCycle formula (simplified)
+            cycle[i] = c0 * (s0 - 2*s1 + s2) + c1*cycle[i-1] - c2 * cycle[i-2]
+    return np.array(cycle, dtype=float)
+
+
 def strategy_eac(
     data: pd.DataFrame,
     parameters: dict = None,
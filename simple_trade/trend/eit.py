@@ -1,6 +1,8 @@
 import numpy as np
 import pandas as pd
 
+from ..kernels import adaptive_ema
+
 
 def eit(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tuple:
     """
@@ -47,28 +49,7 @@ def eit(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tupl
     weighted_price = (close + 2 * close.shift(1) + close.shift(2)) / 4
 
     values = weighted_price.to_numpy(dtype=float)
-    itrend = np.full_like(values, np.nan)
-
-    valid_idx = np.where(~np.isnan(values))[0]
-    if valid_idx.size == 0:
-        series = pd.Series(itrend, index=close.index, name=f'EIT_{alpha}')
-        return series, [series.name]
-
-    start = valid_idx[0]
-    itrend[start] = values[start]
-
-    for i in range(start + 1, len(values)):
-        price_term = values[i]
-        prev = itrend[i - 1]
-
-        if np.isnan(price_term):
-            itrend[i] = prev
-            continue
-
-        if np.isnan(prev):
-            prev = price_term
-
-        itrend[i] = alpha * price_term + (1 - alpha) * prev
+    itrend = adaptive_ema(values, np.full(len(values), alpha))
 
     series = pd.Series(itrend, index=close.index, name=f'EIT_{alpha}')
     return series, [series.name]
@@ -1,5 +1,7 @@
 import pandas as pd
 
+from ..kernels import hilbert_fir
+
 
 def htt(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tuple:
     """
@@ -55,12 +57,7 @@ def htt(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tupl
     
     # Apply Ehlers' Hilbert Transform smoothing
     # The detrender coefficients extract the smooth trend component
-    smooth = (
-        0.0962 * close
-        + 0.5769 * close.shift(2)
-        - 0.5769 * close.shift(4)
-        - 0.0962 * close.shift(6)
-    )
+    smooth = pd.Series(hilbert_fir(close.to_numpy(dtype=float)), index=close.index)
     
     # Apply EMA smoothing to the result
     alpha = 2.0 / (window + 1)
@@ -51,20 +51,9 @@ def mgd(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tupl
 
     series = df[close_col].copy()
     
-    # Initialize McGinley Dynamic with SMA
-    md = pd.Series(index=series.index, dtype=float)
-    md.iloc[:window] = series.iloc[:window].rolling(window=window).mean()
-    
-    # Calculate McGinley Dynamic
-    for i in range(window, len(series)):
-        if pd.notna(md.iloc[i-1]) and md.iloc[i-1] != 0:
-            ratio = series.iloc[i] / md.iloc[i-1]
-            # Prevent extreme values
-            ratio = np.clip(ratio, 0.1, 10.0)
-            k = (series.iloc[i] - md.iloc[i-1]) / (window * (ratio ** 4))
-            md.iloc[i] = md.iloc[i-1] + k
-        else:
-            md.iloc[i] = series.iloc[i]
+    # Initialize McGinley Dynamic with SMA and iterate from there
+    seed = series.iloc[:window].rolling(window=window).mean().to_numpy(dtype=float)
+    md = pd.Series(_mcginley_dynamic(series.to_numpy(dtype=float), window, seed), index=series.index)
     
     md.name = f'MGD_{window}'
     
@@ -72,6 +61,22 @@ def mgd(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tupl
     return md, columns_list
 
 
+def _mcginley_dynamic(values: np.ndarray, window: int, seed: np.ndarray) -> np.ndarray:
+    """Runs the McGinley Dynamic recursion over Python floats, starting after the `seed` values."""
+    out = np.empty(len(values))
+    out[:len(seed)] = seed
+    prev = float(seed[-1]) if len(seed) else np.nan
+    for i, price in enumerate(values[window:].tolist(), window):
+        if prev == prev and prev != 0:
+            # Prevent extreme values
+            ratio = min(max(price / prev, 0.1), 10.0)
+            prev = prev + (price - prev) / (window * (ratio ** 4))
+        else:
+            prev = price
+        out[i] = prev
+    return out
+
+
 def strategy_mgd(
     data: pd.DataFrame,
     parameters: dict = None,
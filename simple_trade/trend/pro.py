@@ -1,5 +1,6 @@
 import pandas as pd
-import numpy as np
+
+from ..rolling_regression import rolling_regression
 
 
 def pro(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tuple:
@@ -58,16 +59,7 @@ def pro(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tupl
     close = df[close_col]
     
     # Calculate rolling linear regression slope
-    def calculate_slope(window):
-        if len(window) < 2:
-            return np.nan
-        x = np.arange(len(window))
-        y = window.values
-        # Simple linear regression: slope = covariance(x,y) / variance(x)
-        slope = np.polyfit(x, y, 1)[0]
-        return slope
-    
-    slopes = close.rolling(window=period).apply(calculate_slope, raw=False)
+    slopes = rolling_regression(close, period)['slope']
     
     # Calculate rolling standard deviation for normalization
     std_dev = close.rolling(window=period).std()
@@ -1,6 +1,8 @@
 import pandas as pd
 import numpy as np
 
+from ..kernels import parabolic_sar
+
 def psa(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tuple:
     """
     Calculates Parabolic SAR (psa).
@@ -84,79 +86,13 @@ def psa(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tupl
         )
         return result, list(result.columns)
 
-    psa_values = np.zeros(length)
-    psa_bullish = np.full(length, np.nan)  # Initialize with NaN
-    psa_bearish = np.full(length, np.nan)  # Initialize with NaN
-    trend_is_bull = np.zeros(length, dtype=bool)  # Track the trend direction
-    
-    bull = True # Initial trend assumption
-    af = af_initial
-    ep = high.iloc[0] # Initial Extreme Point (assuming initial uptrend)
-
-    # Initialize first SAR value
-    psa_values[0] = low.iloc[0]
-    trend_is_bull[0] = bull
+    # Iterate the SAR state machine (starting with an assumed uptrend)
+    psa_values, trend_is_bull = parabolic_sar(high.to_numpy(dtype=float), low.to_numpy(dtype=float),
+                                              af_initial, af_step, af_max)
     
-    # Set initial values based on initial trend
-    if bull:
-        psa_bullish[0] = psa_values[0]
-    else:
-        psa_bearish[0] = psa_values[0]
-
-    # A slightly more robust initial trend check (optional, needs 'Close' if used)
-    # if length > 1 and close.iloc[1] < close.iloc[0]:
-    #     bull = False
-    #     ep = low.iloc[0]
-    #     psa_values[0] = high.iloc[0]
-
-    for i in range(1, length):
-        prev_psa = psa_values[i-1]
-        prev_ep = ep
-        prev_af = af
-
-        if bull:
-            current_psa = prev_psa + prev_af * (prev_ep - prev_psa)
-            # SAR cannot be higher than the low of the previous two periods
-            current_psa = min(current_psa, low.iloc[i-1], low.iloc[i-2] if i > 1 else low.iloc[i-1])
-
-            if low.iloc[i] < current_psa: # Trend reversal to Bear
-                bull = False
-                current_psa = prev_ep # SAR starts at the last extreme high
-                ep = low.iloc[i]     # New extreme point is the current low
-                af = af_initial # Reset AF
-            else: # Continue Bull trend
-                # If new high is made, update EP and increment AF
-                if high.iloc[i] > ep:
-                    ep = high.iloc[i]
-                    af = min(prev_af + af_step, af_max)
-                else:
-                    af = prev_af # AF doesn't change if EP not exceeded
-        else: # Bear trend
-            current_psa = prev_psa + prev_af * (prev_ep - prev_psa)
-            # SAR cannot be lower than the high of the previous two periods
-            current_psa = max(current_psa, high.iloc[i-1], high.iloc[i-2] if i > 1 else high.iloc[i-1])
-
-            if high.iloc[i] > current_psa: # Trend reversal to Bull
-                bull = True
-                current_psa = prev_ep # SAR starts at the last extreme low
-                ep = high.iloc[i]     # New extreme point is the current high
-                af = af_initial # Reset AF
-            else: # Continue Bear trend
-                # If new low is made, update EP and increment AF
-                if low.iloc[i] < ep:
-                    ep = low.iloc[i]
-                    af = min(prev_af + af_step, af_max)
-                else:
-                    af = prev_af # AF doesn't change if EP not exceeded
-
-        psa_values[i] = current_psa
-        trend_is_bull[i] = bull
-        
-        # Populate the appropriate trend-specific array
-        if bull:
-            psa_bullish[i] = current_psa
-        else:
-            psa_bearish[i] = current_psa
+    # Split the SAR into trend-specific series
+    psa_bullish = np.where(trend_is_bull, psa_values, np.nan)
+    psa_bearish = np.where(trend_is_bull, np.nan, psa_values)
 
     # Create a DataFrame with the base PSA values
     result = pd.DataFrame(
@@ -1,6 +1,8 @@
 import pandas as pd
 import numpy as np
 
+from ..kernels import supertrend
+
 def str(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tuple:
     """
     Calculates the SuperTrend indicator (str).
@@ -84,88 +86,26 @@ def str(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tupl
     up_band = mid_price + (multiplier * atr)
     low_band = mid_price - (multiplier * atr)
     
-    # Create result dataframe
-    result = pd.DataFrame(index=df.index)
-    result['ATR'] = atr # For reference if needed
-    result['Basic_up_band'] = up_band # Basic upper band before adjustment
-    result['Basic_low_band'] = low_band # Basic lower band before adjustment
-    result['STR'] = np.nan
-    result['Direction'] = 0  # 1 for uptrend, -1 for downtrend, 0 for undetermined
-
-    # The first 'window-1' ATR values might be less reliable or NaN if min_periods=window.
-    # We start calculations from the first valid ATR.
-    # With min_periods=1 for ATR, we can start earlier, but Supertrend logic itself needs a previous ST value.
-    # Iterative calculation for SuperTrend
-    for i in range(len(df)):
-        if i < window -1 : # ATR might not be stable enough or is NaN. Or first window elements for rolling
-            result.loc[result.index[i], 'STR'] = np.nan # Or some initial value if preferred
-            result.loc[result.index[i], 'Direction'] = 0
-            continue
+    # Iterate the Supertrend state machine. The trend is initialized at the first
+    # point where ATR covers a full window; earlier values are NaN with direction 0.
+    str_values, direction = supertrend(close.to_numpy(dtype=float), up_band.to_numpy(dtype=float),
+                                       low_band.to_numpy(dtype=float), window - 1)
 
-        # Initial SuperTrend and direction value (e.g., at index `window-1` or first calculable)
-        if i == window -1: # First point where ATR is based on `window` lookback
-                           # or first point to set an initial trend
-            if close.iloc[i] > result.loc[result.index[i], 'Basic_low_band']:
-                result.loc[result.index[i], 'Direction'] = 1
-                result.loc[result.index[i], 'STR'] = result.loc[result.index[i], 'Basic_low_band']
-            else: # close <= basic_low_band (could also be close < basic_up_band)
-                result.loc[result.index[i], 'Direction'] = -1
-                result.loc[result.index[i], 'STR'] = result.loc[result.index[i], 'Basic_up_band']
-            continue
-
-        # Previous values
-        prev_direction = result.loc[result.index[i-1], 'Direction']
-        prev_str = result.loc[result.index[i-1], 'STR']
-        
-        curr_close = close.iloc[i]
-        curr_basic_up_band = result.loc[result.index[i], 'Basic_up_band']
-        curr_basic_low_band = result.loc[result.index[i], 'Basic_low_band']
-        
-        curr_direction = prev_direction
-        curr_supertrend = np.nan
+    result = pd.DataFrame({
+        f'STR_{window}_{multiplier}': str_values,
+        f'Direction_{window}_{multiplier}': direction,
+    }, index=df.index)
 
-        if prev_direction == 1: # Previous trend was UP
-            curr_supertrend = max(prev_str, curr_basic_low_band) # Ratchet: ST cannot go down in uptrend
-            if curr_close < curr_supertrend: # Price crossed below ST line
-                curr_direction = -1 # Change trend to DOWN
-                curr_supertrend = curr_basic_up_band # New ST is the upper band
-        elif prev_direction == -1: # Previous trend was DOWN
-            curr_supertrend = min(prev_str, curr_basic_up_band) # Ratchet: ST cannot go up in downtrend
-            if curr_close > curr_supertrend: # Price crossed above ST line
-                curr_direction = 1 # Change trend to UP
-                curr_supertrend = curr_basic_low_band # New ST is the lower band
-        else: # Previous direction was 0 (e.g. initial state before window-1)
-            # This case should ideally be handled by the i == window-1 block
-            # For robustness, re-evaluate based on current price vs bands
-            if curr_close > curr_basic_low_band:
-                curr_direction = 1
-                curr_supertrend = curr_basic_low_band
-            else:
-                curr_direction = -1
-                curr_supertrend = curr_basic_up_band
-                
-        result.loc[result.index[i], 'Direction'] = curr_direction
-        result.loc[result.index[i], 'STR'] = curr_supertrend
+    # Split the line into trend-specific series
+    result[f'STR_Bullish_{window}_{multiplier}'] = np.where(direction == 1, str_values, np.nan)
+    result[f'STR_Bearish_{window}_{multiplier}'] = np.where(direction == -1, str_values, np.nan)
 
-        df = result[['STR', 'Direction']].copy()
-        df.rename(columns={'STR': f'STR_{window}_{multiplier}', 
-                           'Direction': f'Direction_{window}_{multiplier}'},
-                           inplace=True)
+    # Fill NaN values with scaled close prices
+    result[f'STR_Bullish_{window}_{multiplier}'] = result[f'STR_Bullish_{window}_{multiplier}'].fillna(close * 1.5)
+    result[f'STR_Bearish_{window}_{multiplier}'] = result[f'STR_Bearish_{window}_{multiplier}'].fillna(close * 0.5)
 
-        # Initialize Bullish and Bearish SuperTrend values
-        df[f'STR_Bullish_{window}_{multiplier}'] = np.nan
-        df[f'STR_Bearish_{window}_{multiplier}'] = np.nan
-        
-        # Set Bullish and Bearish values directly
-        df.loc[df[f'Direction_{window}_{multiplier}'] == 1, f'STR_Bullish_{window}_{multiplier}'] = df.loc[df[f'Direction_{window}_{multiplier}'] == 1, f'STR_{window}_{multiplier}']
-        df.loc[df[f'Direction_{window}_{multiplier}'] == -1, f'STR_Bearish_{window}_{multiplier}'] = df.loc[df[f'Direction_{window}_{multiplier}'] == -1, f'STR_{window}_{multiplier}']
-        
-        # Fill NaN values with scaled close prices
-        df[f'STR_Bullish_{window}_{multiplier}'] = df[f'STR_Bullish_{window}_{multiplier}'].fillna(close * 1.5)
-        df[f'STR_Bearish_{window}_{multiplier}'] = df[f'STR_Bearish_{window}_{multiplier}'].fillna(close * 0.5)
-        
-    columns_list = list(df.columns)
-    return df, columns_list
+    columns_list = list(result.columns)
+    return result, columns_list
 
 
 def strategy_str(
@@ -1,5 +1,7 @@
 import pandas as pd
 
+from ..kernels import wilder_smoothing
+
 
 def atp(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tuple:
     """
@@ -73,17 +75,12 @@ def atp(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tupl
     tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
     
     # Calculate ATR using Wilder's smoothing method
-    atr_values = pd.Series(index=close.index, dtype=float)
-    
     # First ATR value is simple average of first 'window' TRs
     first_atr = tr.iloc[:window].mean()
     
-    # Use the first value to start the smoothing process
-    atr_values.iloc[window-1] = first_atr
-    
-    # Apply Wilder's smoothing method for the rest of the values
-    for i in range(window, len(close)):
-        atr_values.iloc[i] = ((atr_values.iloc[i-1] * (window-1)) + tr.iloc[i]) / window
+    # Seed the smoothing with the first value and apply Wilder's method to the rest
+    atr_values = pd.Series(wilder_smoothing(tr.to_numpy(dtype=float), window, window-1, first_atr),
+                           index=close.index)
     
     # Convert ATR to percentage of closing price
     atp_values = (atr_values / close) * 100
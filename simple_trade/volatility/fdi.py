@@ -1,6 +1,8 @@
 import pandas as pd
 import numpy as np
 
+from ..kernels import rolling_window_apply
+
 
 def fdi(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tuple:
     """
@@ -54,33 +56,29 @@ def fdi(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tupl
     
     close = df[close_col]
     
-    def calculate_fdi(window):
-        if len(window) < 2:
-            return 1.5
-        
-        n = len(window)
-        prices = window.values
+    def calculate_fdi(windows):
+        n = windows.shape[1]
+        if n < 2:
+            return np.full(len(windows), 1.5)
         
         # Calculate path length
-        path_length = np.sum(np.abs(np.diff(prices)))
+        path_length = np.sum(np.abs(np.diff(windows, axis=1)), axis=1)
         
         # Calculate direct distance
-        direct_distance = abs(prices[-1] - prices[0])
-        
-        if direct_distance == 0 or path_length == 0:
-            return 1.5
+        direct_distance = np.abs(windows[:, -1] - windows[:, 0])
         
         # Fractal dimension approximation
         # FD = log(path_length) / log(direct_distance)
         # Normalized to 1-2 range
-        fd = 1 + (np.log(path_length) - np.log(direct_distance)) / np.log(n)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            fd = 1 + (np.log(path_length) - np.log(direct_distance)) / np.log(n)
         
         # Clip to reasonable range
         fd = np.clip(fd, 1.0, 2.0)
         
-        return fd
+        return np.where((direct_distance == 0) | (path_length == 0), 1.5, fd)
     
-    fdi_values = close.rolling(window=period).apply(calculate_fdi, raw=False)
+    fdi_values = pd.Series(rolling_window_apply(close.to_numpy(dtype=float), period, calculate_fdi), index=close.index)
     
     fdi_values.name = f'FDI_{period}'
     return fdi_values, [fdi_values.name]
@@ -1,5 +1,7 @@
 import pandas as pd
 
+from ..kernels import wilder_smoothing
+
 
 def hav(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tuple:
     """
@@ -83,13 +85,11 @@ def hav(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tupl
     # Calculate Heikin-Ashi candles
     ha_close = (open_price + high + low + close) / 4
     
-    # Initialize HA_Open
-    ha_open = pd.Series(index=close.index, dtype=float)
-    ha_open.iloc[0] = (open_price.iloc[0] + close.iloc[0]) / 2
-    
-    # Calculate HA_Open iteratively
-    for i in range(1, len(close)):
-        ha_open.iloc[i] = (ha_open.iloc[i-1] + ha_close.iloc[i-1]) / 2
+    # HA_Open is the midpoint of the previous HA_Open and HA_Close, i.e. Wilder's
+    # smoothing with a length of 2 applied to the previous HA_Close
+    first_ha_open = (open_price.iloc[0] + close.iloc[0]) / 2
+    ha_open = pd.Series(wilder_smoothing(ha_close.shift(1).to_numpy(dtype=float), 2, 0, first_ha_open),
+                        index=close.index)
     
     # Calculate HA_High and HA_Low
     ha_high = pd.concat([high, ha_open, ha_close], axis=1).max(axis=1)
@@ -105,12 +105,9 @@ def hav(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tupl
         tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
         
         # Apply Wilder's smoothing method
-        hav_values = pd.Series(index=close.index, dtype=float)
         first_hav = tr.iloc[:period].mean()
-        hav_values.iloc[period-1] = first_hav
-        
-        for i in range(period, len(close)):
-            hav_values.iloc[i] = ((hav_values.iloc[i-1] * (period-1)) + tr.iloc[i]) / period
+        hav_values = pd.Series(wilder_smoothing(tr.to_numpy(dtype=float), period, period-1, first_hav),
+                               index=close.index)
     
     elif method == 'std':
         # Calculate standard deviation of HA_Close
@@ -1,5 +1,8 @@
+import numpy as np
 import pandas as pd
 
+from ..kernels import rolling_window_apply
+
 
 def mad(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tuple:
     """
@@ -60,15 +63,15 @@ def mad(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tupl
     # Calculate returns
     returns = close.pct_change()
     
-    def calculate_mad(window):
-        if len(window) < 2:
-            return 0
-        median_return = window.median()
-        abs_deviations = (window - median_return).abs()
-        mad_value = abs_deviations.median() * scale_factor
-        return mad_value
+    def calculate_mad(windows):
+        if windows.shape[1] < 2:
+            return np.zeros(len(windows))
+        median_return = np.median(windows, axis=1, keepdims=True)
+        abs_deviations = np.abs(windows - median_return)
+        return np.median(abs_deviations, axis=1) * scale_factor
     
-    mad_values = returns.rolling(window=period).apply(calculate_mad, raw=False)
+    mad_values = pd.Series(rolling_window_apply(returns.to_numpy(dtype=float), period, calculate_mad),
+                           index=returns.index)
     
     # Convert to percentage
     mad_values = mad_values * 100
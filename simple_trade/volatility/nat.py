@@ -1,5 +1,7 @@
 import pandas as pd
 
+from ..kernels import wilder_smoothing
+
 
 def nat(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tuple:
     """
@@ -66,12 +68,9 @@ def nat(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tupl
     tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
     
     # Calculate ATR using Wilder's smoothing
-    atr_values = pd.Series(index=close.index, dtype=float)
     first_atr = tr.iloc[:window].mean()
-    atr_values.iloc[window-1] = first_atr
-    
-    for i in range(window, len(close)):
-        atr_values.iloc[i] = ((atr_values.iloc[i-1] * (window-1)) + tr.iloc[i]) / window
+    atr_values = pd.Series(wilder_smoothing(tr.to_numpy(dtype=float), window, window-1, first_atr),
+                           index=close.index)
     
     # Normalize to percentage
     nat_values = (atr_values / close) * 100
@@ -1,5 +1,7 @@
 import pandas as pd
 
+from ..kernels import wilder_smoothing
+
 
 def svi(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tuple:
     """
@@ -87,12 +89,9 @@ def svi(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tupl
     tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
     
     # Calculate ATR using Wilder's smoothing method
-    atr_values = pd.Series(index=close.index, dtype=float)
     first_atr = tr.iloc[:atr_period].mean()
-    atr_values.iloc[atr_period-1] = first_atr
-    
-    for i in range(atr_period, len(close)):
-        atr_values.iloc[i] = ((atr_values.iloc[i-1] * (atr_period-1)) + tr.iloc[i]) / atr_period
+    atr_values = pd.Series(wilder_smoothing(tr.to_numpy(dtype=float), atr_period, atr_period-1, first_atr),
+                           index=close.index)
     
     # Apply Stochastic formula to ATR
     lowest_atr = atr_values.rolling(window=stoch_period).min()
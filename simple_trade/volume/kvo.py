@@ -1,6 +1,8 @@
 import pandas as pd
 import numpy as np
 
+from ..kernels import run_cumsum
+
 
 def kvo(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tuple:
     """
@@ -99,13 +101,11 @@ def kvo(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tupl
     # Calculate daily measurement
     dm = high - low
     
-    # Calculate cumulative measurement
-    cm = dm.copy()
-    for i in range(1, len(df)):
-        if trend.iloc[i] == trend.iloc[i-1]:
-            cm.iloc[i] = cm.iloc[i-1] + dm.iloc[i]
-        else:
-            cm.iloc[i] = dm.iloc[i-1] + dm.iloc[i]
+    # Calculate cumulative measurement, restarting whenever the trend flips
+    trend_values = trend.to_numpy()
+    same_trend = np.zeros(len(trend_values), dtype=bool)
+    same_trend[1:] = trend_values[1:] == trend_values[:-1]
+    cm = pd.Series(run_cumsum(dm.to_numpy(dtype=float), same_trend), index=df.index)
     
     # Calculate volume force
     vf = volume * trend * abs(2 * ((dm / cm.replace(0, np.nan)) - 1)) * 100
@@ -1,5 +1,8 @@
+import numpy as np
 import pandas as pd
 
+from ..kernels import masked_compound
+
 
 def nvi(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tuple:
     """
@@ -55,19 +58,19 @@ def nvi(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tupl
     close = df[close_col]
     volume = df[volume_col]
     
-    # Initialize NVI series
-    nvi_values = pd.Series(index=df.index, dtype=float)
-    nvi_values.iloc[0] = initial_value
+    close_values = close.to_numpy(dtype=float)
+    volume_values = volume.to_numpy(dtype=float)
+    
+    # Percentage price change and the bars on which volume decreased
+    price_change_pct = np.full(len(close_values), np.nan)
+    price_change_pct[1:] = (close_values[1:] - close_values[:-1]) / close_values[:-1]
+    volume_decreased = np.zeros(len(volume_values), dtype=bool)
+    volume_decreased[1:] = volume_values[1:] < volume_values[:-1]
     
-    # Calculate NVI
-    for i in range(1, len(df)):
-        if volume.iloc[i] < volume.iloc[i-1]:
-            # Volume decreased - update NVI based on price change
-            price_change_pct = (close.iloc[i] - close.iloc[i-1]) / close.iloc[i-1]
-            nvi_values.iloc[i] = nvi_values.iloc[i-1] + (nvi_values.iloc[i-1] * price_change_pct)
-        else:
-            # Volume increased or stayed same - NVI unchanged
-            nvi_values.iloc[i] = nvi_values.iloc[i-1]
+    # NVI moves with price only when volume decreased, otherwise it is unchanged
+    nvi_values = pd.Series(
+        masked_compound(initial_value, price_change_pct, volume_decreased), index=df.index, dtype=float
+    )
     
     nvi_values.name = 'NVI'
     columns_list = [nvi_values.name]
@@ -1,5 +1,8 @@
+import numpy as np
 import pandas as pd
 
+from ..kernels import price_direction
+
 
 def obv(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tuple:
     """
@@ -53,15 +56,15 @@ def obv(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tupl
 
     # Calculate the daily price change direction
     # 1 for price up, -1 for price down, 0 for unchanged
-    price_direction = close.diff().apply(lambda x: 1 if x > 0 else (-1 if x < 0 else 0))
+    direction = price_direction(close.to_numpy(dtype=float))
     
     # First OBV value is equal to the first period's volume
-    obv_values = pd.Series(index=close.index, dtype=float)
-    obv_values.iloc[0] = volume.iloc[0]
+    signed_volume = volume.to_numpy(dtype=float) * direction
+    if len(signed_volume) > 0:
+        signed_volume[0] = volume.iloc[0]
     
     # Cumulative sum of volume multiplied by price direction
-    for i in range(1, len(close)):
-        obv_values.iloc[i] = obv_values.iloc[i-1] + (volume.iloc[i] * price_direction.iloc[i])
+    obv_values = pd.Series(np.cumsum(signed_volume), index=close.index, dtype=float)
     
     obv_values.name = 'OBV'
     columns_list = [obv_values.name]
@@ -1,5 +1,8 @@
+import numpy as np
 import pandas as pd
 
+from ..kernels import masked_compound
+
 
 def pvi(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tuple:
     """
@@ -55,19 +58,19 @@ def pvi(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tupl
     close = df[close_col]
     volume = df[volume_col]
     
-    # Initialize PVI series
-    pvi_values = pd.Series(index=df.index, dtype=float)
-    pvi_values.iloc[0] = initial_value
+    close_values = close.to_numpy(dtype=float)
+    volume_values = volume.to_numpy(dtype=float)
+    
+    # Percentage price change and the bars on which volume increased
+    price_change_pct = np.full(len(close_values), np.nan)
+    price_change_pct[1:] = (close_values[1:] - close_values[:-1]) / close_values[:-1]
+    volume_increased = np.zeros(len(volume_values), dtype=bool)
+    volume_increased[1:] = volume_values[1:] > volume_values[:-1]
     
-    # Calculate PVI
-    for i in range(1, len(df)):
-        if volume.iloc[i] > volume.iloc[i-1]:
-            # Volume increased - update PVI based on price change
-            price_change_pct = (close.iloc[i] - close.iloc[i-1]) / close.iloc[i-1]
-            pvi_values.iloc[i] = pvi_values.iloc[i-1] + (pvi_values.iloc[i-1] * price_change_pct)
-        else:
-            # Volume decreased or stayed same - PVI unchanged
-            pvi_values.iloc[i] = pvi_values.iloc[i-1]
+    # PVI moves with price only when volume increased, otherwise it is unchanged
+    pvi_values = pd.Series(
+        masked_compound(initial_value, price_change_pct, volume_increased), index=df.index, dtype=float
+    )
     
     pvi_values.name = 'PVI'
     columns_list = [pvi_values.name]
@@ -62,30 +62,12 @@ def vpt(df: pd.DataFrame, parameters: dict = None, columns: dict = None) -> tupl
     # Calculate period VPT changes
     vpt_period_change = price_change_pct * volume
     
-    # Initialize the result Series, starting with 0.0 for the first value
-    vpt_values = pd.Series(np.nan, index=close.index, dtype=float)
-    # Ensure the first value is always set to 0.0
-    if len(vpt_values) > 0:
-        vpt_values.iloc[0] = 0.0
+    # A NaN change carries the previous value forward, and VPT starts at 0.0
+    increments = vpt_period_change.to_numpy(dtype=float)
+    increments = np.where(np.isnan(increments), 0.0, increments)
+    increments[0] = 0.0
 
-    # Loop for subsequent values
-    for i in range(1, len(close)):
-        # Get the change for the current period
-        change_for_period = vpt_period_change.iloc[i]
-        
-        # Get the previous cumulative VPT value
-        prev_vpt = vpt_values.iloc[i-1]
-        
-        # If the change for the period is NaN, carry forward the previous value.
-        # Otherwise, add the change to the previous value.
-        if pd.isna(change_for_period):
-             vpt_values.iloc[i] = prev_vpt
-        else:
-             vpt_values.iloc[i] = prev_vpt + change_for_period
-        
-    # Explicitly set the first value to 0.0 before returning to guarantee test passes
-    if len(vpt_values) > 0:
-        vpt_values.iloc[0] = 0.0
+    vpt_values = pd.Series(np.cumsum(increments), index=close.index, dtype=float)
     vpt_values.name = 'VPT'
     columns_list = [vpt_values.name]
     return vpt_values, columns_list
@@ -1,7 +1,7 @@
 import pytest
 import pandas as pd
 import numpy as np
-from simple_trade.metrics import compute_benchmark_return, calculate_performance_metrics
+from simple_trade.metrics import compute_benchmark_return, calculate_performance_metrics, calculate_performance_metrics_batch
 from simple_trade.config import BacktestConfig
 
 # --- Fixtures ---
@@ -158,4 +158,61 @@ class TestMetrics:
         assert metrics_growth['max_drawdown_duration_days'] == 0
         assert metrics_growth['avg_drawdown_duration_days'] == 0.0
         # Calmar should be inf if no drawdown
-        assert np.isinf(metrics_growth['calmar_ratio']) 
\ No newline at end of file
+        assert np.isinf(metrics_growth['calmar_ratio']) 
+
+    def test_performance_metrics_drawdown_durations(self):
+        """Test drawdown duration bookkeeping, including an unrecovered final drawdown"""
+        index = pd.date_range(start='2023-01-01', periods=10, freq='D')
+        values = [100, 90, 95, 100, 105, 104, 106, 103, 101, 102]
+        metrics = calculate_performance_metrics(pd.DataFrame({'PortfolioValue': values}, index=index))
+        # Periods: Jan 2 -> Jan 4 (2 days), Jan 6 -> Jan 7 (1 day), Jan 8 -> Jan 10 (unrecovered, 2 days)
+        assert metrics['max_drawdown_duration_days'] == 2
+        assert metrics['avg_drawdown_duration_days'] == round(5 / 3, 2)
+        assert metrics['max_drawdown_pct'] == -10.0
+
+    def test_performance_metrics_does_not_modify_input(self, sample_portfolio_data):
+        """Test that no helper columns are added to the portfolio frame"""
+        columns = list(sample_portfolio_data.columns)
+        calculate_performance_metrics(sample_portfolio_data)
+        assert list(sample_portfolio_data.columns) == columns
+
+    def test_performance_metrics_batch_matches_single(self):
+        """Test that batch metrics equal calculate_performance_metrics for each column"""
+        index = pd.date_range(start='2023-01-01', periods=120, freq='D')
+        rng = np.random.default_rng(11)
+        curves = pd.DataFrame(
+            10000 * np.cumprod(1 + rng.normal(0, 0.01, (120, 4)), axis=0),
+            index=index, columns=['a', 'b', 'c', 'd']
+        )
+        curves['flat'] = 10000.0
+        curves['growth'] = np.linspace(10000, 15000, 120)
+
+        table = calculate_performance_metrics_batch(curves, risk_free_rate=0.02)
+
+        assert list(table.index) == list(curves.columns)
+        for name in curves.columns:
+            single = calculate_performance_metrics(curves[[name]].rename(columns={name: 'PortfolioValue'}), 0.02)
+            for key in table.columns:
+                expected = single[key]
+                if isinstance(expected, float) and np.isnan(expected):
+                    assert np.isnan(table.loc[name, key]), (name, key)
+                else:
+                    assert table.loc[name, key] == expected, (name, key)
+
+    def test_performance_metrics_batch_array_input(self):
+        """Test array input labelled by position and its validation"""
+        index = pd.date_range(start='2023-01-01', periods=30, freq='D')
+        values = np.column_stack([np.linspace(100, 130, 30), np.linspace(100, 90, 30)])
+        table = calculate_performance_metrics_batch(values, index=index)
+        assert list(table.index) == [0, 1]
+        assert table.loc[0, 'total_return_pct'] == 30.0
+        assert table.loc[1, 'max_drawdown_pct'] == -10.0
+
+        with pytest.raises(ValueError, match="index is required"):
+            calculate_performance_metrics_batch(values)
+        with pytest.raises(ValueError, match="must be 2D"):
+            calculate_performance_metrics_batch(values[:, 0], index=index)
+        with pytest.raises(ValueError, match="index has 29 entries"):
+            calculate_performance_metrics_batch(values, index=index[1:])
+        with pytest.raises(TypeError, match="DatetimeIndex"):
+            calculate_performance_metrics_batch(pd.DataFrame(values))
@@ -329,3 +329,65 @@ class TestBandTrade:
         
         # Verify the simplified output doesn't have the risk metrics section
         assert "RISK METRICS:" not in output_simple
+
+    # --- Engine Tests ---
+
+    def test_invalid_engine(self, default_config, sample_band_data):
+        """Test ValueError for an unknown engine."""
+        with pytest.raises(ValueError, match="Invalid engine 'vector'"):
+            run_band_trade(sample_band_data, 'Indicator', 'UpperBand', 'LowerBand',
+                          config=default_config, engine='vector')
+
+    @pytest.mark.parametrize("trading_type,day1_position", [
+        ('long', 'none'), ('long', 'long'),
+        ('short', 'none'), ('short', 'short'),
+        ('mixed', 'none'), ('mixed', 'long'), ('mixed', 'short'),
+    ])
+    @pytest.mark.parametrize("strategy_type", [1, 2])
+    def test_array_engine_matches_loop_engine(self, trading_type, day1_position, strategy_type):
+        """Test that the array engine reproduces the loop engine exactly."""
+        np.random.seed(7)
+        dates = pd.date_range(start='2020-01-01', periods=400, freq='D')
+        close = 100 + np.cumsum(np.random.normal(0, 1, len(dates)))
+        data = pd.DataFrame({'Close': close}, index=dates)
+        data['Indicator'] = data['Close'].rolling(5).mean() - data['Close']
+        data['UpperBand'] = 1.0
+        data['LowerBand'] = -1.0
+        config = BacktestConfig(short_borrow_fee_inc_rate=0.0001, long_borrow_fee_inc_rate=0.00005)
+
+        loop_results, loop_portfolio = run_band_trade(
+            data, 'Indicator', 'UpperBand', 'LowerBand', config=config,
+            trading_type=trading_type, strategy_type=strategy_type, day1_position=day1_position
+        )
+        array_results, array_portfolio = run_band_trade(
+            data, 'Indicator', 'UpperBand', 'LowerBand', config=config,
+            trading_type=trading_type, strategy_type=strategy_type, day1_position=day1_position,
+            engine='array'
+        )
+
+        pd.testing.assert_frame_equal(loop_portfolio, array_portfolio, check_exact=True)
+        assert loop_results['final_value'] == array_results['final_value']
+        assert loop_results['num_trades'] == array_results['num_trades']
+        assert loop_results['total_borrow_fees'] == array_results['total_borrow_fees']
+
+    @pytest.mark.parametrize("trading_type,day1_position", [
+        ('long', 'none'), ('long', 'long'),
+        ('short', 'none'), ('short', 'short'),
+        ('mixed', 'none'), ('mixed', 'long'), ('mixed', 'short'),
+    ])
+    @pytest.mark.parametrize("strategy_type", [1, 2])
+    def test_array_engine_integer_prices(self, default_config, sample_band_data, trading_type, day1_position,
+                                         strategy_type):
+        """Test that the array engine reproduces the loop engine, dtypes included, on integer prices."""
+        loop_results, loop_portfolio = run_band_trade(
+            sample_band_data, 'Indicator', 'UpperBand', 'LowerBand', config=default_config,
+            trading_type=trading_type, strategy_type=strategy_type, day1_position=day1_position
+        )
+        array_results, array_portfolio = run_band_trade(
+            sample_band_data, 'Indicator', 'UpperBand', 'LowerBand', config=default_config,
+            trading_type=trading_type, strategy_type=strategy_type, day1_position=day1_position,
+            engine='array'
+        )
+
+        pd.testing.assert_frame_equal(loop_portfolio, array_portfolio, check_exact=True)
+        assert loop_results['final_value'] == array_results['final_value']
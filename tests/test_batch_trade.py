@@ -0,0 +1,150 @@
+import pytest
+import pandas as pd
+import numpy as np
+from simple_trade.run_batch_trade_strategies import run_band_trade_batch, run_cross_trade_batch
+from simple_trade.run_band_trade_strategies import run_band_trade, _generate_band_signals
+from simple_trade.run_cross_trade_strategies import run_cross_trade
+from simple_trade.config import BacktestConfig
+
+# --- Fixtures ---
+
+@pytest.fixture
+def sweep_data():
+    """Fixture with a random-walk price and fully populated indicator columns."""
+    np.random.seed(21)
+    dates = pd.date_range(start='2020-01-01', periods=360, freq='D')
+    close = pd.Series(100 + np.cumsum(np.random.normal(0, 1, len(dates))), index=dates)
+    data = pd.DataFrame({'Close': close})
+    for window in range(3, 16):
+        data[f'MA_{window}'] = close.rolling(window).mean()
+        data[f'DEV_{window}'] = data[f'MA_{window}'] - close
+    data = data.iloc[20:].copy()
+    data['Upper'] = 1.0
+    data['Lower'] = -1.0
+    return data
+
+@pytest.fixture
+def fee_config():
+    """Fixture with borrow fees so every cost path is exercised."""
+    return BacktestConfig(short_borrow_fee_inc_rate=0.0001, long_borrow_fee_inc_rate=0.00005)
+
+def _cross_signals(data, pairs):
+    """Builds golden/death cross signal matrices the same way run_cross_trade does."""
+    buys, sells = {}, {}
+    for short_w, long_w in pairs:
+        short_ma, long_ma = data[f'MA_{short_w}'], data[f'MA_{long_w}']
+        buys[(short_w, long_w)] = (short_ma.shift(1) > long_ma.shift(1)) & (short_ma.shift(2) <= long_ma.shift(2))
+        sells[(short_w, long_w)] = (short_ma.shift(1) < long_ma.shift(1)) & (short_ma.shift(2) >= long_ma.shift(2))
+    return pd.DataFrame(buys), pd.DataFrame(sells)
+
+# --- Test Classes ---
+
+class TestBatchInputs:
+    """Tests for input validation of the batch backtests."""
+
+    def test_invalid_index_type(self):
+        """Test that TypeError is raised for non-DatetimeIndex."""
+        data = pd.DataFrame({'Close': [100.0, 101.0]})
+        with pytest.raises(TypeError, match="DataFrame index must be a DatetimeIndex"):
+            run_band_trade_batch(data, np.zeros((2, 1)), np.zeros((2, 1)))
+
+    def test_missing_price_column(self, sweep_data):
+        """Test ValueError if price_col is missing."""
+        with pytest.raises(ValueError, match="Price column 'Open' not found"):
+            run_cross_trade_batch(sweep_data, np.zeros((len(sweep_data), 1)), np.zeros((len(sweep_data), 1)),
+                                  price_col='Open')
+
+    def test_shape_mismatch(self, sweep_data):
+        """Test ValueError if buy and sell matrices differ in shape."""
+        n = len(sweep_data)
+        with pytest.raises(ValueError, match="same shape"):
+            run_band_trade_batch(sweep_data, np.zeros((n, 2)), np.zeros((n, 3)))
+
+    def test_wrong_number_of_rows(self, sweep_data):
+        """Test ValueError if an array has a different number of rows than data."""
+        with pytest.raises(ValueError, match="one row per bar"):
+            run_band_trade_batch(sweep_data, np.zeros((5, 2)), np.zeros((5, 2)))
+
+    def test_incompatible_day1_position(self, sweep_data):
+        """Test ValueError for day1_position='short' with trading_type='long'."""
+        n = len(sweep_data)
+        with pytest.raises(ValueError, match="Cannot use day1_position='short' with trading_type='long'"):
+            run_cross_trade_batch(sweep_data, np.zeros((n, 1)), np.zeros((n, 1)), day1_position='short')
+
+    def test_array_signals_use_positional_labels(self, sweep_data):
+        """Test that ndarray signals produce a RangeIndex results table."""
+        n = len(sweep_data)
+        table = run_band_trade_batch(sweep_data, np.zeros((n, 3)), np.zeros((n, 3)))
+        assert list(table.index) == [0, 1, 2]
+        assert (table['num_trades'] == 0).all()
+        assert (table['final_value'] == 10000.0).all()
+
+
+class TestBandTradeBatch:
+    """Tests that run_band_trade_batch reproduces run_band_trade column by column."""
+
+    @pytest.mark.parametrize("trading_type,day1_position", [
+        ('long', 'none'), ('long', 'long'),
+        ('short', 'none'), ('short', 'short'),
+        ('mixed', 'none'), ('mixed', 'long'), ('mixed', 'short'),
+    ])
+    @pytest.mark.parametrize("strategy_type", [1, 2])
+    def test_matches_single_runs(self, sweep_data, fee_config, trading_type, day1_position, strategy_type):
+        """Test final value, trade count and drawdown against individual backtests."""
+        windows = range(3, 16)
+        buys, sells = {}, {}
+        for window in windows:
+            signals = _generate_band_signals(sweep_data.copy(), f'DEV_{window}', 'Upper', 'Lower', strategy_type)
+            buys[window] = signals['buy_signal']
+            sells[window] = signals['sell_signal']
+
+        table = run_band_trade_batch(
+            sweep_data, pd.DataFrame(buys), pd.DataFrame(sells), config=fee_config,
+            trading_type=trading_type, day1_position=day1_position
+        )
+
+        assert list(table.index) == list(windows)
+        for window in windows:
+            results, _ = run_band_trade(
+                sweep_data, f'DEV_{window}', 'Upper', 'Lower', config=fee_config,
+                trading_type=trading_type, strategy_type=strategy_type, day1_position=day1_position
+            )
+            assert table.loc[window, 'final_value'] == results['final_value']
+            assert table.loc[window, 'total_return_pct'] == results['total_return_pct']
+            assert table.loc[window, 'num_trades'] == results['num_trades']
+            assert table.loc[window, 'max_drawdown_pct'] == results['max_drawdown_pct']
+            assert table.loc[window, 'sharpe_ratio'] == results['sharpe_ratio']
+            assert table.loc[window, 'max_drawdown_duration_days'] == results['max_drawdown_duration_days']
+
+
+class TestCrossTradeBatch:
+    """Tests that run_cross_trade_batch reproduces run_cross_trade column by column."""
+
+    @pytest.mark.parametrize("trading_type,day1_position", [
+        ('long', 'none'), ('long', 'long'),
+        ('short', 'none'), ('short', 'short'),
+        ('mixed', 'none'), ('mixed', 'long'), ('mixed', 'short'),
+    ])
+    def test_matches_single_runs(self, sweep_data, fee_config, trading_type, day1_position):
+        """Test final value, trade count, commissions and drawdown against individual backtests."""
+        pairs = [(short_w, long_w) for short_w in (3, 4, 5) for long_w in (9, 12, 15)]
+        buys, sells = _cross_signals(sweep_data, pairs)
+
+        table = run_cross_trade_batch(
+            sweep_data, buys, sells, config=fee_config,
+            trading_type=trading_type, day1_position=day1_position
+        )
+
+        for short_w, long_w in pairs:
+            results, _ = run_cross_trade(
+                sweep_data, f'MA_{short_w}', f'MA_{long_w}', config=fee_config,
+                trading_type=trading_type, day1_position=day1_position
+            )
+            row = table.loc[(short_w, long_w)]
+            assert row['final_value'] == results['final_value']
+            assert row['total_return_pct'] == results['total_return_pct']
+            assert row['num_trades'] == results['num_trades']
+            assert row['total_commissions'] == results['total_commissions']
+            assert row['max_drawdown_pct'] == results['max_drawdown_pct']
+            assert row['sharpe_ratio'] == results['sharpe_ratio']
+            assert row['max_drawdown_duration_days'] == results['max_drawdown_duration_days']
@@ -2,7 +2,7 @@ import pytest
 import pandas as pd
 import numpy as np
 from unittest.mock import patch, MagicMock
-from simple_trade.run_combined_trade_strategies import run_combined_trade, plot_combined_results
+from simple_trade.run_combined_trade_strategies import run_combined_trade, plot_combined_results, _combine_signals
 from simple_trade.config import BacktestConfig
 
 
@@ -379,6 +379,94 @@ class TestEdgeCases:
         assert results['num_trades'] == 0
 
 
+class TestCombineSignals:
+    """Test the vectorized vote counting in _combine_signals."""
+
+    @staticmethod
+    def _expected_position(positions, combination_logic):
+        """Row-wise reference for the voting rules."""
+        if combination_logic == 'unanimous':
+            if all(p == 'long' for p in positions):
+                return 'long'
+            if all(p == 'short' for p in positions):
+                return 'short'
+            return 'none'
+        long_votes = positions.count('long')
+        short_votes = positions.count('short')
+        if long_votes > short_votes:
+            return 'long'
+        if short_votes > long_votes:
+            return 'short'
+        return 'none'
+
+    @pytest.mark.parametrize("combination_logic", ['unanimous', 'majority'])
+    def test_votes_match_row_wise_reference(self, combination_logic):
+        """Test that array votes match a row-by-row evaluation over many strategies."""
+        rng = np.random.default_rng(3)
+        dates = pd.date_range('2022-01-01', periods=120, freq='D')
+        price_data = pd.DataFrame({'Close': 100 + np.cumsum(rng.normal(0, 1, len(dates)))}, index=dates)
+        portfolio_dfs = []
+        for _ in range(9):
+            start = int(rng.integers(0, 20))
+            sub_dates = dates[start::int(rng.integers(1, 3))]
+            portfolio_dfs.append(pd.DataFrame({
+                'PositionType': rng.choice(['long', 'short', 'none'], len(sub_dates), p=[0.6, 0.3, 0.1])
+            }, index=sub_dates))
+        # Make sure unanimous agreement actually occurs
+        for portfolio_df in portfolio_dfs:
+            portfolio_df.loc[portfolio_df.index >= dates[100], 'PositionType'] = 'long'
+
+        combined = _combine_signals(portfolio_dfs, price_data, 'Close', combination_logic)
+
+        aligned = pd.concat(
+            [df['PositionType'].reindex(dates).ffill() for df in portfolio_dfs], axis=1
+        ).dropna()
+        expected = [self._expected_position(list(row), combination_logic) for row in aligned.itertuples(index=False)]
+
+        assert combined.index.equals(aligned.index)
+        assert combined['PositionType'].tolist() == expected
+        prev = ['none'] + expected[:-1]
+        assert combined['buy_signal'].tolist() == [
+            cur == 'long' and p != 'long' for cur, p in zip(expected, prev)
+        ]
+        assert combined['sell_signal'].tolist() == [
+            (cur == 'short' and p != 'short') or (cur != 'long' and p == 'long') for cur, p in zip(expected, prev)
+        ]
+
+    def test_categorical_position_types(self, sample_price_data, sample_portfolio_df_mixed):
+        """Test that categorical PositionType columns vote like string columns."""
+        categorical = sample_portfolio_df_mixed.astype({'PositionType': 'category'})
+
+        expected = _combine_signals([sample_portfolio_df_mixed], sample_price_data, 'Close', 'majority')
+        result = _combine_signals([categorical], sample_price_data, 'Close', 'majority')
+
+        pd.testing.assert_frame_equal(expected, result)
+
+    @pytest.mark.parametrize("combination_logic", ['unanimous', 'majority'])
+    def test_duplicate_timestamps_use_join_alignment(self, combination_logic):
+        """Test that duplicate timestamps are aligned like a left join instead of raising."""
+        dates = pd.DatetimeIndex(['2022-01-01', '2022-01-02', '2022-01-02', '2022-01-03', '2022-01-04'])
+        price_data = pd.DataFrame({'Close': [100.0, 101.0, 102.0, 103.0, 104.0]}, index=dates)
+        portfolio_dfs = [
+            pd.DataFrame({'PositionType': ['long', 'short', 'long', 'long']}, index=dates[[0, 1, 2, 4]]),
+            pd.DataFrame({'PositionType': ['none', 'long', 'long', 'short']},
+                         index=pd.DatetimeIndex(['2022-01-01', '2022-01-03', '2022-01-03', '2022-01-04'])),
+        ]
+
+        combined = _combine_signals(portfolio_dfs, price_data, 'Close', combination_logic)
+
+        aligned = price_data
+        for i, df in enumerate(portfolio_dfs):
+            aligned = aligned.join(df.rename(columns={'PositionType': f'P{i}'}), how='left')
+        aligned = aligned.ffill().dropna()
+        expected = [self._expected_position([row.P0, row.P1], combination_logic)
+                    for row in aligned.itertuples(index=False)]
+
+        assert combined.index.equals(aligned.index)
+        assert combined['Close'].tolist() == aligned['Close'].tolist()
+        assert combined['PositionType'].tolist() == expected
+
+
 class TestPlotCombinedResults:
     """Test plot_combined_results function."""
 
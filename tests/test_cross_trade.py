@@ -333,4 +333,53 @@ class TestCrossTrade:
         assert "Maximum Drawdown:" in output_detailed
         
         # Verify the simplified output doesn't have the risk metrics section
-        assert "RISK METRICS:" not in output_simple
\ No newline at end of file
+        assert "RISK METRICS:" not in output_simple
+
+    # --- Columnar Log Tests ---
+
+    def test_invalid_log_mode(self, default_config, sample_cross_data):
+        """Test ValueError for an unknown log_mode."""
+        with pytest.raises(ValueError, match="Invalid log_mode 'arrow'"):
+            run_cross_trade(sample_cross_data, 'SMA_S', 'SMA_L', config=default_config, log_mode='arrow')
+
+    @pytest.mark.parametrize("trading_type,day1_position", [
+        ('long', 'none'), ('long', 'long'),
+        ('short', 'none'), ('short', 'short'),
+        ('mixed', 'none'), ('mixed', 'long'), ('mixed', 'short'),
+    ])
+    def test_columnar_log_matches_records_log(self, trading_type, day1_position):
+        """Test that the columnar log reproduces the records log values."""
+        np.random.seed(11)
+        dates = pd.date_range(start='2020-01-01', periods=500, freq='D')
+        data = pd.DataFrame({'Close': 100 + np.cumsum(np.random.normal(0, 1, len(dates)))}, index=dates)
+        data['SMA_S'] = data['Close'].rolling(5).mean()
+        data['SMA_L'] = data['Close'].rolling(20).mean()
+        config = BacktestConfig(short_borrow_fee_inc_rate=0.0001, long_borrow_fee_inc_rate=0.00005)
+
+        records_results, records_portfolio = run_cross_trade(
+            data, 'SMA_S', 'SMA_L', config=config,
+            trading_type=trading_type, day1_position=day1_position
+        )
+        columnar_results, columnar_portfolio = run_cross_trade(
+            data, 'SMA_S', 'SMA_L', config=config,
+            trading_type=trading_type, day1_position=day1_position, log_mode='columnar'
+        )
+
+        assert isinstance(columnar_portfolio['PositionType'].dtype, pd.CategoricalDtype)
+        assert isinstance(columnar_portfolio['Action'].dtype, pd.CategoricalDtype)
+        columnar_as_objects = columnar_portfolio.astype({'PositionType': object, 'Action': object})
+        pd.testing.assert_frame_equal(records_portfolio, columnar_as_objects, check_exact=True)
+        assert records_results['num_trades'] == columnar_results['num_trades']
+        assert records_results['final_value'] == columnar_results['final_value']
+        assert records_results['sharpe_ratio'] == columnar_results['sharpe_ratio']
+
+    def test_columnar_log_is_smaller(self, default_config, sample_cross_data):
+        """Test that the columnar log uses less memory than the records log."""
+        _, records_portfolio = run_cross_trade(sample_cross_data, 'SMA_S', 'SMA_L', config=default_config)
+        _, columnar_portfolio = run_cross_trade(
+            sample_cross_data, 'SMA_S', 'SMA_L', config=default_config, log_mode='columnar'
+        )
+
+        assert columnar_portfolio['Action'].tolist() == records_portfolio['Action'].tolist()
+        assert (columnar_portfolio.memory_usage(deep=True).sum()
+                < records_portfolio.memory_usage(deep=True).sum())
@@ -3,7 +3,8 @@ import pandas as pd
 import numpy as np
 from unittest.mock import MagicMock
 
-from simple_trade.optimize_custom_strategies import custom_optimizer
+from simple_trade import optimize_custom_strategies
+from simple_trade.optimize_custom_strategies import custom_optimizer, get_top_results
 from simple_trade.config import BacktestConfig
 
 # --- Fixtures ---
@@ -159,4 +160,100 @@ class TestOptimize:
 
         # Check that no valid results were found (best_params is None)
         # Note: all_results may still contain entries with -inf metric values
-        assert best_params is None
\ No newline at end of file
+        assert best_params is None
+
+
+class TestStreamingOptimize:
+    """Tests for the streaming mode of the optimize function."""
+
+    @staticmethod
+    def quadratic_backtest(data, x, y, **kwargs):
+        """Backtest whose score peaks at x=3, y=1 and that fails for x=y=0."""
+        if x == y == 0:
+            raise ValueError("failing combination")
+        return {'score': -(x - 3) ** 2 - (y - 1) ** 2}, None
+
+    @pytest.fixture
+    def grid(self):
+        """Returns a 7x5 parameter grid for the quadratic backtest."""
+        return {'x': list(range(7)), 'y': list(range(5))}
+
+    @pytest.mark.parametrize('parallel', [False, True])
+    def test_stream_matches_full_run(self, sample_opt_data, grid, parallel):
+        """Test that streaming finds the same best result and top results as a full run."""
+        expected = custom_optimizer(self.quadratic_backtest, sample_opt_data, grid, 'score', parallel=False)
+        best_params, best_metric, top = custom_optimizer(
+            self.quadratic_backtest, sample_opt_data, grid, 'score',
+            parallel=parallel, n_jobs=2, stream=True, batch_size=4, top_k=5
+        )
+        assert best_params == expected[0] == {'x': 3, 'y': 1}
+        assert best_metric == expected[1]
+        assert top == get_top_results(expected[2], n=5)
+
+    @pytest.mark.parametrize('returns_generator', [True, False])
+    def test_stream_parallel_dispatch(self, sample_opt_data, grid, monkeypatch, returns_generator):
+        """Test the lazy generator dispatch and the wave fallback for older joblib versions."""
+        monkeypatch.setattr(optimize_custom_strategies, '_PARALLEL_RETURNS_GENERATOR', returns_generator)
+        expected = custom_optimizer(self.quadratic_backtest, sample_opt_data, grid, 'score', parallel=False)
+        best_params, _, top = custom_optimizer(
+            self.quadratic_backtest, sample_opt_data, grid, 'score',
+            parallel=True, n_jobs=2, stream=True, batch_size=2, top_k=5
+        )
+        assert best_params == {'x': 3, 'y': 1}
+        assert top == get_top_results(expected[2], n=5)
+
+    @pytest.mark.parametrize('stream', [False, True])
+    def test_negative_n_jobs(self, sample_opt_data, grid, stream):
+        """Test that n_jobs=-2 (all cores but one) works with and without streaming."""
+        best_params, best_metric, _ = custom_optimizer(
+            self.quadratic_backtest, sample_opt_data, grid, 'score', parallel=True, n_jobs=-2, stream=stream
+        )
+        assert best_params == {'x': 3, 'y': 1}
+        assert best_metric == 0
+
+    def test_stream_minimize(self, sample_opt_data, grid):
+        """Test streaming with maximize_metric=False."""
+        best_params, best_metric, top = custom_optimizer(
+            self.quadratic_backtest, sample_opt_data, grid, 'score',
+            maximize_metric=False, parallel=False, stream=True, batch_size=3, top_k=2
+        )
+        assert best_metric == -18
+        assert top == [({'x': 0, 'y': 4}, -18), ({'x': 6, 'y': 4}, -18)]
+
+    def test_stream_ties_keep_first_combination(self, sample_opt_data, grid):
+        """Test that tied scores keep the combinations that came first in the grid."""
+        def flat_backtest(data, x, y):
+            return {'score': 1.0}
+        best_params, _, top = custom_optimizer(
+            flat_backtest, sample_opt_data, grid, 'score',
+            parallel=False, stream=True, batch_size=4, top_k=3
+        )
+        assert best_params == {'x': 0, 'y': 0}
+        assert [p for p, _ in top] == [{'x': 0, 'y': 0}, {'x': 0, 'y': 1}, {'x': 0, 'y': 2}]
+
+    def test_stream_results_sink(self, sample_opt_data, grid, tmp_path):
+        """Test that results_path receives one row per combination, failures included."""
+        results_path = tmp_path / 'results.csv'
+        custom_optimizer(
+            self.quadratic_backtest, sample_opt_data, grid, 'score',
+            parallel=False, stream=True, batch_size=8, top_k=1, results_path=str(results_path)
+        )
+        written = pd.read_csv(results_path)
+        assert list(written.columns) == ['x', 'y', 'score']
+        assert len(written) == 35
+        assert written.loc[0, 'score'] == -np.inf
+
+    def test_stream_invalid_batch_size(self, sample_opt_data, grid):
+        """Test ValueError for a batch_size below 1."""
+        with pytest.raises(ValueError, match="batch_size must be at least 1"):
+            custom_optimizer(self.quadratic_backtest, sample_opt_data, grid, 'score', stream=True, batch_size=0)
+
+    def test_stream_no_valid_results(self, sample_opt_data, grid):
+        """Test that streaming returns None and -inf when every backtest fails."""
+        mock_backtest = MagicMock(side_effect=Exception("Backtest failed"))
+        best_params, best_metric, top = custom_optimizer(
+            mock_backtest, sample_opt_data, grid, 'score', parallel=False, stream=True
+        )
+        assert best_params is None
+        assert best_metric == -np.inf
+        assert top == []
@@ -0,0 +1,93 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from simple_trade import atr, compute_indicator_bank, ema, rsi, sma, std
+
+
+SINGLE_INDICATORS = {'sma': sma, 'ema': ema, 'rsi': rsi, 'atr': atr, 'std': std}
+
+
+@pytest.fixture(params=['clean', 'missing', 'integer'])
+def price_data(request):
+    """Fixture providing random-walk OHLC data, with missing bars or integer prices."""
+    rng = np.random.default_rng(11)
+    dates = pd.date_range(start='2022-01-01', periods=400, freq='D')
+    close = 100 + np.cumsum(rng.normal(0, 1, len(dates)))
+    if request.param == 'integer':
+        close = np.round(close)
+    df = pd.DataFrame({
+        'High': close + rng.uniform(0, 2, len(dates)),
+        'Low': close - rng.uniform(0, 2, len(dates)),
+        'Close': close,
+    }, index=dates)
+    if request.param == 'missing':
+        df.iloc[[0, 1, 50, 51, 52, 300]] = np.nan
+    return df
+
+
+class TestIndicatorBank:
+    """Tests for compute_indicator_bank."""
+
+    @pytest.mark.parametrize("indicator", ['sma', 'ema', 'rsi', 'atr', 'std'])
+    def test_matches_single_indicator(self, price_data, indicator):
+        """Test every window of the bank against the single-window indicator."""
+        windows = [1, 2, 5, 14, 30, 99]
+        bank = compute_indicator_bank(price_data, indicator, window=windows)
+        assert list(bank.columns) == [f'{indicator.upper()}_{w}' for w in windows]
+        assert bank.index.equals(price_data.index)
+
+        for w in windows:
+            expected, columns = SINGLE_INDICATORS[indicator](price_data, parameters={'window': w})
+            assert columns == [f'{indicator.upper()}_{w}']
+            if indicator in ('ema', 'atr', 'std'):
+                np.testing.assert_array_equal(bank[columns[0]], expected)
+            else:
+                np.testing.assert_allclose(bank[columns[0]], expected, rtol=1e-7, atol=1e-9)
+
+    def test_std_on_long_trending_series(self):
+        """Test that STD stays exact on a long series whose prices grow by orders of magnitude."""
+        rng = np.random.default_rng(5)
+        close = 18 * np.exp(np.cumsum(rng.normal(0.00085, 0.012, 6300)))
+        df = pd.DataFrame({'Close': close})
+        bank = compute_indicator_bank(df, 'std', window=[2, 5, 50])
+        for w in (2, 5, 50):
+            expected, _ = std(df, parameters={'window': w})
+            np.testing.assert_array_equal(bank[f'STD_{w}'], expected)
+
+    def test_std_ddof(self, price_data):
+        """Test that ddof is passed to STD and leaves a window of 1 undefined for ddof=1."""
+        bank = compute_indicator_bank(price_data, 'std', window=[1, 10], parameters={'ddof': 1})
+        assert bank['STD_1'].isna().all()
+        expected, _ = std(price_data, parameters={'window': 10, 'ddof': 1})
+        np.testing.assert_array_equal(bank['STD_10'], expected)
+
+    def test_flat_windows_have_zero_std(self):
+        """Test that windows of identical prices have a standard deviation of exactly 0."""
+        df = pd.DataFrame({'Close': [5.0, 1e6, 3.0, 3.0, 3.0, 3.0]})
+        bank = compute_indicator_bank(df, 'std', window=[3, 4])
+        assert bank['STD_3'].iloc[-2:].tolist() == [0.0, 0.0]
+        assert bank['STD_4'].iloc[-1] == 0.0
+
+    def test_custom_close_column(self, price_data):
+        """Test a close column mapped through `columns`."""
+        df = price_data.rename(columns={'Close': 'Price'})
+        bank = compute_indicator_bank(df, 'sma', window=range(3, 6), columns={'close_col': 'Price'})
+        expected, _ = sma(df, parameters={'window': 4}, columns={'close_col': 'Price'})
+        np.testing.assert_allclose(bank['SMA_4'], expected, rtol=1e-9)
+
+    def test_window_longer_than_data(self):
+        """Test that a window longer than the data gives only NaN."""
+        df = pd.DataFrame({'High': [2.0, 3.0], 'Low': [1.0, 2.0], 'Close': [1.5, 2.5]})
+        for indicator in ('sma', 'rsi', 'atr', 'std'):
+            assert compute_indicator_bank(df, indicator, window=[5]).isna().all().all()
+
+    def test_unsupported_indicator(self, price_data):
+        """Test ValueError for an indicator without a bank."""
+        with pytest.raises(ValueError, match="has no bank"):
+            compute_indicator_bank(price_data, 'kst', window=[5])
+
+    def test_invalid_window(self, price_data):
+        """Test ValueError for a window below 1."""
+        with pytest.raises(ValueError):
+            compute_indicator_bank(price_data, 'sma', window=[0, 5])
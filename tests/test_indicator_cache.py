@@ -0,0 +1,175 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from simple_trade import compute_indicator
+from simple_trade.indicator_cache import (
+    CACHE_ENV_VAR,
+    IndicatorCache,
+    clear_indicator_cache,
+    disable_indicator_cache,
+    enable_indicator_cache,
+    get_indicator_cache,
+    indicator_cache_info,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_cache():
+    """Ensure every test starts and ends with the cache disabled."""
+    disable_indicator_cache()
+    yield
+    disable_indicator_cache()
+
+
+@pytest.fixture
+def price_data():
+    """Fixture providing a random-walk OHLCV DataFrame."""
+    rng = np.random.default_rng(7)
+    dates = pd.date_range(start='2022-01-01', periods=200, freq='D')
+    close = 100 + np.cumsum(rng.normal(0, 1, len(dates)))
+    return pd.DataFrame({
+        'Open': close + rng.normal(0, 0.5, len(dates)),
+        'High': close + 1.5,
+        'Low': close - 1.5,
+        'Close': close,
+        'Volume': rng.integers(1000, 5000, len(dates)),
+    }, index=dates)
+
+
+class TestIndicatorCacheState:
+    """Tests for enabling, disabling and configuring the indicator cache."""
+
+    def test_disabled_by_default(self):
+        """Test that the cache is off until it is enabled."""
+        assert get_indicator_cache() is None
+        assert indicator_cache_info()['enabled'] is False
+
+    def test_enable_sets_env_var_for_workers(self):
+        """Test that enabling the cache exports its size to worker processes and disabling removes it."""
+        enable_indicator_cache(max_bytes=1024)
+        assert os.environ[CACHE_ENV_VAR] == '1024'
+        disable_indicator_cache()
+        assert CACHE_ENV_VAR not in os.environ
+
+    def test_enable_without_propagation(self):
+        """Test that propagate_to_workers=False leaves the environment untouched."""
+        enable_indicator_cache(max_bytes=1024, propagate_to_workers=False)
+        assert CACHE_ENV_VAR not in os.environ
+        assert indicator_cache_info()['max_bytes'] == 1024
+
+    def test_invalid_max_bytes(self):
+        """Test ValueError for a non-positive max_bytes."""
+        with pytest.raises(ValueError, match="max_bytes must be positive"):
+            enable_indicator_cache(max_bytes=0)
+
+
+class TestComputeIndicatorCaching:
+    """Tests for compute_indicator with the cache enabled."""
+
+    def test_results_match_uncached(self, price_data):
+        """Test that cached results equal uncached ones and the second call is a hit."""
+        expected, expected_cols, _ = compute_indicator(price_data, 'rsi', figure=False, parameters={'window': 14})
+        enable_indicator_cache()
+        first, first_cols, _ = compute_indicator(price_data, 'rsi', figure=False, parameters={'window': 14})
+        second, second_cols, _ = compute_indicator(price_data, 'rsi', figure=False, parameters={'window': 14})
+
+        pd.testing.assert_frame_equal(first, expected, check_exact=True)
+        pd.testing.assert_frame_equal(second, expected, check_exact=True)
+        assert first_cols == second_cols == expected_cols
+        info = indicator_cache_info()
+        assert info['hits'] == 1
+        assert info['misses'] == 1
+        assert info['entries'] == 1
+        assert info['bytes'] > 0
+
+    def test_parameters_are_part_of_key(self, price_data):
+        """Test that different parameters produce different cache entries."""
+        enable_indicator_cache()
+        compute_indicator(price_data, 'sma', figure=False, parameters={'window': 10})
+        result, _, _ = compute_indicator(price_data, 'sma', figure=False, parameters={'window': 20})
+        assert 'SMA_20' in result.columns
+        assert indicator_cache_info()['misses'] == 2
+
+    def test_numpy_parameters_share_entry(self, price_data):
+        """Test that NumPy and Python scalars with the same value share an entry."""
+        enable_indicator_cache()
+        compute_indicator(price_data, 'sma', figure=False, parameters={'window': 10})
+        compute_indicator(price_data, 'sma', figure=False, parameters={'window': np.int64(10)})
+        assert indicator_cache_info()['hits'] == 1
+
+    def test_changed_data_misses(self, price_data):
+        """Test that modified input data misses the cache and is recomputed."""
+        enable_indicator_cache()
+        compute_indicator(price_data, 'sma', figure=False, parameters={'window': 10})
+        modified = price_data.copy()
+        modified.iloc[50, modified.columns.get_loc('Close')] += 1.0
+        result, _, _ = compute_indicator(modified, 'sma', figure=False, parameters={'window': 10})
+        expected = modified['Close'].rolling(window=10).mean()
+        pd.testing.assert_series_equal(result['SMA_10'], expected, check_names=False)
+        assert indicator_cache_info()['hits'] == 0
+
+    def test_unrelated_columns_do_not_affect_key(self, price_data):
+        """Test that columns the indicator does not read do not change the key."""
+        enable_indicator_cache()
+        compute_indicator(price_data, 'sma', figure=False, parameters={'window': 10})
+        extra = price_data.assign(Signal=1)
+        compute_indicator(extra, 'sma', figure=False, parameters={'window': 10})
+        assert indicator_cache_info()['hits'] == 1
+
+    def test_custom_column_is_fingerprinted(self, price_data):
+        """Test that a column mapped through `columns` is part of the fingerprint."""
+        enable_indicator_cache()
+        data = price_data.assign(Mid=(price_data['High'] + price_data['Low']) / 2)
+        compute_indicator(data, 'sma', figure=False, parameters={'window': 10}, columns={'close_col': 'Mid'})
+        data.loc[data.index[100], 'Mid'] += 5.0
+        compute_indicator(data, 'sma', figure=False, parameters={'window': 10}, columns={'close_col': 'Mid'})
+        assert indicator_cache_info()['hits'] == 0
+
+    def test_clear_resets_counters(self, price_data):
+        """Test that clearing the cache drops its entries and counters."""
+        enable_indicator_cache()
+        compute_indicator(price_data, 'sma', figure=False, parameters={'window': 10})
+        clear_indicator_cache()
+        info = indicator_cache_info()
+        assert info['entries'] == 0
+        assert info['misses'] == 0
+        assert info['bytes'] == 0
+
+
+class TestIndicatorCacheEviction:
+    """Tests for the size limit of IndicatorCache."""
+
+    def test_lru_eviction_by_bytes(self, price_data):
+        """Test that the least recently used entry is evicted once max_bytes is exceeded."""
+        series = price_data['Close'].rename('X')
+        entry_size = int(series.memory_usage(deep=True))
+        cache = IndicatorCache(max_bytes=2 * entry_size)
+        cache.put(('a',), series, ['X'])
+        cache.put(('b',), series, ['X'])
+        assert cache.get(('a',)) is not None  # 'a' becomes most recently used
+        cache.put(('c',), series, ['X'])
+
+        assert cache.get(('b',)) is None
+        assert cache.get(('a',)) is not None
+        assert cache.get(('c',)) is not None
+        assert cache.info()['bytes'] <= cache.max_bytes
+
+    def test_oversized_result_not_stored(self, price_data):
+        """Test that a result larger than the whole cache is not stored."""
+        cache = IndicatorCache(max_bytes=16)
+        cache.put(('a',), price_data['Close'], ['Close'])
+        assert cache.info()['entries'] == 0
+
+    def test_resize_evicts(self, price_data):
+        """Test that shrinking the cache evicts the oldest entries."""
+        series = price_data['Close']
+        entry_size = int(series.memory_usage(deep=True))
+        cache = IndicatorCache(max_bytes=3 * entry_size)
+        for key in ('a', 'b', 'c'):
+            cache.put((key,), series, ['Close'])
+        cache.resize(entry_size)
+        assert cache.info()['entries'] == 1
+        assert cache.get(('c',)) is not None
@@ -0,0 +1,264 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from simple_trade.kernels import (
+    adaptive_ema, hilbert_fir, hilbert_transform, masked_compound, parabolic_sar, price_direction, rolling_weighted_sum, rolling_window_apply,
+    run_cumsum, supertrend, wilder_smoothing, wilder_smoothing_columns
+)
+
+
+class TestPriceDirection:
+    """Tests for the price_direction kernel."""
+
+    def test_direction(self):
+        """Test the sign of each close-to-close change, with 0 around missing prices."""
+        close = np.array([10.0, 11.0, 11.0, 9.0, np.nan, 12.0])
+        np.testing.assert_array_equal(price_direction(close), [0, 1, 0, -1, 0, 0])
+
+    def test_empty(self):
+        """Test an empty input."""
+        assert len(price_direction(np.array([]))) == 0
+
+
+class TestMaskedCompound:
+    """Tests for the masked_compound kernel."""
+
+    def test_matches_loop(self):
+        """Test that the kernel matches the bar-by-bar compounding loop exactly."""
+        rng = np.random.default_rng(0)
+        rates = rng.normal(0, 0.01, 200)
+        mask = rng.random(200) > 0.5
+        expected = [1000.0]
+        for i in range(1, 200):
+            prev = expected[-1]
+            expected.append(prev + prev * rates[i] if mask[i] else prev)
+        np.testing.assert_array_equal(masked_compound(1000, rates, mask), expected)
+
+    def test_no_steps_keeps_initial(self):
+        """Test that the value stays at its initial level when the mask is all False."""
+        out = masked_compound(5.0, np.full(4, 0.1), np.zeros(4, dtype=bool))
+        np.testing.assert_array_equal(out, [5.0] * 4)
+
+    def test_mask_on_first_bar_is_ignored(self):
+        """Test that the first bar never compounds."""
+        out = masked_compound(100.0, np.array([0.5, 0.1]), np.array([True, False]))
+        np.testing.assert_array_equal(out, [100.0, 100.0])
+
+    def test_empty(self):
+        """Test an empty input."""
+        assert len(masked_compound(1.0, np.array([]), np.array([], dtype=bool))) == 0
+
+
+class TestRunCumsum:
+    """Tests for the run_cumsum kernel."""
+
+    @pytest.mark.parametrize("continues,expected", [
+        ([True, True, True, True], [1.0, 3.0, 6.0, 10.0]),
+        ([True, False, True, False], [1.0, 3.0, 6.0, 7.0]),
+        ([False, False, False, False], [1.0, 3.0, 5.0, 7.0]),
+    ])
+    def test_restarts(self, continues, expected):
+        """Test that the running sum restarts wherever the run does not continue."""
+        values = np.array([1.0, 2.0, 3.0, 4.0])
+        np.testing.assert_array_equal(run_cumsum(values, np.array(continues)), expected)
+
+
+class TestWilderSmoothing:
+    """Tests for the wilder_smoothing kernel."""
+
+    def test_matches_loop(self):
+        """Test that the kernel matches the bar-by-bar Wilder recursion exactly."""
+        values = np.random.default_rng(1).random(100)
+        expected = [np.nan] * 13 + [values[:14].mean()]
+        for i in range(14, 100):
+            expected.append((expected[-1] * 13 + values[i]) / 14)
+        np.testing.assert_array_equal(wilder_smoothing(values, 14, 13, values[:14].mean()), expected)
+
+    def test_window_two_is_midpoint_recursion(self):
+        """Test that a window of 2 averages the previous value and the new one."""
+        out = wilder_smoothing(np.array([np.nan, 4.0, 8.0]), 2, 0, 2.0)
+        np.testing.assert_array_equal(out, [2.0, 3.0, 5.5])
+
+    def test_start_beyond_end_is_all_nan(self):
+        """Test that a start past the last bar leaves every value NaN."""
+        assert np.isnan(wilder_smoothing(np.ones(3), 5, 4, 1.0)).all()
+
+    def test_writes_into_out(self):
+        """Test that the result is written into and returned as `out`."""
+        out = np.zeros(3)
+        assert wilder_smoothing(np.ones(3), 2, 1, 1.0, out=out) is out
+        np.testing.assert_array_equal(out, [np.nan, 1.0, 1.0])
+
+
+class TestWilderSmoothingColumns:
+    """Tests for the wilder_smoothing_columns kernel."""
+
+    def test_matches_wilder_smoothing(self):
+        """Test that every column matches wilder_smoothing with its own window and seed."""
+        values = np.random.default_rng(6).random((50, 3))
+        values[20, 1] = np.nan
+        windows = np.array([2, 5, 14])
+        seeds = np.array([1.0, 2.0, 3.0])
+        out = wilder_smoothing_columns(values, windows, windows - 1, seeds)
+        for j, window in enumerate(windows):
+            np.testing.assert_array_equal(out[:, j], wilder_smoothing(values[:, j], window, window - 1, seeds[j]))
+
+    def test_scalar_parameters_broadcast(self):
+        """Test that a scalar window, start and seed apply to every column."""
+        out = wilder_smoothing_columns(np.ones((3, 2)), 2, 1, 0.0)
+        np.testing.assert_array_equal(out, [[np.nan, np.nan], [0.0, 0.0], [0.5, 0.5]])
+
+
+class TestRollingWeightedSum:
+    """Tests for the rolling_weighted_sum kernel."""
+
+    def test_matches_rolling_apply(self):
+        """Test that the kernel matches a rolling dot product, missing values included."""
+        values = pd.Series(np.random.default_rng(2).normal(100, 5, 300))
+        values.iloc[[10, 150, 151]] = np.nan
+        weights = np.array([0.5, 1.0, 2.0, 4.0])
+        expected = values.rolling(4).apply(lambda x: np.dot(x, weights), raw=True)
+        np.testing.assert_allclose(rolling_weighted_sum(values.to_numpy(), weights), expected, rtol=1e-12)
+
+    def test_oldest_value_gets_first_weight(self):
+        """Test that the first weight applies to the oldest value of each window."""
+        out = rolling_weighted_sum(np.array([1.0, 2.0, 3.0]), np.array([1.0, 0.0]))
+        np.testing.assert_array_equal(out, [np.nan, 1.0, 2.0])
+
+    def test_shorter_than_window_is_all_nan(self):
+        """Test that input shorter than the weights gives only NaN."""
+        assert np.isnan(rolling_weighted_sum(np.ones(2), np.ones(3))).all()
+
+    def test_empty_weights_raise(self):
+        """Test ValueError for empty weights."""
+        with pytest.raises(ValueError):
+            rolling_weighted_sum(np.ones(3), np.array([]))
+
+
+class TestRollingWindowApply:
+    """Tests for the rolling_window_apply kernel."""
+
+    @pytest.mark.parametrize("block_bytes", [8, 200, 1 << 20])
+    def test_matches_rolling_apply(self, block_bytes):
+        """Test that blocked window views match rolling().apply() for any block size."""
+        values = pd.Series(np.random.default_rng(3).normal(0, 1, 250))
+        values.iloc[[0, 60, 61, 249]] = np.nan
+        expected = values.rolling(5).apply(lambda x: x.max() - x.min(), raw=True)
+        out = rolling_window_apply(values.to_numpy(), 5, lambda w: w.max(axis=1) - w.min(axis=1),
+                                   block_bytes=block_bytes)
+        np.testing.assert_array_equal(out, expected)
+
+    def test_func_only_sees_complete_windows(self):
+        """Test that windows containing NaN are never passed to func."""
+        seen = []
+
+        def func(windows):
+            seen.append(windows.copy())
+            return windows.sum(axis=1)
+
+        out = rolling_window_apply(np.array([1.0, np.nan, 2.0, 3.0, 4.0]), 2, func)
+        np.testing.assert_array_equal(out, [np.nan, np.nan, np.nan, 5.0, 7.0])
+        assert not np.isnan(np.concatenate(seen)).any()
+
+    def test_shorter_than_window_is_all_nan(self):
+        """Test that input shorter than the window gives only NaN."""
+        assert np.isnan(rolling_window_apply(np.ones(2), 3, lambda w: w.sum(axis=1))).all()
+
+
+class TestParabolicSar:
+    """Tests for the parabolic_sar kernel."""
+
+    def test_uptrend_then_reversal(self):
+        """Test the SAR cap at the previous low and the jump to the extreme point on reversal."""
+        high = np.array([10.0, 11.0, 12.0, 13.0, 9.0])
+        low = np.array([9.0, 10.0, 11.0, 12.0, 8.0])
+        sar, is_bull = parabolic_sar(high, low, 0.02, 0.02, 0.2)
+        np.testing.assert_array_equal(is_bull, [True, True, True, True, False])
+        # 9.02 is capped at the previous low
+        assert sar[1] == 9.0
+        # On reversal the SAR jumps to the extreme high of the uptrend
+        assert sar[4] == 13.0
+
+    def test_empty(self):
+        """Test an empty input."""
+        sar, is_bull = parabolic_sar(np.array([]), np.array([]), 0.02, 0.02, 0.2)
+        assert len(sar) == 0 and len(is_bull) == 0
+
+
+class TestSupertrend:
+    """Tests for the supertrend kernel."""
+
+    def test_ratchets_and_flips(self):
+        """Test that the line only tightens within a trend and switches bands when the trend flips."""
+        close = np.array([10.0, 10.0, 11.0, 12.0, 7.0])
+        up_band = np.array([12.0, 12.0, 13.0, 14.0, 9.5])
+        low_band = np.array([8.0, 8.0, 9.0, 8.5, 5.0])
+        line, direction = supertrend(close, up_band, low_band, 1)
+        np.testing.assert_array_equal(direction, [0, 1, 1, 1, -1])
+        np.testing.assert_array_equal(line, [np.nan, 8.0, 9.0, 9.0, 9.5])
+
+    def test_start_beyond_end(self):
+        """Test that a start past the last bar leaves the line NaN and the direction 0."""
+        line, direction = supertrend(np.ones(3), np.ones(3), np.ones(3), 5)
+        assert np.isnan(line).all() and (direction == 0).all()
+
+
+class TestAdaptiveEma:
+    """Tests for the adaptive_ema kernel."""
+
+    def test_matches_loop(self):
+        """Test that the kernel matches the bar-by-bar time-varying EMA exactly."""
+        rng = np.random.default_rng(4)
+        values = rng.normal(100, 1, 100)
+        alpha = rng.random(100)
+        expected = [values[0]]
+        for i in range(1, 100):
+            expected.append(alpha[i] * values[i] + (1 - alpha[i]) * expected[-1])
+        np.testing.assert_array_equal(adaptive_ema(values, alpha), expected)
+
+    def test_missing_values_hold_previous(self):
+        """Test that a missing value or alpha keeps the previous average."""
+        values = np.array([np.nan, 2.0, np.nan, 4.0, 6.0])
+        alpha = np.array([0.5, 0.5, 0.5, np.nan, 0.5])
+        np.testing.assert_array_equal(adaptive_ema(values, alpha), [np.nan, 2.0, 2.0, 2.0, 4.0])
+
+    def test_nan_seed_starts_from_current_value(self):
+        """Test that the average starts at the first valid value when the seed is NaN."""
+        out = adaptive_ema(np.array([np.nan, 2.0, 4.0]), np.full(3, 0.5), start=0)
+        np.testing.assert_array_equal(out, [np.nan, 2.0, 3.0])
+
+    def test_explicit_seed(self):
+        """Test that an explicit seed is used at the start bar."""
+        out = adaptive_ema(np.array([1.0, 2.0, 4.0]), np.full(3, 0.5), start=1, seed=0.0)
+        np.testing.assert_array_equal(out, [np.nan, 0.0, 2.0])
+
+    def test_all_missing(self):
+        """Test that all-missing input gives only NaN."""
+        assert np.isnan(adaptive_ema(np.full(3, np.nan), np.full(3, 0.5))).all()
+
+
+class TestHilbert:
+    """Tests for the Hilbert transform kernels."""
+
+    def test_fir(self):
+        """Test the four-tap FIR filter and its NaN warm-up."""
+        values = np.arange(10, dtype=float) ** 2
+        out = hilbert_fir(values)
+        assert np.isnan(out[:6]).all()
+        i = 8
+        expected = 0.0962 * values[i] + 0.5769 * values[i - 2] - 0.5769 * values[i - 4] - 0.0962 * values[i - 6]
+        assert out[i] == pytest.approx(expected)
+
+    def test_transform_finds_cycle_period(self):
+        """Test that the smoothed period of a pure sine approaches its cycle length."""
+        t = np.arange(600)
+        result = hilbert_transform(100 + np.sin(2 * np.pi * t / 20))
+        assert set(result) == {'smooth', 'in_phase', 'quadrature', 'period', 'smooth_period', 'phase'}
+        assert result['period'][:6].tolist() == [10.0] * 6
+        assert result['smooth_period'][-100:].mean() == pytest.approx(20, rel=0.1)
+
+    def test_short_input(self):
+        """Test input too short for the filters."""
+        result = hilbert_transform(np.array([1.0, 2.0]))
+        np.testing.assert_array_equal(result['smooth'], [1.0, 2.0])
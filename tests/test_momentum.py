@@ -637,6 +637,19 @@ class TestConnorsRSI:
         
         assert 'CRS_5_3_30' in columns
 
+    def test_crs_components(self):
+        """Test Connors RSI against hand-computed streak, RSI and percent rank"""
+        close = [10.0, 11.0, 12.0, 12.0, 11.0, 10.0, 10.5, 11.0]
+        df = pd.DataFrame({'Close': close})
+        result_data, _ = crs(df, parameters={'rsi_window': 2, 'streak_window': 2, 'rank_window': 4})
+
+        # Last bar: price changes +0.5, +0.5 -> RSI 100
+        # Streaks 0, 1, 2, 0, -1, -2, 1, 2 -> last two changes +3, +1 -> RSI 100
+        # Changes -1, -1, 0.5, 0.5: the last is above two and ties one -> 2.5 / 3
+        expected = (100 + 100 + 2.5 / 3 * 100) / 3
+        assert result_data.iloc[-1] == pytest.approx(expected)
+        assert result_data.iloc[:4].isna().all()
+
 
 class TestMSI:
     """Tests for the Momentum Strength Index"""
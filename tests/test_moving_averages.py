@@ -616,6 +616,17 @@ class TestMAM:
         assert 'MAM' in columns
         assert 'MAM_FAMA' in columns
 
+    def test_mam_include_cycle(self, sample_data):
+        """Test that the Hilbert transform cycle can be returned alongside MAM"""
+        df = pd.DataFrame({'Close': sample_data['close']})
+        base_data, _ = mam(df)
+        result_data, columns = mam(df, parameters={'include_cycle': True})
+
+        assert columns == ['MAM', 'MAM_FAMA', 'MAM_PERIOD', 'MAM_PHASE']
+        pd.testing.assert_frame_equal(result_data[['MAM', 'MAM_FAMA']], base_data)
+        assert result_data['MAM_PERIOD'].between(6, 50).all()
+        assert result_data['MAM_PHASE'].abs().max() <= 90
+
 
 class TestEVW:
     """Tests for the Elastic Volume Weighted Moving Average"""
@@ -0,0 +1,128 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from simple_trade import INDICATORS, compute_indicator, compute_panel_indicator
+from simple_trade.panel import PANEL_INDICATORS, is_panel
+
+
+SYMBOLS = ['AAA', 'BBB', 'CCC']
+FIELDS = ['Open', 'High', 'Low', 'Close', 'Volume']
+
+
+@pytest.fixture
+def wide_panel():
+    """Fixture providing a wide (field, symbol) OHLCV panel with some missing bars."""
+    rng = np.random.default_rng(3)
+    dates = pd.date_range(start='2022-01-01', periods=150, freq='D')
+    shape = (len(dates), len(SYMBOLS))
+    close = pd.DataFrame(100 + np.cumsum(rng.normal(0, 1, shape), axis=0), index=dates, columns=SYMBOLS)
+    fields = {
+        'Open': close + rng.normal(0, 0.3, shape),
+        'High': close + rng.uniform(0.1, 2, shape),
+        'Low': close - rng.uniform(0.1, 2, shape),
+        'Close': close,
+        'Volume': pd.DataFrame(rng.integers(1000, 5000, shape).astype(float), index=dates, columns=SYMBOLS),
+    }
+    fields['Close'].iloc[:5, 1] = np.nan
+    for frame in fields.values():
+        frame.iloc[60:62, 2] = np.nan
+    return pd.concat(fields, axis=1, names=['Price', 'Ticker'])
+
+
+@pytest.fixture
+def long_panel(wide_panel):
+    """Fixture providing the same data as a long (date, symbol) panel where symbols miss different dates."""
+    long = pd.concat({symbol: wide_panel.xs(symbol, axis=1, level=1) for symbol in SYMBOLS},
+                     names=['Ticker', 'Date']).swaplevel().sort_index()
+    return long.drop([(long.index[10][0], 'AAA'), (long.index[90][0], 'CCC')])
+
+
+def single_result(frame, indicator, parameters):
+    """Runs the indicator on one symbol's frame and returns its result as a DataFrame."""
+    result, names = INDICATORS[indicator](frame, parameters=parameters)
+    if isinstance(result, pd.Series):
+        result = result.to_frame(names[0])
+    return result, names
+
+
+PARAMETERS = [
+    ('sma', {'window': 10}),
+    ('ema', {'window': 10}),
+    ('std', {'window': 10}),
+    ('roc', {'period': 5}),
+    ('rsi', {'window': 14}),
+    ('mac', {}),
+    ('bol', {'window': 20, 'num_std': 2.5}),
+    ('atr', {'window': 14}),
+    # Computed symbol by symbol
+    ('cci', {'window': 20}),
+    ('obv', {}),
+]
+
+
+class TestPanel:
+    """Tests for compute_panel_indicator and the panel mode of compute_indicator."""
+
+    def test_covers_panel_indicators(self):
+        """Test that every vectorized panel indicator is exercised by PARAMETERS."""
+        assert set(PANEL_INDICATORS) <= {indicator for indicator, _ in PARAMETERS}
+
+    @pytest.mark.parametrize("indicator,parameters", PARAMETERS)
+    def test_wide_matches_single_symbol(self, wide_panel, indicator, parameters):
+        """Test a wide (field, symbol) panel against the indicator run on each symbol."""
+        result, names = compute_panel_indicator(wide_panel, indicator, parameters=parameters)
+        assert result.columns.names == wide_panel.columns.names
+        for symbol in SYMBOLS:
+            expected, expected_names = single_result(wide_panel.xs(symbol, axis=1, level=1), indicator, parameters)
+            assert names == expected_names
+            for name in names:
+                np.testing.assert_array_equal(result[name][symbol], expected[name])
+
+    @pytest.mark.parametrize("indicator,parameters", PARAMETERS)
+    def test_long_matches_single_symbol(self, long_panel, indicator, parameters):
+        """Test a long (date, symbol) panel against the indicator run on each symbol."""
+        result, names = compute_panel_indicator(long_panel, indicator, parameters=parameters)
+        assert result.index.equals(long_panel.index)
+        for symbol in SYMBOLS:
+            expected, expected_names = single_result(long_panel.xs(symbol, level=1), indicator, parameters)
+            assert names == expected_names
+            for name in names:
+                np.testing.assert_array_equal(result.xs(symbol, level=1)[name], expected[name])
+
+    def test_symbol_level_by_name(self, long_panel):
+        """Test selecting the symbol level of a long panel by name."""
+        swapped = long_panel.swaplevel()
+        result, names = compute_panel_indicator(swapped, 'sma', parameters={'window': 5}, symbol_level='Ticker')
+        expected, _ = compute_panel_indicator(long_panel, 'sma', parameters={'window': 5})
+        np.testing.assert_array_equal(result[names[0]].swaplevel().loc[long_panel.index], expected[names[0]])
+
+    def test_custom_close_column(self, wide_panel):
+        """Test a close column mapped through `columns`."""
+        renamed = wide_panel.rename(columns={'Close': 'Adj Close'}, level=0)
+        result, _ = compute_panel_indicator(renamed, 'ema', parameters={'window': 5}, columns={'close_col': 'Adj Close'})
+        expected, _ = compute_panel_indicator(wide_panel, 'ema', parameters={'window': 5})
+        pd.testing.assert_frame_equal(result['EMA_5'], expected['EMA_5'])
+
+    def test_compute_indicator_panel_mode(self, wide_panel, long_panel):
+        """Test that compute_indicator dispatches panels and returns no figure."""
+        df, columns, fig = compute_indicator(wide_panel, 'rsi', parameters={'window': 14})
+        assert columns == ['RSI_14'] and fig is None
+        assert list(df['RSI_14'].columns) == SYMBOLS
+        df, columns, fig = compute_indicator(long_panel, 'rsi', parameters={'window': 14})
+        assert 'RSI_14' in df.columns and fig is None
+
+    def test_is_panel(self, wide_panel, long_panel):
+        """Test panel detection for wide, long and single-symbol frames."""
+        assert is_panel(wide_panel) and is_panel(long_panel)
+        assert not is_panel(wide_panel.xs('AAA', axis=1, level=1))
+
+    def test_rejects_single_symbol_frame(self, wide_panel):
+        """Test ValueError for a frame that is not a panel."""
+        with pytest.raises(ValueError, match="panel"):
+            compute_panel_indicator(wide_panel.xs('AAA', axis=1, level=1), 'sma')
+
+    def test_unknown_indicator(self, wide_panel):
+        """Test ValueError for an unknown indicator."""
+        with pytest.raises(ValueError, match="not supported"):
+            compute_panel_indicator(wide_panel, 'nope')
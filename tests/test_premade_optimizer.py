@@ -199,6 +199,24 @@ class TestBacktestWorker:
         assert combined_params['initial_cash'] == 10000.0
         assert combined_params['commission_long'] == 0.001
 
+    @patch('simple_trade.optimize_premade_strategies.run_premade_trade')
+    def test_run_backtest_worker_lightweight(self, mock_premade_backtest, sample_ohlcv_data, base_parameters):
+        """Test that lightweight mode returns only numeric metrics"""
+        mock_results = {
+            'strategy': 'Band Trade',
+            'total_return_pct': 15.5,
+            'num_trades': np.int64(4),
+            'start_date': pd.Timestamp('2023-01-01'),
+        }
+        mock_premade_backtest.return_value = (mock_results, pd.DataFrame(), None)
+
+        result = _run_backtest_worker(
+            {'window': 14}, sample_ohlcv_data, 'rsi', base_parameters, 'total_return_pct', lightweight=True
+        )
+
+        assert result['score'] == 15.5
+        assert result['results_df'] == {'total_return_pct': 15.5, 'num_trades': 4}
+
 
 # --- Test Main Optimizer Function ---
 
@@ -410,6 +428,21 @@ class TestPremadeOptimizerIntegration:
             assert best_params['window'] in [10, 14]
             assert len(all_results) <= 2  # At most 2 valid results
             
+    def test_lightweight_mode_matches_full_mode(self, sample_ohlcv_data, optimization_parameters, simple_param_grid):
+        """Test that lightweight mode finds the same best run and recomputes its full results"""
+        full_best, full_params, full_runs = premade_optimizer(
+            sample_ohlcv_data, 'rsi', simple_param_grid, optimization_parameters
+        )
+        light_best, light_params, light_runs = premade_optimizer(
+            sample_ohlcv_data, 'rsi', simple_param_grid, {**optimization_parameters, 'lightweight': True}
+        )
+
+        assert light_params == full_params
+        assert str(light_best) == str(full_best)
+        assert [run['score'] for run in light_runs] == [run['score'] for run in full_runs]
+        assert all('full_results' not in run for run in light_runs)
+        assert all('strategy' not in run['results_summary'] for run in light_runs)
+
     def test_parameter_extraction(self, sample_ohlcv_data, simple_param_grid):
         """Test that optimization parameters are correctly extracted"""
         params = {
@@ -444,3 +477,4 @@ class TestPremadeOptimizerIntegration:
             assert 'maximize' not in base_params
             assert 'parallel' not in base_params
             assert 'n_jobs' not in base_params
+            assert 'lightweight' not in base_params
@@ -0,0 +1,141 @@
+"""
+Equivalence tests for indicators whose recursions run on arrays.
+
+Each reference function below is the original bar-by-bar pandas loop of the
+indicator. The array implementations must reproduce them exactly on randomized
+OHLCV data, including data with missing bars and integer-valued prices.
+"""
+import pytest
+import pandas as pd
+import numpy as np
+from simple_trade.momentum import fis
+from simple_trade.trend import eac, mgd
+from simple_trade.volatility import hav
+
+
+@pytest.fixture(params=[0, 1, 2, 3])
+def random_ohlcv(request):
+    """Fixture providing randomized OHLCV data; odd seeds have missing bars, seed 2 has integer prices."""
+    seed = request.param
+    rng = np.random.default_rng(seed)
+    n = 300
+    close = 100 + np.cumsum(rng.normal(0, 2, n))
+    if seed == 2:
+        close = np.round(close)
+    high = close + rng.uniform(0, 3, n)
+    low = close - rng.uniform(0, 3, n)
+    open_price = low + (high - low) * rng.random(n)
+    df = pd.DataFrame({
+        'Open': open_price,
+        'High': high,
+        'Low': low,
+        'Close': close,
+        'Volume': rng.integers(1000, 10000, n).astype(float),
+    }, index=pd.date_range('2023-01-01', periods=n, freq='D'))
+    if seed % 2:
+        df.iloc[rng.integers(20, n, 8)] = np.nan
+    return df
+
+
+def reference_mgd(series, window):
+    """Original McGinley Dynamic loop."""
+    md = pd.Series(index=series.index, dtype=float)
+    md.iloc[:window] = series.iloc[:window].rolling(window=window).mean()
+    for i in range(window, len(series)):
+        if pd.notna(md.iloc[i-1]) and md.iloc[i-1] != 0:
+            ratio = np.clip(series.iloc[i] / md.iloc[i-1], 0.1, 10.0)
+            md.iloc[i] = md.iloc[i-1] + (series.iloc[i] - md.iloc[i-1]) / (window * (ratio ** 4))
+        else:
+            md.iloc[i] = series.iloc[i]
+    return md
+
+
+def reference_eac(series, alpha):
+    """Original Ehlers Adaptive Cyber Cycle loop."""
+    smooth = pd.Series(index=series.index, dtype=float)
+    smooth.iloc[0] = series.iloc[0]
+    for i in range(1, len(series)):
+        if i < 3:
+            smooth.iloc[i] = series.iloc[i]
+        else:
+            smooth.iloc[i] = (series.iloc[i] + 2*series.iloc[i-1] + 2*series.iloc[i-2] + series.iloc[i-3]) / 6.0
+    cycle = pd.Series(index=series.index, dtype=float)
+    cycle.iloc[:2] = 0.0
+    for i in range(2, len(series)):
+        if pd.notna(smooth.iloc[i]) and pd.notna(smooth.iloc[i-1]) and pd.notna(smooth.iloc[i-2]):
+            cycle.iloc[i] = ((1 - 0.5*alpha)**2 * (smooth.iloc[i] - 2*smooth.iloc[i-1] + smooth.iloc[i-2]) +
+                             2*(1 - alpha)*cycle.iloc[i-1] - (1 - alpha)**2 * cycle.iloc[i-2])
+        else:
+            cycle.iloc[i] = 0.0
+    return smooth - cycle
+
+
+def reference_fis(df, window):
+    """Original Fisher Transform loop."""
+    median_price = (df['High'] + df['Low']) / 2
+    highest_high = median_price.rolling(window=window).max()
+    lowest_low = median_price.rolling(window=window).min()
+    price_range = (highest_high - lowest_low).replace(0, pd.NA)
+    normalized = (2 * ((median_price - lowest_low) / price_range - 0.5)).clip(-0.999, 0.999)
+    fisher_values = pd.Series(index=df.index, dtype=float)
+    prev_value = 0.0
+    for idx in range(len(df)):
+        value = normalized.iat[idx]
+        if pd.isna(value):
+            fisher_values.iat[idx] = np.nan
+            continue
+        value = max(min(0.33 * value + 0.67 * prev_value, 0.999), -0.999)
+        fisher_values.iat[idx] = 0.5 * np.log((1 + value) / (1 - value))
+        prev_value = value
+    return fisher_values
+
+
+def reference_hav_atr(df, period):
+    """Original Heikin-Ashi volatility loop with the ATR method."""
+    ha_close = (df['Open'] + df['High'] + df['Low'] + df['Close']) / 4
+    ha_open = pd.Series(index=df.index, dtype=float)
+    ha_open.iloc[0] = (df['Open'].iloc[0] + df['Close'].iloc[0]) / 2
+    for i in range(1, len(df)):
+        ha_open.iloc[i] = (ha_open.iloc[i-1] + ha_close.iloc[i-1]) / 2
+    ha_high = pd.concat([df['High'], ha_open, ha_close], axis=1).max(axis=1)
+    ha_low = pd.concat([df['Low'], ha_open, ha_close], axis=1).min(axis=1)
+    prev_ha_close = ha_close.shift(1)
+    tr = pd.concat([ha_high - ha_low, (ha_high - prev_ha_close).abs(), (ha_low - prev_ha_close).abs()],
+                   axis=1).max(axis=1)
+    hav_values = pd.Series(index=df.index, dtype=float)
+    hav_values.iloc[period-1] = tr.iloc[:period].mean()
+    for i in range(period, len(df)):
+        hav_values.iloc[i] = ((hav_values.iloc[i-1] * (period-1)) + tr.iloc[i]) / period
+    return hav_values
+
+
+class TestRecursionEquivalence:
+    """Tests that the array recursions reproduce the original loops exactly."""
+
+    @pytest.mark.parametrize("window", [1, 10, 20])
+    def test_mgd(self, random_ohlcv, window):
+        """Test MGD against the reference loop."""
+        result, _ = mgd(random_ohlcv, parameters={'window': window})
+        expected = reference_mgd(random_ohlcv['Close'], window)
+        np.testing.assert_array_equal(result.to_numpy(), expected.to_numpy())
+
+    @pytest.mark.parametrize("alpha", [0.07, 0.5])
+    def test_eac(self, random_ohlcv, alpha):
+        """Test EAC against the reference loop."""
+        result, _ = eac(random_ohlcv, parameters={'alpha': alpha})
+        expected = reference_eac(random_ohlcv['Close'], alpha)
+        np.testing.assert_array_equal(result.to_numpy(), expected.to_numpy())
+
+    @pytest.mark.parametrize("window", [5, 9])
+    def test_fis(self, random_ohlcv, window):
+        """Test FIS against the reference loop."""
+        result, _ = fis(random_ohlcv, parameters={'window': window})
+        expected = reference_fis(random_ohlcv, window)
+        np.testing.assert_array_equal(result.to_numpy(), expected.to_numpy())
+
+    @pytest.mark.parametrize("period", [2, 14])
+    def test_hav_atr(self, random_ohlcv, period):
+        """Test HAV with the ATR method against the reference loop."""
+        result, _ = hav(random_ohlcv, parameters={'period': period, 'method': 'atr'})
+        expected = reference_hav_atr(random_ohlcv, period)
+        np.testing.assert_array_equal(result.to_numpy(), expected.to_numpy())
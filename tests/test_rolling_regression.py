@@ -0,0 +1,63 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from simple_trade.rolling_regression import REGRESSION_COLUMNS, rolling_regression
+
+
+@pytest.fixture
+def series():
+    """Fixture providing a random walk with a few missing values."""
+    rng = np.random.default_rng(5)
+    values = pd.Series(100 + np.cumsum(rng.normal(0, 1, 300)),
+                       index=pd.date_range('2022-01-01', periods=300, freq='D'))
+    values.iloc[[40, 200]] = np.nan
+    return values
+
+
+class TestRollingRegression:
+    """Tests for the shared rolling linear regression."""
+
+    def test_matches_polyfit(self, series):
+        """Test every window against np.polyfit and np.corrcoef, NaN where the window has a missing value."""
+        window = 12
+        result = rolling_regression(series, window)
+        t = np.arange(window)
+
+        def fit(x):
+            slope, intercept = np.polyfit(t, x, 1)
+            r2 = np.corrcoef(t, x)[0, 1] ** 2
+            return slope, intercept, intercept + slope * (window - 1), intercept + slope * window, r2
+
+        for i in range(window - 1, len(series)):
+            x = series.iloc[i - window + 1:i + 1].to_numpy()
+            if np.isnan(x).any():
+                assert result.iloc[i].isna().all()
+            else:
+                np.testing.assert_allclose(result.iloc[i].to_numpy(), fit(x), rtol=1e-9, atol=1e-9)
+
+    def test_shape_and_warmup(self, series):
+        """Test the output columns, index and the NaN warm-up rows."""
+        result = rolling_regression(series, 10)
+        assert list(result.columns) == REGRESSION_COLUMNS
+        assert result.index.equals(series.index)
+        assert result.iloc[:9].isna().all().all()
+
+    def test_perfect_line(self):
+        """Test slope, endpoint, forecast and r2 on an exact line."""
+        result = rolling_regression(pd.Series(np.arange(20) * 2.0 + 5), 5)
+        last = result.iloc[-1]
+        assert last['slope'] == pytest.approx(2.0)
+        assert last['endpoint'] == pytest.approx(43.0)
+        assert last['forecast'] == pytest.approx(45.0)
+        assert last['r2'] == pytest.approx(1.0)
+
+    def test_flat_window_has_no_r2(self):
+        """Test that a flat window has zero slope and an undefined r2."""
+        result = rolling_regression(pd.Series([3.0] * 6), 4)
+        assert result['slope'].iloc[-1] == 0.0
+        assert np.isnan(result['r2'].iloc[-1])
+
+    def test_window_below_two_is_nan(self, series):
+        """Test that a window below 2 gives only NaN."""
+        assert rolling_regression(series, 1).isna().all().all()
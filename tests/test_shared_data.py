@@ -0,0 +1,115 @@
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from simple_trade.shared_data import SharedFrame
+from simple_trade.optimize_custom_strategies import _run_single_backtest, custom_optimizer
+
+
+@pytest.fixture
+def ohlcv():
+    """Fixture providing OHLCV data with an extra non-numeric column."""
+    rng = np.random.default_rng(3)
+    dates = pd.date_range(start='2021-01-01', periods=500, freq='D', name='Date')
+    close = 100 + np.cumsum(rng.normal(0, 1, len(dates)))
+    return pd.DataFrame({
+        'Open': close + rng.normal(0, 0.5, len(dates)),
+        'High': close + 1.0,
+        'Low': close - 1.0,
+        'Close': close,
+        'Volume': rng.integers(1000, 5000, len(dates)),
+        'Symbol': ['ABC'] * len(dates),
+    }, index=dates)
+
+
+def _roundtrip(shared):
+    """Simulate the handoff to a worker process."""
+    return pickle.loads(pickle.dumps(shared))
+
+
+class TestSharedFrame:
+    """Tests for handing DataFrames to workers through SharedFrame."""
+
+    def test_roundtrip_matches_original(self, ohlcv):
+        """Test that the frame rebuilt in the publisher and in a worker equals the original."""
+        with SharedFrame(ohlcv) as shared:
+            pd.testing.assert_frame_equal(shared.to_frame(), ohlcv)
+            pd.testing.assert_frame_equal(_roundtrip(shared).to_frame(), ohlcv)
+
+    def test_pickle_excludes_shared_columns(self, ohlcv):
+        """Test that pickling the handle does not copy the shared column data."""
+        numeric = ohlcv.drop(columns='Symbol')
+        with SharedFrame(numeric) as shared:
+            assert len(pickle.dumps(shared)) < numeric.memory_usage().sum() / 10
+
+    def test_worker_views_are_zero_copy_and_read_only(self, ohlcv):
+        """Test that worker columns are read-only views of the shared memory block."""
+        with SharedFrame(ohlcv) as shared:
+            worker = _roundtrip(shared)
+            frame = worker.to_frame()
+            block = np.frombuffer(worker._shm.buf, dtype=np.uint8)
+            close = frame['Close'].to_numpy()
+            assert np.shares_memory(close, block)
+            assert not close.flags.writeable
+            del frame, close, block
+
+    def test_added_columns_do_not_leak_between_tasks(self, ohlcv):
+        """Test that columns added by one task are not seen by the next."""
+        with SharedFrame(ohlcv) as shared:
+            worker = _roundtrip(shared)
+            frame = worker.to_frame()
+            frame['Signal'] = 1
+            assert 'Signal' not in worker.to_frame().columns
+            del frame
+
+    @pytest.mark.parametrize('transform', [
+        lambda df: df.tz_localize('US/Eastern'),
+        lambda df: df.reset_index(drop=True),
+        lambda df: df.set_axis(df.index.strftime('%Y-%m-%d')),
+    ])
+    def test_index_types(self, ohlcv, transform):
+        """Test timezone-aware, range and string indexes."""
+        data = transform(ohlcv)
+        with SharedFrame(data) as shared:
+            pd.testing.assert_frame_equal(_roundtrip(shared).to_frame(), data)
+
+    def test_duplicate_columns_fall_back_to_pickling(self, ohlcv):
+        """Test that frames with duplicate column names are pickled instead of shared."""
+        data = pd.concat([ohlcv['Close'], ohlcv['Close']], axis=1)
+        with SharedFrame(data) as shared:
+            assert shared.name is None
+            pd.testing.assert_frame_equal(_roundtrip(shared).to_frame(), data)
+
+    def test_run_single_backtest_accepts_shared_frame(self, ohlcv):
+        """Test that _run_single_backtest gives the same result with a SharedFrame as with the DataFrame."""
+        def backtest(data, window):
+            return {'last_sma': data['Close'].rolling(window).mean().iloc[-1]}
+
+        expected = _run_single_backtest({'window': 10}, backtest, ohlcv, 'last_sma', {})
+        with SharedFrame(ohlcv) as shared:
+            result = _run_single_backtest({'window': 10}, backtest, _roundtrip(shared), 'last_sma', {})
+        assert result == expected
+
+    def test_run_single_backtest_reports_writes_to_shared_frame(self, ohlcv):
+        """Test that writing into shared data raises instead of scoring -inf."""
+        def backtest(data, value):
+            data.loc[data.index[0], 'Close'] = value
+            return {'score': value}
+
+        with SharedFrame(ohlcv) as shared:
+            with pytest.raises(ValueError, match="shared_memory=False"):
+                _run_single_backtest({'value': 1.0}, backtest, _roundtrip(shared), 'score', {})
+
+    def test_custom_optimizer_copies_data_by_default(self, ohlcv):
+        """Test that parallel custom_optimizer runs give backtests writable data unless shared_memory is set."""
+        def backtest(data, value):
+            data.loc[data.index[0], 'Close'] = value
+            return {'score': data['Close'].iloc[0]}
+
+        grid = {'value': [1.0, 3.0, 2.0]}
+        best_params, best_metric, _ = custom_optimizer(backtest, ohlcv, grid, 'score', parallel=True, n_jobs=2)
+        assert best_params == {'value': 3.0} and best_metric == 3.0
+        with pytest.raises(ValueError, match="shared_memory=False"):
+            custom_optimizer(backtest, ohlcv, grid, 'score', parallel=True, n_jobs=2, shared_memory=True)
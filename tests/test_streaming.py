@@ -0,0 +1,214 @@
+import json
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from simple_trade import (
+    AMAState, CCIState, EMAState, HMAState, MACState, PPOState, ROCState, RSIState, SMAState, STOState,
+    TEMState, TSIState, ULTState, WILState, WMAState, ama, cci, ema, hma, mac, ppo, roc, rsi, sma, sto,
+    tem, tsi, ult, wil, wma
+)
+from simple_trade.indicator_state import (
+    ExponentialMean, IndicatorState, RollingExtreme, RollingSum, RollingWeightedMean, divide
+)
+
+
+@pytest.fixture(params=['clean', 'missing', 'integer'])
+def price_data(request):
+    """Fixture providing random-walk OHLCV data, with missing bars or integer prices."""
+    rng = np.random.default_rng(21)
+    dates = pd.date_range(start='2022-01-01', periods=300, freq='D')
+    close = 100 + np.cumsum(rng.normal(0, 1, len(dates)))
+    if request.param == 'integer':
+        close = np.round(close)
+    df = pd.DataFrame({
+        'Open': close + rng.normal(0, 0.3, len(dates)),
+        'High': close + rng.uniform(0.1, 2, len(dates)),
+        'Low': close - rng.uniform(0.1, 2, len(dates)),
+        'Close': close,
+        'Volume': rng.integers(1000, 5000, len(dates)).astype(float),
+    }, index=dates)
+    if request.param == 'missing':
+        df.iloc[[0, 1, 40, 41, 150]] = np.nan
+    return df
+
+
+def stream(state, df):
+    """Feeds the rows of df one by one and collects the values."""
+    return [state.update(row) for _, row in df.iterrows()]
+
+
+def assert_stream_matches(state, df, expected, exact=True):
+    """Asserts that streaming df through state reproduces the batch result `expected`."""
+    values = stream(state, df)
+    if isinstance(expected, pd.DataFrame):
+        values = [[value[name] for name in expected.columns] for value in values]
+    values = np.array(values, dtype=float)
+    if exact:
+        np.testing.assert_array_equal(values, expected.to_numpy(dtype=float))
+    else:
+        np.testing.assert_allclose(values, expected.to_numpy(dtype=float), rtol=1e-12, atol=1e-12)
+
+
+class TestPrimitives:
+    """Tests for the running aggregates behind the streaming states."""
+
+    @pytest.mark.parametrize("window", [1, 2, 7])
+    def test_rolling_sum_matches_pandas(self, price_data, window):
+        """Test that RollingSum reproduces rolling().sum() and rolling().mean() exactly."""
+        values = price_data['Close']
+        rolling = RollingSum(window)
+        sums, means = [], []
+        for value in values.tolist():
+            rolling.update(value)
+            sums.append(rolling.sum())
+            means.append(rolling.mean())
+        np.testing.assert_array_equal(sums, values.rolling(window).sum())
+        np.testing.assert_array_equal(means, values.rolling(window).mean())
+
+    def test_exponential_mean_matches_pandas(self, price_data):
+        """Test that ExponentialMean reproduces ewm(adjust=False).mean() exactly."""
+        values = price_data['Close']
+        average = ExponentialMean.from_span(9)
+        result = [average.update(value) for value in values.tolist()]
+        np.testing.assert_array_equal(result, values.ewm(span=9, adjust=False).mean())
+
+    def test_rolling_weighted_mean_resyncs(self):
+        """Test that RollingWeightedMean does not drift on a long series with a large offset."""
+        values = np.random.default_rng(2).normal(1e6, 1, 1000)
+        mean = RollingWeightedMean(5)
+        result = [mean.update(value) for value in values]
+        weights = np.arange(1, 6)
+        assert result[-1] == pytest.approx(np.dot(values[-5:], weights) / weights.sum(), rel=1e-15)
+
+    def test_exponential_mean_min_periods(self, price_data):
+        """Test that ExponentialMean honors min_periods like ewm()."""
+        values = price_data['Close']
+        average = ExponentialMean.from_span(5, min_periods=8)
+        result = [average.update(value) for value in values.tolist()]
+        np.testing.assert_array_equal(result, values.ewm(span=5, adjust=False, min_periods=8).mean())
+
+    @pytest.mark.parametrize("window", [1, 5])
+    def test_rolling_extreme_matches_pandas(self, price_data, window):
+        """Test that RollingExtreme reproduces rolling().max() and rolling().min() exactly."""
+        values = price_data['Close']
+        highest, lowest = RollingExtreme(window), RollingExtreme(window, largest=False)
+        maxima = [highest.update(value) for value in values.tolist()]
+        minima = [lowest.update(value) for value in values.tolist()]
+        np.testing.assert_array_equal(maxima, values.rolling(window).max())
+        np.testing.assert_array_equal(minima, values.rolling(window).min())
+
+    def test_invalid_window(self):
+        """Test ValueError for a window below 1."""
+        with pytest.raises(ValueError):
+            RollingSum(0)
+        with pytest.raises(ValueError):
+            RollingWeightedMean(0)
+
+    def test_divide(self):
+        """Test that divide follows NumPy's float division by zero."""
+        assert divide(1.0, 0.0) == math.inf
+        assert divide(-1.0, 0.0) == -math.inf
+        assert math.isnan(divide(0.0, 0.0))
+        assert divide(1.0, 4.0) == 0.25
+
+
+class TestMovingAverageStates:
+    """Tests for the streaming moving average states."""
+
+    @pytest.mark.parametrize("state_cls,func,parameters", [
+        (SMAState, sma, {'window': 1}),
+        (SMAState, sma, {'window': 20}),
+        (EMAState, ema, {'period': 12}),
+        (TEMState, tem, {'window': 10}),
+        (AMAState, ama, {'window': 10, 'fast_period': 2, 'slow_period': 30}),
+        (AMAState, ama, {'window': 3, 'fast_period': 4, 'slow_period': 20}),
+    ])
+    def test_matches_batch_exactly(self, price_data, state_cls, func, parameters):
+        """Test that each state reproduces its batch function exactly."""
+        expected, names = func(price_data, parameters=parameters)
+        state = state_cls(parameters=parameters)
+        assert state.names == names
+        assert_stream_matches(state, price_data, expected)
+
+    @pytest.mark.parametrize("state_cls,func,window", [
+        (WMAState, wma, 1),
+        (WMAState, wma, 14),
+        (HMAState, hma, 9),
+        (HMAState, hma, 20),
+    ])
+    def test_weighted_matches_batch(self, price_data, state_cls, func, window):
+        """Test that the weighted states reproduce their batch functions up to rounding."""
+        expected, names = func(price_data, parameters={'window': window})
+        state = state_cls(parameters={'window': window})
+        assert state.names == names
+        assert_stream_matches(state, price_data, expected, exact=False)
+
+    def test_initialize_then_update(self, price_data):
+        """Test that a state initialized on history continues like the batch function."""
+        expected, _ = ema(price_data, parameters={'window': 10})
+        state = EMAState(parameters={'window': 10}).initialize(price_data.iloc[:200])
+        assert state.value == expected.iloc[199]
+        assert_stream_matches(state, price_data.iloc[200:], expected.iloc[200:])
+
+    def test_number_bars_and_custom_column(self, price_data):
+        """Test plain number bars and a close column mapped through `columns`."""
+        state = SMAState(parameters={'window': 5}, columns={'close_col': 'Price'})
+        values = [state.update(price) for price in price_data['Close'].tolist()]
+        np.testing.assert_array_equal(values, sma(price_data, parameters={'window': 5})[0])
+        assert state.update({'Price': 1.0}) == state.value
+
+
+class TestMomentumStates:
+    """Tests for the streaming momentum oscillator states."""
+
+    @pytest.mark.parametrize("state_cls,func,parameters", [
+        (RSIState, rsi, {'window': 14}),
+        (RSIState, rsi, {'period': 1}),
+        (STOState, sto, {}),
+        (STOState, sto, {'k_window': 5, 'd_window': 2, 'smooth_k': 1}),
+        (MACState, mac, {}),
+        (MACState, mac, {'window_fast': 5, 'period_slow': 9, 'window_signal': 4}),
+        (CCIState, cci, {'window': 20, 'constant': 0.02}),
+        (ROCState, roc, {'window': 12}),
+        (WILState, wil, {'window': 14}),
+        (TSIState, tsi, {'slow': 25, 'fast': 13}),
+        (PPOState, ppo, {}),
+        (ULTState, ult, {'short_window': 3, 'medium_window': 7, 'long_window': 14}),
+    ])
+    def test_matches_batch_exactly(self, price_data, state_cls, func, parameters):
+        """Test that each state reproduces its batch function exactly."""
+        expected, names = func(price_data, parameters=parameters)
+        state = state_cls(parameters=parameters)
+        assert state.names == names
+        assert_stream_matches(state, price_data, expected)
+
+
+class TestSerialization:
+    """Tests for saving and restoring streaming states."""
+
+    @pytest.mark.parametrize("state_cls,parameters", [
+        (SMAState, {'window': 10}),
+        (AMAState, {}),
+        (HMAState, {'window': 9}),
+        (RSIState, {}),
+        (STOState, {}),
+        (CCIState, {}),
+        (TSIState, {'slow': 10, 'fast': 5}),
+        (ULTState, {}),
+    ])
+    def test_json_round_trip_resumes(self, price_data, state_cls, parameters):
+        """Test that a state restored from JSON continues exactly like the original."""
+        state = state_cls(parameters=parameters).initialize(price_data.iloc[:150])
+        restored = IndicatorState.from_dict(json.loads(json.dumps(state.to_dict())))
+        assert type(restored) is state_cls
+        assert restored.names == state.names
+        rest = price_data.iloc[150:]
+        np.testing.assert_array_equal(pd.DataFrame(stream(restored, rest)), pd.DataFrame(stream(state, rest)))
+
+    def test_unknown_indicator(self):
+        """Test ValueError when restoring an unknown state class."""
+        with pytest.raises(ValueError, match="Unknown"):
+            IndicatorState.from_dict({'indicator': 'NopeState', 'state': {}})
@@ -119,6 +119,18 @@ class TestAroon:
                 valid_values = result_data[col].dropna()
                 assert (valid_values >= -100).all() and (valid_values <= 100).all()
 
+    def test_aroon_bars_since_extreme(self):
+        """Test Aroon against a hand-computed window, including ties and missing values"""
+        df = pd.DataFrame({
+            'High': [1.0, 5.0, 3.0, 5.0, np.nan, 2.0],
+            'Low': [0.0, 4.0, 1.0, 4.0, 1.0, np.nan]
+        })
+        result_data, _ = aro(df, parameters={'period': 3}, columns=None)
+        # Labels are swapped (see above): ARO_DOWN holds the bars since the highest high
+        # The first of tied extremes counts, and NaN is never an extreme
+        np.testing.assert_allclose(result_data['ARO_DOWN_3'], [np.nan, np.nan, 200 / 3, 100 / 3, 200 / 3, 100 / 3])
+        np.testing.assert_allclose(result_data['ARO_UP_3'], [np.nan, np.nan, 100 / 3, 200 / 3, 100 / 3, 200 / 3])
+
     def test_aroon_custom_period(self, sample_data):
         """Test Aroon with a custom period"""
         period = 10